@@ -0,0 +1,61 @@
+"""Benchmark /team_balance: the previous brute-force search vs the subset-sum DP balancer.
+
+Run from the repository root:
+
+    python benchmarks/team_balance_benchmark.py
+"""
+import random
+import sys
+from itertools import combinations
+from pathlib import Path
+from time import perf_counter
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.balance import balance_two_teams  # noqa: E402
+
+
+def brute_force_balance(level_list):
+    """The original /team_balance implementation: every combination, team B rebuilt with list.remove"""
+    team_size = len(level_list) // 2
+    min_diff = float('inf')
+    best_team_a = []
+    for combo in combinations(level_list, team_size):
+        team_a = list(combo)
+        team_b = list(level_list)
+        for lvl in team_a:
+            team_b.remove(lvl)
+        diff = abs(sum(team_a) - sum(team_b))
+        if diff < min_diff:
+            min_diff = diff
+            best_team_a = team_a
+    team_b = list(level_list)
+    for lvl in best_team_a:
+        team_b.remove(lvl)
+    return best_team_a, team_b
+
+
+def timed(func, levels):
+    started = perf_counter()
+    team_a, team_b = func(levels)
+    return perf_counter() - started, abs(sum(team_a) - sum(team_b))
+
+
+def main():
+    rng = random.Random(2024)
+    print(f"{'players':>7} | {'brute force':>12} | {'DP':>10} | {'diff (bf/dp)':>12}")
+    print("-" * 52)
+    for n in (8, 10, 12, 14, 16, 18, 20, 30, 40, 60, 100):
+        levels = [rng.randint(30, 60) for _ in range(n)]
+        dp_time, dp_diff = timed(balance_two_teams, levels)
+        if n <= 20:
+            bf_time, bf_diff = timed(brute_force_balance, levels)
+            assert bf_diff == dp_diff, (levels, bf_diff, dp_diff)
+            bf_text, diff_text = f"{bf_time * 1000:10.1f}ms", f"{bf_diff}/{dp_diff}"
+        else:
+            bf_text, diff_text = "skipped", f"-/{dp_diff}"
+        print(f"{n:>7} | {bf_text:>12} | {dp_time * 1000:8.2f}ms | {diff_text:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1601 @@
+"""Event scheduling, judge assignment and event management commands"""
+import discord
+from discord import app_commands
+from discord.ext import commands
+import os
+import logging
+from typing import Optional
+import re
+import datetime
+import asyncio
+import io
+from discord.ui import Button, View
+
+from config import BOT_OWNER_ID, CHANNEL_IDS, ORGANIZATION_NAME, ROLE_IDS
+from utils.bot import add_extension_commands, bot, remove_extension_commands, resolve_channel, resolve_event_member, resolve_member
+from utils.embed_utils import update_embed_title_with_green_circle, update_judge_field
+from utils.event_store import (
+    build_event_details_text,
+    check_judge_transfer,
+    claim_event_judge,
+    count_upcoming_unassigned,
+    edit_event_messages,
+    event_autocomplete,
+    event_search_index,
+    get_event_captain_id,
+    get_event_captain_name,
+    get_event_judge_id,
+    MESSAGE_ROLE_EDIT_NOTICE,
+    MESSAGE_ROLE_JUDGE_ASSIGNED,
+    MESSAGE_ROLE_SCHEDULE,
+    MESSAGE_ROLE_TICKET_SCHEDULE,
+    query_unassigned_events,
+    refresh_schedule_embed,
+    register_event_message,
+    reindex_event,
+    release_event_judge,
+    reminder_tasks,
+    save_scheduled_events,
+    SCHEDULE_MESSAGE_ROLES,
+    scheduled_events,
+    unindex_event,
+)
+from utils.judge_utils import (
+    build_judge_ping,
+    describe_availability_window,
+    judge_availability,
+    parse_clock,
+    propose_judge_assignments,
+    rank_match_slots,
+    set_judge_availability,
+    WEEKDAY_NAMES,
+)
+from utils.log_utils import bind_interaction_context, bind_log_context
+from utils.outbound import outbound_queue, PRIORITY_INTERACTIVE, PRIORITY_LOG
+from utils.permissions import (
+    has_event_create_permission,
+    has_event_result_permission,
+    has_organizer_permission,
+)
+from utils.ratings import parse_member_ids
+from utils.reminder_utils import schedule_ten_minute_reminder
+from utils.rename_queue import channel_rename_queue
+from utils.time_utils import calculate_time_difference
+
+log = logging.getLogger(__name__)
+
+def get_posters():
+    """The loaded posters extension (None if unloaded), looked up per call so /reload posters takes effect"""
+    return bot.extensions.get('cogs.posters')
+
+class TakeScheduleButton(discord.ui.DynamicItem[Button], template=r"take_schedule:(?P<event_id>[\w\-]+)"):
+    """Persistent Take Schedule button; the custom_id carries the event ID and state comes from scheduled_events.
+
+    Registered once with bot.add_dynamic_items, so buttons keep working after a restart and
+    no View or Member references are held per open schedule.
+    """
+
+    def __init__(self, event_id: str):
+        super().__init__(
+            Button(
+                label="Take Schedule",
+                style=discord.ButtonStyle.green,
+                emoji="📋",
+                custom_id=f"take_schedule:{event_id}"
+            )
+        )
+        self.event_id = event_id
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: Button, match):
+        return cls(match["event_id"])
+
+    async def callback(self, interaction: discord.Interaction):
+        bind_interaction_context(interaction)
+        bind_log_context(command="take_schedule", event_id=self.event_id)
+        
+        # Check if user has Judge or Organizer role, or is Bot Owner
+        if interaction.user.id != BOT_OWNER_ID:
+            organizer_role = discord.utils.get(interaction.user.roles, id=ROLE_IDS["organizer"])
+            judge_role = discord.utils.get(interaction.user.roles, id=ROLE_IDS["judge"])
+            if not (organizer_role or judge_role):
+                await interaction.response.send_message("❌ You need **Organizer** or **Judge** role to take this schedule.", ephemeral=True)
+                return
+        
+        # Claim before any await so concurrent clicks resolve in one step
+        claimed, error_message = claim_event_judge(self.event_id, interaction.user)
+        if not claimed:
+            await interaction.response.send_message(f"❌ {error_message}", ephemeral=True)
+            return
+        
+        # Until the schedule message shows the judge, any failure hands the schedule back
+        message_updated = False
+        try:
+            # Defer response to give us time to process
+            await interaction.response.defer(ephemeral=True)
+            
+            # Update the embed
+            embed = interaction.message.embeds[0]
+            embed.color = discord.Color.green()
+            
+            # Update title with green circle
+            title_update_success = update_embed_title_with_green_circle(embed)
+            if not title_update_success:
+                log.warning("Failed to update title for event %s", self.event_id)
+            
+            # Update judge field using safe utility function
+            if not update_judge_field(embed, interaction.user):
+                release_event_judge(self.event_id, interaction.user.id)
+                await interaction.followup.send("❌ Failed to update embed with judge information. The schedule is still open.", ephemeral=True)
+                return
+            
+            # Replace the button with a disabled "Taken by" button
+            try:
+                await outbound_queue.edit(interaction.message, embed=embed, view=build_take_schedule_view(self.event_id, taken_by=interaction.user))
+            except discord.Forbidden:
+                release_event_judge(self.event_id, interaction.user.id)
+                await interaction.followup.send("❌ Bot doesn't have permission to edit messages in this channel. The schedule is still open.", ephemeral=True)
+                return
+            except Exception as e:
+                log.error("Error editing message: %s", e)
+                release_event_judge(self.event_id, interaction.user.id)
+                await interaction.followup.send("❌ Failed to update message. The schedule is still open.", ephemeral=True)
+                return
+            message_updated = True
+            
+            # Send success message
+            await interaction.followup.send("✅ You have successfully taken this schedule!", ephemeral=True)
+            
+            # Send notification to the event channel
+            await send_judge_assignment_notification(self.event_id, interaction.user)
+            
+        except Exception as e:
+            log.exception("Error in take_schedule: %s", e)
+            if message_updated:
+                await interaction.followup.send(f"⚠️ You have taken this schedule, but a follow-up step failed: {str(e)}", ephemeral=True)
+                return
+            release_event_judge(self.event_id, interaction.user.id)
+            message = f"❌ An error occurred while taking the schedule: {str(e)}. The schedule is still open."
+            if interaction.response.is_done():
+                await interaction.followup.send(message, ephemeral=True)
+            else:
+                await interaction.response.send_message(message, ephemeral=True)
+
+def build_take_schedule_view(event_id: str, taken_by: Optional[discord.abc.User] = None) -> View:
+    """One-shot view holding the Take Schedule button, or a disabled "Taken by" button.
+
+    The view is stopped straight away so it is never stored per message; clicks are
+    routed through the registered TakeScheduleButton dynamic item instead.
+    """
+    view = View(timeout=None)
+    if taken_by:
+        view.add_item(Button(
+            label=f"Taken by {taken_by.display_name}"[:80],
+            style=discord.ButtonStyle.gray,
+            emoji="✅",
+            disabled=True,
+            custom_id=f"take_schedule_taken:{event_id}"
+        ))
+    else:
+        view.add_item(TakeScheduleButton(event_id))
+    view.stop()
+    return view
+
+async def migrate_legacy_schedule_views() -> int:
+    """Swap the pre-dynamic-button views on schedule messages for the persistent Take Schedule button.
+
+    Those views had random custom_ids that nothing handles after a restart. Each message is
+    edited once through its ID; the event is then marked so later startups skip it.
+    """
+    pending = [
+        event_id for event_id, data in scheduled_events.items()
+        if data.get('schedule_message_id') and not data.get('take_schedule_button') and not data.get('result_added')
+    ]
+
+    async def migrate(event_id: str):
+        data = scheduled_events[event_id]
+        channel = resolve_channel(data.get('schedule_channel_id'))
+        if channel is None:
+            return
+        judge = await resolve_event_member(getattr(channel, 'guild', None), data, 'judge')
+        view = build_take_schedule_view(event_id, taken_by=judge) if judge else build_take_schedule_view(event_id)
+        try:
+            await outbound_queue.edit(channel.get_partial_message(data['schedule_message_id']), PRIORITY_LOG, view=view)
+        except discord.NotFound:
+            pass  # Nothing left to migrate
+        data['take_schedule_button'] = True
+
+    results = await asyncio.gather(*(migrate(event_id) for event_id in pending), return_exceptions=True)
+    for event_id, result in zip(pending, results):
+        if isinstance(result, Exception):
+            log.error("Could not migrate schedule view for event %s: %s", event_id, result)
+    migrated = sum(1 for event_id in pending if scheduled_events.get(event_id, {}).get('take_schedule_button'))
+    if migrated:
+        save_scheduled_events()
+        log.info("Migrated %s legacy schedule view(s) to the persistent Take Schedule button", migrated)
+    return migrated
+
+async def send_judge_assignment_notification(event_id: str, judge: discord.Member):
+    """Send notification to the event channel when a judge is assigned and add judge to channel"""
+    event_data = scheduled_events.get(event_id)
+    event_channel = resolve_channel(event_data.get('channel_id')) if event_data else None
+    if not event_channel:
+        return
+    
+    try:
+        # Add judge to the event channel with proper permissions
+        await event_channel.set_permissions(
+            judge, 
+            read_messages=True, 
+            send_messages=True, 
+            view_channel=True,
+            embed_links=True,
+            attach_files=True,
+            read_message_history=True
+        )
+        
+        team1_mention = f"<@{get_event_captain_id(event_data, 1)}>"
+        team2_mention = f"<@{get_event_captain_id(event_data, 2)}>"
+        
+        # Create notification embed
+        embed = discord.Embed(
+            title="👨‍⚖️ Judge Assigned",
+            description=f"**{judge.display_name}** has been assigned as the judge for this match!",
+            color=discord.Color.green(),
+            timestamp=discord.utils.utcnow()
+        )
+        
+        embed.add_field(
+            name="📋 Match Details",
+            value=f"**Team 1:** {team1_mention}\n**Team 2:** {team2_mention}",
+            inline=False
+        )
+        
+        embed.add_field(
+            name="👨‍⚖️ Judge",
+            value=f"{judge.mention} `@{judge.name}`\n✅ **Added to channel**",
+            inline=True
+        )
+        
+        embed.set_footer(text=f"Powered by • {ORGANIZATION_NAME}")
+        
+        # Send notification to the event channel
+        notification = await outbound_queue.send(
+            event_channel,
+            content=f"🔔 {judge.mention} {team1_mention} {team2_mention}",
+            embed=embed
+        )
+        register_event_message(event_id, notification, MESSAGE_ROLE_JUDGE_ASSIGNED)
+        save_scheduled_events()
+        
+    except discord.Forbidden:
+        log.error("Bot doesn't have permission to add %s to channel %s", judge.display_name, event_channel.name)
+    except Exception as e:
+        log.error("Error sending judge assignment notification: %s", e)
+
+@app_commands.command(name="add_captain", description="Add two captains to a tournament match and rename the channel")
+@app_commands.describe(
+    round="Round of the tournament (R1-R10, Q, SF, Final)",
+    captain1="First captain/team for the match",
+    captain2="Second captain/team for the match",
+    bracket="Optional bracket identifier (e.g., A, B, Winner, Loser)"
+)
+@app_commands.choices(
+    round=[
+        app_commands.Choice(name="R1", value="R1"),
+        app_commands.Choice(name="R2", value="R2"),
+        app_commands.Choice(name="R3", value="R3"),
+        app_commands.Choice(name="R4", value="R4"),
+        app_commands.Choice(name="R5", value="R5"),
+        app_commands.Choice(name="R6", value="R6"),
+        app_commands.Choice(name="R7", value="R7"),
+        app_commands.Choice(name="R8", value="R8"),
+        app_commands.Choice(name="R9", value="R9"),
+        app_commands.Choice(name="R10", value="R10"),
+        app_commands.Choice(name="Qualifier", value="Q"),
+        app_commands.Choice(name="Semi Final", value="SF"),
+        app_commands.Choice(name="Final", value="Final")
+    ]
+)
+async def add_captain(interaction: discord.Interaction, round: str, captain1: discord.Member, captain2: discord.Member, bracket: str = None):
+    """Add two captains to a tournament match and rename the channel with tournament rules."""
+    try:
+        # Check permissions - only Bot Admin, Organizer, or Bot Op can add captains
+        bot_admin_role = discord.utils.get(interaction.user.roles, id=ROLE_IDS["bot_admin"])
+        organizer_role = discord.utils.get(interaction.user.roles, id=ROLE_IDS["organizer"])
+        bot_op_role = discord.utils.get(interaction.user.roles, id=ROLE_IDS["bot_op"])
+        
+        if not any([bot_admin_role, organizer_role, bot_op_role]):
+            await interaction.response.send_message("❌ You don't have permission to use this command. Only Bot Admin, Organizer, or Bot Op can add captains.", ephemeral=True)
+            return
+        
+        # Validate round parameter
+        valid_rounds = ["R1", "R2", "R3", "R4", "R5", "R6", "R7", "R8", "R9", "R10", "Q", "SF", "Final"]
+        if round not in valid_rounds:
+            await interaction.response.send_message("❌ Invalid round. Please select R1-R10, Q, SF, or Final.", ephemeral=True)
+            return
+        
+        # Get current channel
+        channel = interaction.channel
+        
+        # Create new channel name
+        if bracket:
+            new_name = f"{bracket}-{round.lower()}-{captain1.name.lower()}-vs-{captain2.name.lower()}"
+        else:
+            new_name = f"{round.lower()}-{captain1.name.lower()}-vs-{captain2.name.lower()}"
+        
+        # Remove special characters and spaces, replace with hyphens
+        new_name = re.sub(r'[^a-zA-Z0-9\-]', '-', new_name)
+        new_name = re.sub(r'-+', '-', new_name)  # Replace multiple hyphens with single hyphen
+        new_name = new_name.strip('-')  # Remove leading/trailing hyphens
+        
+        # Ensure channel name is within Discord's limits (100 characters max)
+        if len(new_name) > 100:
+            new_name = new_name[:100]
+        
+        # Rename the channel
+        try:
+            await channel.edit(name=new_name)
+            channel_rename_queue.note_rename(channel.id)
+            await interaction.response.send_message(f"✅ Channel renamed to `{new_name}`", ephemeral=True)
+        except discord.Forbidden:
+            await interaction.response.send_message("❌ I don't have permission to rename this channel.", ephemeral=True)
+            return
+        except discord.HTTPException as e:
+            await interaction.response.send_message(f"❌ Failed to rename channel: {e}", ephemeral=True)
+            return
+        
+        # Add both captains to the channel
+        try:
+            # Add captain 1 to the channel
+            await channel.set_permissions(captain1, 
+                                         view_channel=True,
+                                         send_messages=True)
+            
+            # Add captain 2 to the channel
+            await channel.set_permissions(captain2, 
+                                         view_channel=True,
+                                         send_messages=True)
+        except discord.Forbidden:
+            await interaction.followup.send("⚠️ Channel renamed but couldn't add captains - missing permissions.", ephemeral=True)
+        except discord.HTTPException as e:
+            await interaction.followup.send(f"⚠️ Channel renamed but error adding captains: {e}", ephemeral=True)
+        
+        # Send tournament rules message
+        rules_embed = discord.Embed(
+            title="🏆 Tournament Match Setup",
+            description="Please use this channel for all tournament discussions.",
+            color=0x00ff00
+        )
+        
+        # Add logo as thumbnail (top right)
+        try:
+            with open("animated_1-2.gif", "rb") as logo_file:
+                logo_data = io.BytesIO(logo_file.read())
+                logo_file = discord.File(logo_data, filename="logo.gif")
+                rules_embed.set_thumbnail(url="attachment://logo.gif")
+        except FileNotFoundError:
+            log.warning("animated_1-2.gif not found, skipping logo")
+        except Exception as e:
+            log.warning("Could not load logo: %s", e)
+        
+        rules_embed.add_field(
+            name="📋 Tournament Information",
+            value=(
+                "• Refer to https://discord.com/channels/1242231178208219256/1242280965775036466 for match schedules and pairings.\n"
+                "• Refer to https://discord.com/channels/1242231178208219256/1263470544574087169 for official updates.\n"
+                "• Refer to https://discord.com/channels/1242231178208219256/1349579975228919868 for tournament guidelines and regulations."
+            ),
+            inline=False
+        )
+        
+        rules_embed.add_field(
+            name="👥 Match Participants",
+            value=f"**Round:** {round}\n**Captain 1:** {captain1.mention}\n**Captain 2:** {captain2.mention}",
+            inline=False
+        )
+        
+        rules_embed.add_field(
+            name="🆘 Need Help?",
+            value="If you require any assistance, please ping <@&1242280627991220275> and they will be happy to assist.",
+            inline=False
+        )
+        
+        rules_embed.add_field(
+            name="🤝 Cooperation",
+            value="We appreciate your cooperation and wish you a competitive and fair tournament.",
+            inline=False
+        )
+        
+        rules_embed.set_footer(text=f"{ORGANIZATION_NAME} | {interaction.user.name} ✰—• • {datetime.datetime.now().strftime('%d-%m-%Y %H:%M')}")
+        
+        # Send the rules message with logo
+        try:
+            with open("animated_1-2.gif", "rb") as logo_file:
+                logo_data = io.BytesIO(logo_file.read())
+                logo_file = discord.File(logo_data, filename="logo.gif")
+                await outbound_queue.send(channel, embed=rules_embed, file=logo_file)
+        except FileNotFoundError:
+            log.warning("animated_1-2.gif not found, sending embed without logo")
+            await outbound_queue.send(channel, embed=rules_embed)
+        except Exception as e:
+            log.warning("Could not send logo, sending embed without logo: %s", e)
+            await outbound_queue.send(channel, embed=rules_embed)
+        
+        
+    except Exception as e:
+        await interaction.response.send_message(f"❌ An error occurred: {str(e)}", ephemeral=True)
+        log.exception("Error in add_captain command: %s", e)
+
+@app_commands.command(name="event", description="Event management commands")
+@app_commands.describe(
+    action="Select the event action to perform"
+)
+@app_commands.choices(
+    action=[
+        app_commands.Choice(name="create", value="create"),
+        app_commands.Choice(name="result", value="result")
+    ]
+)
+async def event(interaction: discord.Interaction, action: app_commands.Choice[str]):
+    """Base event command - this will be handled by subcommands"""
+    await interaction.response.send_message(f"Please use `/event {action.value}` with the appropriate parameters.", ephemeral=True)
+
+@app_commands.command(name="event-create", description="Creates an event (Bot Admin/Organizer/Bot Op only)")
+@app_commands.describe(
+    team_1_captain="Captain of team 1",
+    team_2_captain="Captain of team 2", 
+    hour="Hour of the event (0-23)",
+    minute="Minute of the event (0-59)",
+    date="Date of the event",
+    month="Month of the event",
+    round="Round label",
+    tournament="Tournament name (e.g. King of the Seas, Summer Cup, etc.)",
+    group="Group assignment (A-J) or Winner/Loser"
+)
+@app_commands.choices(
+    round=[
+        app_commands.Choice(name="R1", value="R1"),
+        app_commands.Choice(name="R2", value="R2"),
+        app_commands.Choice(name="R3", value="R3"),
+        app_commands.Choice(name="R4", value="R4"),
+        app_commands.Choice(name="R5", value="R5"),
+        app_commands.Choice(name="R6", value="R6"),
+        app_commands.Choice(name="R7", value="R7"),
+        app_commands.Choice(name="R8", value="R8"),
+        app_commands.Choice(name="R9", value="R9"),
+        app_commands.Choice(name="R10", value="R10"),
+        app_commands.Choice(name="Qualifier", value="Qualifier"),
+        app_commands.Choice(name="Semi Final", value="Semi Final"),
+        app_commands.Choice(name="Final", value="Final"),
+    ],
+    group=[
+        app_commands.Choice(name="Group A", value="Group A"),
+        app_commands.Choice(name="Group B", value="Group B"),
+        app_commands.Choice(name="Group C", value="Group C"),
+        app_commands.Choice(name="Group D", value="Group D"),
+        app_commands.Choice(name="Group E", value="Group E"),
+        app_commands.Choice(name="Group F", value="Group F"),
+        app_commands.Choice(name="Group G", value="Group G"),
+        app_commands.Choice(name="Group H", value="Group H"),
+        app_commands.Choice(name="Group I", value="Group I"),
+        app_commands.Choice(name="Group J", value="Group J"),
+        app_commands.Choice(name="Winner", value="Winner"),
+        app_commands.Choice(name="Loser", value="Loser"),
+    ]
+)
+async def event_create(
+    interaction: discord.Interaction,
+    team_1_captain: discord.Member,
+    team_2_captain: discord.Member,
+    hour: int,
+    minute: int,
+    date: int,
+    month: int,
+    round: app_commands.Choice[str],
+    tournament: str,
+    group: app_commands.Choice[str] = None
+):
+    """Creates an event with the specified parameters"""
+    
+    # Defer the response to give us more time for image processing
+    await interaction.response.defer(ephemeral=True)
+    
+    # Check permissions
+    if not has_event_create_permission(interaction):
+        await interaction.followup.send("❌ You need **Bot Admin**, **Organizer**, or **Bot Op** role to create events.", ephemeral=True)
+        return
+    
+    # Validate input parameters
+    if not (0 <= hour <= 23):
+        await interaction.followup.send("❌ Hour must be between 0 and 23", ephemeral=True)
+        return
+    
+    if not (1 <= date <= 31):
+        await interaction.followup.send("❌ Date must be between 1 and 31", ephemeral=True)
+        return
+
+    if not (1 <= month <= 12):
+        await interaction.followup.send("❌ Month must be between 1 and 12", ephemeral=True)
+        return
+            
+    if not (0 <= minute <= 59):
+        await interaction.followup.send("❌ Minute must be between 0 and 59", ephemeral=True)
+        return
+
+    # Generate unique event ID
+    event_id = f"event_{int(datetime.datetime.now().timestamp())}"
+    
+    # Create event datetime
+    current_year = datetime.datetime.now().year
+    event_datetime = datetime.datetime(current_year, month, date, hour, minute)
+    
+    # Calculate time differences and format times
+    time_info = calculate_time_difference(event_datetime)
+    
+    # Resolve round label from choice
+    round_label = round.value if isinstance(round, app_commands.Choice) else str(round)
+    
+    # Resolve group label from choice
+    group_label = group.value if group and isinstance(group, app_commands.Choice) else None
+    
+    # Store event data for reminders
+    scheduled_events[event_id] = {
+        'title': f"Round {round_label} Match",
+        'datetime': event_datetime,
+        'time_str': time_info['utc_time'],
+        'date_str': f"{date:02d}/{month:02d}",
+        'round': round_label,
+        'group': group_label,
+        'minutes_left': time_info['minutes_remaining'],
+        'tournament': tournament,
+        'judge': None,
+        'channel_id': interaction.channel.id,
+        'team1_captain': team_1_captain,
+        'team2_captain': team_2_captain,
+        'team1_name': team_1_captain.display_name,
+        'team2_name': team_2_captain.display_name
+    }
+    reindex_event(event_id)
+    
+    # Save events to file
+    save_scheduled_events()
+    
+    # Get random template image and create poster
+    posters = get_posters()
+    template_image = posters.get_random_template() if posters else None
+    poster_image = None
+    
+    if template_image:
+        try:
+            # Create poster with text overlays
+            poster_image = posters.create_event_poster(
+                template_image, 
+                round_label, 
+                team_1_captain.name, 
+                team_2_captain.name, 
+                time_info['utc_time_simple'],
+                f"{date:02d}/{month:02d}/{current_year}",
+                tournament
+            )
+            if poster_image:
+                # Keep poster path for later cleanup/deletion
+                scheduled_events[event_id]['poster_path'] = poster_image
+                save_scheduled_events()
+        except Exception as e:
+            log.error("Error creating poster: %s", e)
+            poster_image = None
+    else:
+        log.warning("No template images found in Templates folder")
+    
+    # Create event embed with new format
+    embed = discord.Embed(
+        title="Schedule",
+        description=f"🗓️ {team_1_captain.display_name} VS {team_2_captain.display_name}",
+        color=discord.Color.blue(),
+        timestamp=discord.utils.utcnow()
+    )
+    
+    # Tournament and Time Information
+    embed.add_field(
+        name="📋 Event Details", 
+        value=build_event_details_text(scheduled_events[event_id]),
+        inline=False
+    )
+    
+    # Add spacing
+    embed.add_field(name="\u200b", value="\u200b", inline=False)
+    
+    # Captains Section
+    captains_text = f"**Captains**\n"
+    captains_text += f"▪ Team1 Captain: {team_1_captain.mention} @{team_1_captain.name}\n"
+    captains_text += f"▪ Team2 Captain: {team_2_captain.mention} @{team_2_captain.name}"
+    embed.add_field(name="👑 Team Captains", value=captains_text, inline=False)
+    
+    
+    # Add spacing
+    embed.add_field(name="\u200b", value="\u200b", inline=False)
+    
+    embed.add_field(name="👤 Created By", value=interaction.user.mention, inline=False)
+    
+    # Add poster image if available
+    if poster_image:
+        try:
+            with open(poster_image, 'rb') as f:
+                file = discord.File(f, filename="event_poster.png")
+                embed.set_image(url="attachment://event_poster.png")
+        except Exception as e:
+            log.error("Error loading poster image: %s", e)
+    
+    embed.set_footer(text=f"Powered by • {ORGANIZATION_NAME}")
+    
+    # Create Take Schedule button
+    take_schedule_view = build_take_schedule_view(event_id)
+    
+    # Send confirmation to user
+    await interaction.followup.send("✅ Event created and posted to both channels! Reminder will ping captains 10 minutes before start.", ephemeral=True)
+    
+    # Post in Take-Schedule channel (with button)
+    try:
+        schedule_channel = interaction.guild.get_channel(CHANNEL_IDS["take_schedule"])
+        if schedule_channel:
+            judge_ping = build_judge_ping(scheduled_events[event_id])
+            if poster_image:
+                with open(poster_image, 'rb') as f:
+                    file = discord.File(f, filename="event_poster.png")
+                    schedule_message = await outbound_queue.send(schedule_channel, content=judge_ping, embed=embed, file=file, view=take_schedule_view)
+            else:
+                schedule_message = await outbound_queue.send(schedule_channel, content=judge_ping, embed=embed, view=take_schedule_view)
+            
+            # Store the message ID for later deletion
+            scheduled_events[event_id]['schedule_message_id'] = schedule_message.id
+            scheduled_events[event_id]['schedule_channel_id'] = schedule_channel.id
+            scheduled_events[event_id]['take_schedule_button'] = True
+            register_event_message(event_id, schedule_message, MESSAGE_ROLE_SCHEDULE)
+        else:
+            await interaction.followup.send("⚠️ Could not find Take-Schedule channel.", ephemeral=True)
+    except Exception as e:
+        await interaction.followup.send(f"⚠️ Could not post in Take-Schedule channel: {e}", ephemeral=True)
+    
+    # Post in the channel where command was used (without button)
+    try:
+        if poster_image:
+            with open(poster_image, 'rb') as f:
+                file = discord.File(f, filename="event_poster.png")
+                ticket_message = await outbound_queue.send(interaction.channel, embed=embed, file=file)
+        else:
+            ticket_message = await outbound_queue.send(interaction.channel, embed=embed)
+        register_event_message(event_id, ticket_message, MESSAGE_ROLE_TICKET_SCHEDULE)
+        save_scheduled_events()
+
+        # Schedule the 10-minute reminder
+        await schedule_ten_minute_reminder(event_id, team_1_captain, team_2_captain, None, interaction.channel, event_datetime)
+        
+    except Exception as e:
+        await interaction.followup.send(f"⚠️ Could not post in current channel: {e}", ephemeral=True)
+
+@app_commands.command(name="time", description="Suggest the best free match time from 30-min slots (12:00-17:00 UTC)")
+@app_commands.describe(
+    captain1="First captain; slots where they already play are skipped (optional)",
+    captain2="Second captain; slots where they already play are skipped (optional)",
+    date="Match date as DD/MM (default: today, or tomorrow once today's slots have passed)"
+)
+async def time(interaction: discord.Interaction, captain1: discord.Member = None, captain2: discord.Member = None, date: str = None):
+    """Suggest free 30-minute slots between 12:00 and 17:00 UTC, ranked by free judges and existing matches."""
+    
+    today = datetime.datetime.utcnow().date()
+    if date:
+        try:
+            day, month = (int(part) for part in date.split("/")[:2])
+            match_day = datetime.date(today.year, month, day)
+        except ValueError:
+            await interaction.response.send_message("❌ Invalid date. Use DD/MM, e.g. 24/10.", ephemeral=True)
+            return
+        if match_day < today:
+            try:
+                match_day = match_day.replace(year=today.year + 1)
+            except ValueError:
+                # 29/02 has passed this year and next year is not a leap year
+                await interaction.response.send_message(f"❌ {date} does not occur next year. Pick another date.", ephemeral=True)
+                return
+    else:
+        match_day = today
+    
+    captain_ids = tuple(member.id for member in (captain1, captain2) if member)
+    ranked = rank_match_slots(match_day, captain_ids)
+    if not ranked and not date:
+        match_day = today + datetime.timedelta(days=1)
+        ranked = rank_match_slots(match_day, captain_ids)
+    
+    if not ranked:
+        await interaction.response.send_message(f"❌ No free slots on {match_day.strftime('%d/%m')} for these captains.", ephemeral=True)
+        return
+    
+    best = ranked[0]
+    chosen_time = f"{best['start'].strftime('%H:%M')} UTC"
+    
+    embed = discord.Embed(
+        title="⏰ Match Time (30‑min slots)",
+        description=f"**Suggested match time:** {chosen_time} on {match_day.strftime('%d/%m')}",
+        color=discord.Color.blue(),
+        timestamp=discord.utils.utcnow()
+    )
+    
+    if captain_ids:
+        embed.add_field(name="👑 Captains", value=" vs ".join(f"<@{cid}>" for cid in captain_ids), inline=False)
+    
+    options = "\n".join(
+        f"`{slot['start'].strftime('%H:%M')}` • {slot['free_judges']} judge(s) free • {slot['matches']} match(es) booked"
+        for slot in ranked[:5]
+    )
+    embed.add_field(name="🕒 Best Slots", value=options, inline=False)
+    embed.add_field(
+        name="Range",
+        value="From 12:00 to 17:00 UTC (every 30 minutes); slots where a captain already plays are skipped",
+        inline=False
+    )
+                    
+    embed.set_footer(text=f"Powered by • {ORGANIZATION_NAME}")
+    
+    await interaction.response.send_message(embed=embed)
+
+
+UNASSIGNED_PAGE_SIZE = 5
+
+class UnassignedEventsView(View):
+    """Paginated browser over the unassigned event index"""
+
+    def __init__(self, owner_id: int, guild_id: Optional[int], filters: dict):
+        super().__init__(timeout=300)
+        self.owner_id = owner_id
+        self.guild_id = guild_id
+        self.filters = filters
+        self.page_cursors = [None]  # Cursor each visited page starts after
+        self.page_offsets = [0]     # Entries listed before each visited page, for numbering
+        self.has_more = False
+        self._last_key = None
+        self._last_offset = 0
+
+    def build_embed(self) -> discord.Embed:
+        """Render the current page; only the entries on this page are touched"""
+        entries, self.has_more = query_unassigned_events(self.page_cursors[-1], UNASSIGNED_PAGE_SIZE, **self.filters)
+        page_number = len(self.page_cursors)
+
+        embed = discord.Embed(
+            title="📝 Unassigned Events",
+            description="Events without a judge. Use the message link to take the schedule.",
+            color=discord.Color.orange(),
+            timestamp=discord.utils.utcnow()
+        )
+
+        active_filters = [f"{field.title()}: {value}" for field, value in self.filters.items() if value]
+        if active_filters:
+            embed.description += f"\n**Filters:** {' • '.join(active_filters)}"
+
+        lines = []
+        shown = []
+        used = 0
+        offset = self.page_offsets[-1]
+        for idx, (_, ev_id) in enumerate(entries, start=offset + 1):
+            data = scheduled_events.get(ev_id, {})
+            round_label = data.get('round', 'Round')
+            date_str = data.get('date_str', 'N/A')
+            time_str = data.get('time_str', 'N/A')
+            ch_id = data.get('schedule_channel_id') or data.get('channel_id')
+            msg_id = data.get('schedule_message_id')
+            team1_name = get_event_captain_name(data, 1)[:40]
+            team2_name = get_event_captain_name(data, 2)[:40]
+
+            line = f"{idx}. {team1_name} vs {team2_name} • {round_label} • {time_str} • {date_str}"
+            if self.guild_id and ch_id and msg_id:
+                line += f"\n↪ https://discord.com/channels/{self.guild_id}/{ch_id}/{msg_id}"
+            # Whole entries only, so a link is never cut; the rest move to the next page
+            cost = len(line) + (2 if lines else 0)
+            if used + cost > 1024:
+                self.has_more = True
+                break
+            used += cost
+            lines.append(line)
+            shown.append(entries[idx - offset - 1])
+
+        if not active_filters:
+            field_name = f"Available ({count_upcoming_unassigned()}) • Page {page_number}"
+        else:
+            field_name = f"Matching events • Page {page_number}"
+
+        embed.add_field(
+            name=field_name,
+            value="\n\n".join(lines) if lines else "No more events.",
+            inline=False
+        )
+        embed.set_footer(text="Use the link to open the original schedule and press Take Schedule.")
+
+        self.previous_page.disabled = page_number == 1
+        self.next_page.disabled = not self.has_more
+        self._last_key = shown[-1] if shown else None
+        self._last_offset = offset + len(shown)
+        return embed
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.owner_id:
+            await interaction.response.send_message("❌ Run `/unassigned_events` to browse events yourself.", ephemeral=True)
+            return False
+        return True
+
+    @discord.ui.button(label="Previous", style=discord.ButtonStyle.secondary, emoji="◀️")
+    async def previous_page(self, interaction: discord.Interaction, button: Button):
+        if len(self.page_cursors) > 1:
+            self.page_cursors.pop()
+            self.page_offsets.pop()
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+
+    @discord.ui.button(label="Next", style=discord.ButtonStyle.secondary, emoji="▶️")
+    async def next_page(self, interaction: discord.Interaction, button: Button):
+        if self.has_more and self._last_key:
+            self.page_cursors.append(self._last_key)
+            self.page_offsets.append(self._last_offset)
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+
+@app_commands.command(name="unassigned_events", description="List events without a judge assigned (Bot Owner/Judges/Organizers)")
+@app_commands.describe(
+    tournament="Only show events from this tournament (optional)",
+    round="Only show events from this round (optional)",
+    group="Only show events from this group (optional)"
+)
+@app_commands.choices(
+    round=[
+        app_commands.Choice(name="R1", value="R1"),
+        app_commands.Choice(name="R2", value="R2"),
+        app_commands.Choice(name="R3", value="R3"),
+        app_commands.Choice(name="R4", value="R4"),
+        app_commands.Choice(name="R5", value="R5"),
+        app_commands.Choice(name="R6", value="R6"),
+        app_commands.Choice(name="R7", value="R7"),
+        app_commands.Choice(name="R8", value="R8"),
+        app_commands.Choice(name="R9", value="R9"),
+        app_commands.Choice(name="R10", value="R10"),
+        app_commands.Choice(name="Qualifier", value="Qualifier"),
+        app_commands.Choice(name="Semi Final", value="Semi Final"),
+        app_commands.Choice(name="Final", value="Final"),
+    ],
+    group=[
+        app_commands.Choice(name="Group A", value="Group A"),
+        app_commands.Choice(name="Group B", value="Group B"),
+        app_commands.Choice(name="Group C", value="Group C"),
+        app_commands.Choice(name="Group D", value="Group D"),
+        app_commands.Choice(name="Group E", value="Group E"),
+        app_commands.Choice(name="Group F", value="Group F"),
+        app_commands.Choice(name="Group G", value="Group G"),
+        app_commands.Choice(name="Group H", value="Group H"),
+        app_commands.Choice(name="Group I", value="Group I"),
+        app_commands.Choice(name="Group J", value="Group J"),
+        app_commands.Choice(name="Winner", value="Winner"),
+        app_commands.Choice(name="Loser", value="Loser"),
+    ]
+)
+async def unassigned_events(
+    interaction: discord.Interaction,
+    tournament: str = None,
+    round: app_commands.Choice[str] = None,
+    group: app_commands.Choice[str] = None
+):
+    """Browse upcoming scheduled events that do not currently have a judge assigned."""
+    try:
+        # Allow Bot Owner, Organizer, Bot Op, and Judges to view
+        if interaction.user.id != BOT_OWNER_ID:
+            organizer_role = discord.utils.get(interaction.user.roles, id=ROLE_IDS["organizer"]) if interaction.user else None
+            bot_op_role = discord.utils.get(interaction.user.roles, id=ROLE_IDS["bot_op"]) if interaction.user else None
+            judge_role = discord.utils.get(interaction.user.roles, id=ROLE_IDS["judge"]) if interaction.user else None
+
+            if not (organizer_role or bot_op_role or judge_role):
+                await interaction.response.send_message("❌ You need **Bot Owner**, **Organizer** or **Judge** role to view unassigned events.", ephemeral=True)
+                return
+
+        filters = {
+            'tournament': tournament,
+            'round': round.value if round else None,
+            'group': group.value if group else None
+        }
+
+        # If none, inform
+        if not any(filters.values()) and count_upcoming_unassigned() == 0:
+            await interaction.response.send_message("✅ All events currently have a judge assigned.", ephemeral=True)
+            return
+
+        view = UnassignedEventsView(interaction.user.id, interaction.guild.id if interaction.guild else None, filters)
+        await interaction.response.send_message(embed=view.build_embed(), view=view, ephemeral=True)
+    except Exception as e:
+        log.exception("Error in unassigned_events: %s", e)
+        try:
+            await interaction.response.send_message("❌ An error occurred while fetching unassigned events.", ephemeral=True)
+        except Exception:
+            pass
+
+async def apply_judge_assignment(event_id: str, judge: discord.Member) -> tuple[bool, str]:
+    """Claim an event for a judge and update its Take Schedule post as if the judge had pressed the button"""
+    claimed, error_message = claim_event_judge(event_id, judge)
+    if not claimed:
+        return False, error_message
+
+    def mark_taken(embed):
+        embed.color = discord.Color.green()
+        update_embed_title_with_green_circle(embed)
+        return update_judge_field(embed, judge)
+
+    await edit_event_messages(event_id, (MESSAGE_ROLE_SCHEDULE,), mark_taken, view=build_take_schedule_view(event_id, taken_by=judge))
+    await send_judge_assignment_notification(event_id, judge)
+    return True, ""
+
+@app_commands.command(name="availability", description="Register when you are available to judge (Judges/Organizers)")
+@app_commands.describe(
+    action="What to do",
+    start="Start time in UTC, HH:MM (for add)",
+    end="End time in UTC, HH:MM (for add; earlier than start runs past midnight)",
+    weekday="Repeat every week on this day (for add)",
+    date="One-off date as DD/MM (for add, instead of weekday)",
+    entry="Entry number from the list (for remove)"
+)
+@app_commands.choices(
+    action=[
+        app_commands.Choice(name="Add", value="add"),
+        app_commands.Choice(name="List", value="list"),
+        app_commands.Choice(name="Remove", value="remove"),
+        app_commands.Choice(name="Clear", value="clear"),
+    ],
+    weekday=[app_commands.Choice(name=name, value=index) for index, name in enumerate(WEEKDAY_NAMES)]
+)
+async def availability(
+    interaction: discord.Interaction,
+    action: app_commands.Choice[str],
+    start: str = None,
+    end: str = None,
+    weekday: app_commands.Choice[int] = None,
+    date: str = None,
+    entry: int = None
+):
+    """Manage your recurring or one-off judging availability."""
+    if not (has_organizer_permission(interaction) or has_event_result_permission(interaction)):
+        await interaction.response.send_message("❌ You need **Organizer** or **Judge** role to set availability.", ephemeral=True)
+        return
+
+    judge_id = interaction.user.id
+    windows = list(judge_availability.get(judge_id, []))
+
+    if action.value == "add":
+        try:
+            if not start or not end:
+                raise ValueError("Please provide both start and end times.")
+            window = {'start': parse_clock(start), 'end': parse_clock(end)}
+            if window['start'] == window['end']:
+                raise ValueError("Start and end times must differ.")
+            if date:
+                today = datetime.datetime.utcnow().date()
+                try:
+                    day, month = (int(part) for part in date.split("/")[:2])
+                    window_date = datetime.date(today.year, month, day)
+                except ValueError:
+                    raise ValueError("Invalid date. Use DD/MM, e.g. 24/10.")
+                if window_date < today:
+                    try:
+                        window_date = window_date.replace(year=today.year + 1)
+                    except ValueError:
+                        # 29/02 has passed this year and next year is not a leap year
+                        raise ValueError(f"{date} does not occur next year. Pick another date.")
+                window.update(kind='once', date=window_date.isoformat())
+            elif weekday is not None:
+                window.update(kind='weekly', weekday=weekday.value)
+            else:
+                raise ValueError("Pick a weekday for weekly availability or a date (DD/MM) for a one-off window.")
+        except ValueError as e:
+            await interaction.response.send_message(f"❌ {e}", ephemeral=True)
+            return
+        set_judge_availability(judge_id, windows + [window])
+        await interaction.response.send_message(f"✅ Added: {describe_availability_window(window)}", ephemeral=True)
+        return
+
+    if action.value == "remove":
+        if entry is None or not 1 <= entry <= len(windows):
+            await interaction.response.send_message("❌ Pick an entry number from `/availability list`.", ephemeral=True)
+            return
+        removed = windows.pop(entry - 1)
+        set_judge_availability(judge_id, windows)
+        await interaction.response.send_message(f"✅ Removed: {describe_availability_window(removed)}", ephemeral=True)
+        return
+
+    if action.value == "clear":
+        set_judge_availability(judge_id, [])
+        await interaction.response.send_message("✅ Cleared all of your availability.", ephemeral=True)
+        return
+
+    lines = [f"**{number}.** {describe_availability_window(window)}" for number, window in enumerate(windows, start=1)]
+    embed = discord.Embed(
+        title="🗓️ Your Availability",
+        description="\n".join(lines) if lines else "No availability registered. New events will ping the whole Judge role.",
+        color=discord.Color.blue()
+    )
+    embed.set_footer(text="Event pings go only to judges whose availability covers the match")
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+@app_commands.command(name="judge_autoassign", description="Propose or apply judge assignments for unassigned events (Organizer only)")
+@app_commands.describe(
+    mode="Propose a plan only, or apply it",
+    hours="Only events starting within this many hours (default 48)",
+    judges="Judges to use, as mentions (defaults to everyone with the Judge role)",
+    tournament="Only events from this tournament (optional)"
+)
+@app_commands.choices(mode=[
+    app_commands.Choice(name="Propose", value="propose"),
+    app_commands.Choice(name="Apply", value="apply"),
+])
+async def judge_autoassign(
+    interaction: discord.Interaction,
+    mode: app_commands.Choice[str],
+    hours: app_commands.Range[int, 1, 336] = 48,
+    judges: str = None,
+    tournament: str = None
+):
+    """Spread unassigned events across judges who are available, by load, without double-booking anyone."""
+    if not has_organizer_permission(interaction):
+        await interaction.response.send_message("❌ You need **Organizer** role to auto-assign judges.", ephemeral=True)
+        return
+
+    if judges:
+        judge_ids = list(dict.fromkeys(parse_member_ids(judges)))
+    else:
+        judge_role = interaction.guild.get_role(ROLE_IDS["judge"]) if interaction.guild else None
+        judge_ids = [member.id for member in judge_role.members if not member.bot] if judge_role else []
+    if not judge_ids:
+        await interaction.response.send_message("❌ No judges found. Mention the judges to use (the member cache may be disabled).", ephemeral=True)
+        return
+
+    until = datetime.datetime.utcnow() + datetime.timedelta(hours=hours)
+    plan, unplanned = propose_judge_assignments(judge_ids, until, tournament=tournament)
+    if not plan and not unplanned:
+        await interaction.response.send_message(f"✅ No unassigned events in the next {hours} hours.", ephemeral=True)
+        return
+
+    await interaction.response.defer(ephemeral=True)
+
+    results = []
+    if mode.value == "apply":
+        for event_id, judge_id in plan:
+            judge = await resolve_member(interaction.guild, judge_id)
+            if judge is None:
+                results.append((event_id, judge_id, "member not found"))
+                continue
+            applied, error_message = await apply_judge_assignment(event_id, judge)
+            results.append((event_id, judge_id, None if applied else error_message))
+    else:
+        results = [(event_id, judge_id, None) for event_id, judge_id in plan]
+
+    lines = []
+    for event_id, judge_id, error_message in results:
+        data = scheduled_events.get(event_id, {})
+        line = (
+            f"{'❌' if error_message else '•'} {get_event_captain_name(data, 1)[:30]} vs {get_event_captain_name(data, 2)[:30]} • "
+            f"{data.get('round', 'Round')} • {data.get('time_str', 'N/A')} {data.get('date_str', '')} → <@{judge_id}>"
+        )
+        if error_message:
+            line += f" ({error_message})"
+        lines.append(line)
+    for event_id in unplanned:
+        data = scheduled_events.get(event_id, {})
+        lines.append(
+            f"⚠️ {get_event_captain_name(data, 1)[:30]} vs {get_event_captain_name(data, 2)[:30]} • "
+            f"{data.get('time_str', 'N/A')} {data.get('date_str', '')} → no available judge"
+        )
+
+    applied_count = sum(1 for _, _, error_message in results if not error_message)
+    embed = discord.Embed(
+        title="🧑‍⚖️ Judge Auto-Assign" + (" • Applied" if mode.value == "apply" else " • Proposal"),
+        description="\n".join(lines)[:4000],
+        color=discord.Color.green() if mode.value == "apply" else discord.Color.blue(),
+        timestamp=discord.utils.utcnow()
+    )
+    summary = f"{applied_count} assigned" if mode.value == "apply" else f"{len(plan)} proposed"
+    embed.set_footer(text=f"{summary} • {len(unplanned)} without an available judge • {len(judge_ids)} judges • next {hours}h")
+    await interaction.followup.send(embed=embed, ephemeral=True)
+
+async def delete_scheduled_event(guild: discord.Guild, event_id: str) -> tuple[dict, bool]:
+    """Delete an event with its reminder, judge assignment, schedule message and poster.
+
+    Returns the deleted event data and whether the schedule message was deleted.
+    """
+    event_data = scheduled_events[event_id]
+    
+    # Cancel any scheduled reminders
+    if event_id in reminder_tasks:
+        reminder_tasks[event_id].cancel()
+        del reminder_tasks[event_id]
+    
+    # Delete the original schedule message if it exists
+    deleted_message = False
+    if 'schedule_message_id' in event_data and 'schedule_channel_id' in event_data:
+        try:
+            schedule_channel = resolve_channel(event_data['schedule_channel_id'], guild.id)
+            if schedule_channel:
+                schedule_message = schedule_channel.get_partial_message(event_data['schedule_message_id'])
+                await outbound_queue.delete(schedule_message, PRIORITY_INTERACTIVE)
+                deleted_message = True
+        except discord.NotFound:
+            pass  # Message already deleted
+        except Exception as e:
+            log.error("Error deleting schedule message: %s", e)
+    
+    # Clean up any temporary poster files
+    if 'poster_path' in event_data:
+        try:
+            if os.path.exists(event_data['poster_path']):
+                os.remove(event_data['poster_path'])
+        except Exception as e:
+            log.error("Error deleting poster file: %s", e)
+    
+    # Remove from scheduled events
+    unindex_event(event_id)
+    del scheduled_events[event_id]
+    
+    # Save events to file
+    save_scheduled_events()
+    return event_data, deleted_message
+
+def build_event_deleted_embed(event_data: dict, deleted_message: bool) -> discord.Embed:
+    """Confirmation embed shown after an event is deleted"""
+    embed = discord.Embed(
+        title="🗑️ Event Deleted",
+        description=f"Event has been successfully deleted.",
+        color=discord.Color.red(),
+        timestamp=discord.utils.utcnow()
+    )
+    
+    embed.add_field(
+        name="📋 Deleted Event Details",
+        value=f"**Title:** {event_data.get('title', 'N/A')}\n**Round:** {event_data.get('round', 'N/A')}\n**Time:** {event_data.get('time_str', 'N/A')}\n**Date:** {event_data.get('date_str', 'N/A')}",
+        inline=False
+    )
+    
+    # Build actions completed list
+    actions_completed = [
+        "• Event removed from schedule",
+        "• Reminder cancelled",
+        "• Judge assignment cleared"
+    ]
+    
+    if deleted_message:
+        actions_completed.append("• Original schedule message deleted")
+    
+    if 'poster_path' in event_data:
+        actions_completed.append("• Temporary poster file cleaned up")
+    
+    embed.add_field(
+        name="✅ Actions Completed",
+        value="\n".join(actions_completed),
+        inline=False
+    )
+    
+    embed.set_footer(text=f"Powered by • {ORGANIZATION_NAME}")
+    return embed
+
+class EventDeleteView(View):
+    """Dropdown of the soonest events, for deleting without typing a search"""
+
+    def __init__(self):
+        super().__init__(timeout=60)
+        # Options come from the search index labels (Discord limit of 25 options)
+        self.select_event.options = [
+            discord.SelectOption(label=label, value=event_id)
+            for event_id, label in event_search_index.search("", limit=25)
+        ]
+
+    @discord.ui.select(placeholder="Select an event to delete...")
+    async def select_event(self, select_interaction: discord.Interaction, select: discord.ui.Select):
+        selected_event_id = select.values[0]
+        if selected_event_id not in scheduled_events:
+            await select_interaction.response.edit_message(content="❌ That event no longer exists.", embed=None, view=None)
+            return
+        
+        event_data, deleted_message = await delete_scheduled_event(select_interaction.guild, selected_event_id)
+        await select_interaction.response.edit_message(embed=build_event_deleted_embed(event_data, deleted_message), view=None)
+
+@app_commands.command(name="event-delete", description="Delete a scheduled event (Bot Admin/Organizer/Bot Op only)")
+@app_commands.describe(event="Event to delete - search by captain, round, group, tournament or date")
+@app_commands.autocomplete(event=event_autocomplete)
+async def event_delete(interaction: discord.Interaction, event: str = None):
+    # Check permissions - Bot Owner, Organizer or Bot Op can delete events
+    if interaction.user.id != BOT_OWNER_ID:
+        organizer_role = discord.utils.get(interaction.user.roles, id=ROLE_IDS["organizer"])
+        bot_op_role = discord.utils.get(interaction.user.roles, id=ROLE_IDS["bot_op"])
+        
+        if not (organizer_role or bot_op_role):
+            await interaction.response.send_message("❌ You need **Bot Owner**, **Organizer** or **Bot Op** role to delete events.", ephemeral=True)
+            return
+    
+    try:
+        # Check if there are any scheduled events
+        if not scheduled_events:
+            await interaction.response.send_message("❌ No scheduled events found to delete.", ephemeral=True)
+            return
+        
+        # Event picked through autocomplete: delete it directly
+        if event:
+            if event not in scheduled_events:
+                await interaction.response.send_message("❌ Event not found. Pick an event from the autocomplete list.", ephemeral=True)
+                return
+            await interaction.response.defer(ephemeral=True)
+            event_data, deleted_message = await delete_scheduled_event(interaction.guild, event)
+            await interaction.followup.send(embed=build_event_deleted_embed(event_data, deleted_message), ephemeral=True)
+            return
+        
+        # Create initial embed
+        embed = discord.Embed(
+            title="🗑️ Delete Event",
+            description="Select an event from the dropdown below to delete it, or use the `event` option to search all events.",
+            color=discord.Color.orange(),
+            timestamp=discord.utils.utcnow()
+        )
+        
+        embed.add_field(
+            name="📋 Available Events",
+            value=f"Found {len(scheduled_events)} scheduled event(s)",
+            inline=False
+        )
+        
+        embed.set_footer(text=f"Powered by • {ORGANIZATION_NAME}")
+        
+        view = EventDeleteView()
+        await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
+        
+    except Exception as e:
+        await interaction.response.send_message(f"❌ Error: {str(e)}", ephemeral=True)
+
+
+@app_commands.command(name="exchange_judge", description="Exchange an old judge for a new judge for event(s) in this channel")
+@app_commands.describe(
+    old_judge="The current judge to replace",
+    new_judge="The new judge to assign"
+)
+async def exchange_judge(
+    interaction: discord.Interaction,
+    old_judge: discord.Member,
+    new_judge: discord.Member
+):
+    # Only Bot Admin, Organizer or Bot Op can exchange judges
+    if not has_event_create_permission(interaction):
+        await interaction.response.send_message("❌ You need Bot Admin, Organizer, or Bot Op role to exchange judges.", ephemeral=True)
+        return
+
+    # Validate roles of old/new judges
+    judge_role = discord.utils.get(interaction.guild.roles, id=ROLE_IDS["judge"]) if interaction.guild else None
+    if judge_role:
+        if judge_role not in old_judge.roles:
+            await interaction.response.send_message("❌ Old judge does not have the Judge role.", ephemeral=True)
+            return
+        if judge_role not in new_judge.roles:
+            await interaction.response.send_message("❌ New judge must have the Judge role.", ephemeral=True)
+            return
+
+    # Determine target events in the current channel
+    target_event_ids = []
+    current_channel_id = interaction.channel.id if interaction.channel else None
+    for ev_id, data in scheduled_events.items():
+        if data.get('channel_id') == current_channel_id and get_event_judge_id(data) == old_judge.id:
+            target_event_ids.append(ev_id)
+
+    if not target_event_ids:
+        await interaction.response.send_message("⚠️ No events in this channel are assigned to the old judge.", ephemeral=True)
+        return
+
+    # The new judge takes the same cap and double-booking checks as a Take Schedule claim
+    can_take, error_message = check_judge_transfer(target_event_ids, new_judge.id)
+    if not can_take:
+        await interaction.response.send_message(f"❌ {error_message}", ephemeral=True)
+        return
+
+    # Perform exchange
+    updated_count = 0
+    for ev_id in target_event_ids:
+        data = scheduled_events.get(ev_id)
+        if not data:
+            continue
+        # Update event's judge
+        data['judge'] = new_judge
+        data['judge_id'] = new_judge.id
+
+        # Move the assignment count to the new judge
+        reindex_event(ev_id)
+
+        # Judge assigned successfully (reminder system removed)
+
+        # Handle channel permissions and send notification to the event channel
+        try:
+            if interaction.guild and data.get('channel_id'):
+                channel = interaction.guild.get_channel(data['channel_id'])
+                if channel:
+                    # Remove old judge from channel
+                    await channel.set_permissions(old_judge, overwrite=None)
+                    
+                    # Add new judge to channel
+                    await channel.set_permissions(
+                        new_judge, 
+                        read_messages=True, 
+                        send_messages=True, 
+                        view_channel=True,
+                        embed_links=True,
+                        attach_files=True,
+                        read_message_history=True
+                    )
+                    
+                    embed = discord.Embed(
+                        title="🔁 Judge Exchanged",
+                        description=(
+                            f"**Old judge:** {old_judge.mention} `@{old_judge.name}`\n"
+                            f"**New judge:** {new_judge.mention} `@{new_judge.name}`"
+                        ),
+                        color=discord.Color.purple(),
+                        timestamp=discord.utils.utcnow()
+                    )
+                    channel_mention = channel.mention if channel else ""
+                    embed.add_field(
+                        name="📋 Event",
+                        value=f"{channel_mention} • Time: {data.get('time_str', '')} • {data.get('round', '')}",
+                        inline=False
+                    )
+                    embed.add_field(
+                        name="🔐 Channel Access",
+                        value=f"❌ **{old_judge.display_name}** removed from channel\n✅ **{new_judge.display_name}** added to channel",
+                        inline=False
+                    )
+                    await outbound_queue.send(channel, embed=embed)
+        except discord.Forbidden:
+            log.error("Bot doesn't have permission to manage channel permissions for %s", ev_id)
+        except Exception as e:
+            log.error("Failed to send judge exchange notification for %s: %s", ev_id, e)
+
+        updated_count += 1
+
+    save_scheduled_events()
+
+    await interaction.response.send_message(f"✅ Judge exchanged for {updated_count} event(s) in {interaction.channel.mention}.", ephemeral=True)
+
+
+@app_commands.command(name="event-edit", description="Edit the event in this ticket channel (Bot Admin/Organizer/Bot Op only)")
+@app_commands.describe(
+    event="Event to edit - search by captain, round, group, tournament or date (defaults to this ticket's event)",
+    team_1_captain="Captain of team 1 (optional)",
+    team_2_captain="Captain of team 2 (optional)", 
+    hour="Hour of the event (0-23) (optional)",
+    minute="Minute of the event (0-59) (optional)",
+    date="Date of the event (optional)",
+    month="Month of the event (optional)",
+    round="Round label (optional)",
+    tournament="Tournament name (optional)",
+    group="Group assignment (A-J) or Winner/Loser (optional)"
+)
+@app_commands.choices(
+    round=[
+        app_commands.Choice(name="R1", value="R1"),
+        app_commands.Choice(name="R2", value="R2"),
+        app_commands.Choice(name="R3", value="R3"),
+        app_commands.Choice(name="R4", value="R4"),
+        app_commands.Choice(name="R5", value="R5"),
+        app_commands.Choice(name="R6", value="R6"),
+        app_commands.Choice(name="R7", value="R7"),
+        app_commands.Choice(name="R8", value="R8"),
+        app_commands.Choice(name="R9", value="R9"),
+        app_commands.Choice(name="R10", value="R10"),
+        app_commands.Choice(name="Qualifier", value="Qualifier"),
+        app_commands.Choice(name="Semi Final", value="Semi Final"),
+        app_commands.Choice(name="Final", value="Final"),
+    ],
+    group=[
+        app_commands.Choice(name="Group A", value="Group A"),
+        app_commands.Choice(name="Group B", value="Group B"),
+        app_commands.Choice(name="Group C", value="Group C"),
+        app_commands.Choice(name="Group D", value="Group D"),
+        app_commands.Choice(name="Group E", value="Group E"),
+        app_commands.Choice(name="Group F", value="Group F"),
+        app_commands.Choice(name="Group G", value="Group G"),
+        app_commands.Choice(name="Group H", value="Group H"),
+        app_commands.Choice(name="Group I", value="Group I"),
+        app_commands.Choice(name="Group J", value="Group J"),
+        app_commands.Choice(name="Winner", value="Winner"),
+        app_commands.Choice(name="Loser", value="Loser"),
+    ]
+)
+@app_commands.autocomplete(event=event_autocomplete)
+async def event_edit(
+    interaction: discord.Interaction,
+    event: str = None,
+    team_1_captain: discord.Member = None,
+    team_2_captain: discord.Member = None,
+    hour: int = None,
+    minute: int = None,
+    date: int = None,
+    month: int = None,
+    round: app_commands.Choice[str] = None,
+    tournament: str = None,
+    group: app_commands.Choice[str] = None
+):
+    """Edit the event in this ticket channel"""
+    
+    # Defer the response to give us more time for processing
+    await interaction.response.defer(ephemeral=True)
+    
+    # Check permissions - Bot Admin, Organizer or Bot Op can edit events
+    if interaction.user.id != BOT_OWNER_ID:
+        if not has_event_create_permission(interaction):
+            await interaction.followup.send("❌ You need **Bot Admin**, **Organizer**, or **Bot Op** role to edit events.", ephemeral=True)
+            return
+    
+    # Use the event picked through autocomplete, otherwise find the event in current channel
+    current_channel_id = interaction.channel.id
+    event_to_edit = None
+    event_id = None
+    
+    if event:
+        if event not in scheduled_events:
+            await interaction.followup.send("❌ Event not found. Pick an event from the autocomplete list.", ephemeral=True)
+            return
+        event_id = event
+        event_to_edit = scheduled_events[event]
+    else:
+        for ev_id, event_data in scheduled_events.items():
+            if event_data.get('channel_id') == current_channel_id:
+                event_to_edit = event_data
+                event_id = ev_id
+                break
+    
+    if not event_to_edit:
+        await interaction.followup.send("❌ No event found in this ticket channel. Use `/event-create` to create an event first.", ephemeral=True)
+        return
+    
+    # Check if at least one field is provided
+    if not any([team_1_captain, team_2_captain, hour is not None, minute is not None, date is not None, month is not None, round, tournament, group]):
+        await interaction.followup.send("❌ Please provide at least one field to update.", ephemeral=True)
+        return
+    
+    # Validate input parameters only if provided
+    if hour is not None and not (0 <= hour <= 23):
+        await interaction.followup.send("❌ Hour must be between 0 and 23", ephemeral=True)
+        return
+    
+    if date is not None and not (1 <= date <= 31):
+        await interaction.followup.send("❌ Date must be between 1 and 31", ephemeral=True)
+        return
+
+    if month is not None and not (1 <= month <= 12):
+        await interaction.followup.send("❌ Month must be between 1 and 12", ephemeral=True)
+        return
+            
+    if minute is not None and not (0 <= minute <= 59):
+        await interaction.followup.send("❌ Minute must be between 0 and 59", ephemeral=True)
+        return
+
+    try:
+        # Get current event data
+        current_datetime = event_to_edit.get('datetime', datetime.datetime.now())
+        current_hour = hour if hour is not None else current_datetime.hour
+        current_minute = minute if minute is not None else current_datetime.minute
+        current_date = date if date is not None else current_datetime.day
+        current_month = month if month is not None else current_datetime.month
+        
+        # Create new datetime
+        current_year = datetime.datetime.now().year
+        new_datetime = datetime.datetime(current_year, current_month, current_date, current_hour, current_minute)
+        
+        # Calculate time differences
+        time_info = calculate_time_difference(new_datetime)
+        
+        # Update only provided fields
+        if team_1_captain:
+            event_to_edit['team1_captain'] = team_1_captain
+            event_to_edit['team1_name'] = team_1_captain.display_name
+        if team_2_captain:
+            event_to_edit['team2_captain'] = team_2_captain
+            event_to_edit['team2_name'] = team_2_captain.display_name
+        if hour is not None or minute is not None or date is not None or month is not None:
+            event_to_edit['datetime'] = new_datetime
+            event_to_edit['time_str'] = time_info['utc_time']
+            event_to_edit['date_str'] = f"{current_date:02d}/{current_month:02d}"
+            event_to_edit['minutes_left'] = time_info['minutes_remaining']
+        if round:
+            round_label = round.value if isinstance(round, app_commands.Choice) else str(round)
+            event_to_edit['round'] = round_label
+        if tournament:
+            event_to_edit['tournament'] = tournament
+        if group:
+            event_to_edit['group'] = group.value
+        reindex_event(event_id)
+        
+        # Save updated events
+        save_scheduled_events()
+        
+        # Events loaded from disk only hold member IDs; resolve them on demand
+        team1_captain = await resolve_event_member(interaction.guild, event_to_edit, 'team1_captain')
+        team2_captain = await resolve_event_member(interaction.guild, event_to_edit, 'team2_captain')
+        judge = await resolve_event_member(interaction.guild, event_to_edit, 'judge')
+        
+        # The event may be edited from any channel; reminders and the notice belong in its ticket channel
+        event_channel = resolve_channel(event_to_edit.get('channel_id'), interaction.guild_id) or interaction.channel
+        
+        # Schedule the 10-minute reminder with updated event data
+        try:
+            # Use the updated captains from the event data (which now contains the new values)
+            await schedule_ten_minute_reminder(event_id, team1_captain, team2_captain, judge, event_channel, new_datetime)
+        except Exception as e:
+            log.error("Error scheduling reminder for updated event %s: %s", event_id, e)
+        
+        # Get updated event details for public posting
+        round_info = event_to_edit.get('round', 'Unknown')
+        tournament_info = event_to_edit.get('tournament', 'Unknown')
+        time_info_display = event_to_edit.get('time_str', 'Unknown')
+        date_info_display = event_to_edit.get('date_str', 'Unknown')
+        group_info = event_to_edit.get('group', '')
+        
+        # Create public embed for updated event (similar to event-create)
+        embed = discord.Embed(
+            title="📝 Event Updated",
+            description=f"**Event has been updated by {interaction.user.mention}**",
+            color=discord.Color.orange(),
+            timestamp=discord.utils.utcnow()
+        )
+        
+        # Event Details Section
+        embed.add_field(
+            name="📋 Updated Event Details", 
+            value=f"**Team 1 Captain:** {team1_captain.mention if team1_captain else 'Unknown'} `@{team1_captain.name if team1_captain else 'Unknown'}`\n"
+                  f"**Team 2 Captain:** {team2_captain.mention if team2_captain else 'Unknown'} `@{team2_captain.name if team2_captain else 'Unknown'}`\n\n"
+                  f"**UTC Time:** {time_info_display}\n"
+                  f"**Local Time:** <t:{int(new_datetime.timestamp())}:F> (<t:{int(new_datetime.timestamp())}:R>)\n\n"
+                  f"**Round:** {round_info}\n"
+                  f"**Tournament:** {tournament_info}\n\n"
+                  f"**Channel:** {event_channel.mention}",
+            inline=False
+        )
+        
+        # Add spacing
+        embed.add_field(name="\u200b", value="\u200b", inline=False)
+        
+        if group_info:
+            embed.add_field(
+                name="🏆 Group Assignment",
+                value=f"**Group:** {group_info}",
+                inline=False
+            )
+        
+        # Captains Section
+        captains_text = f"**Captains**\n"
+        captains_text += f"▪ Team1 Captain: {team1_captain.mention if team1_captain else 'Unknown'} `@{team1_captain.name if team1_captain else 'Unknown'}`\n"
+        captains_text += f"▪ Team2 Captain: {team2_captain.mention if team2_captain else 'Unknown'} `@{team2_captain.name if team2_captain else 'Unknown'}`"
+        embed.add_field(name="", value=captains_text, inline=False)
+        
+        embed.set_footer(text=f"Powered by • {ORGANIZATION_NAME}")
+        
+        # Post the updated event embed to the event's channel
+        try:
+            edit_notice = await outbound_queue.send(event_channel, embed=embed)
+            register_event_message(event_id, edit_notice, MESSAGE_ROLE_EDIT_NOTICE)
+            save_scheduled_events()
+        except Exception as e:
+            await interaction.followup.send(f"⚠️ Could not post in {event_channel.mention}: {e}", ephemeral=True)
+        
+        # Bring the original schedule messages in line with the new details
+        await edit_event_messages(event_id, SCHEDULE_MESSAGE_ROLES, lambda schedule_embed: refresh_schedule_embed(schedule_embed, event_to_edit))
+        
+        # Send confirmation to user
+        await interaction.followup.send("✅ Event updated successfully!", ephemeral=True)
+        
+    except Exception as e:
+        await interaction.followup.send(f"❌ Error updating event: {str(e)}", ephemeral=True)
+
+# ===========================================================================================
+# EXTENSION SETUP
+# ===========================================================================================
+
+async def setup(bot: commands.Bot):
+    add_extension_commands(globals())
+    # Route Take Schedule clicks on every schedule message, including ones posted before a restart
+    bot.add_dynamic_items(TakeScheduleButton)
+
+async def teardown(bot: commands.Bot):
+    remove_extension_commands(globals())
+    bot.remove_dynamic_items(TakeScheduleButton)
@@ -0,0 +1,338 @@
+"""Event poster rendering"""
+from discord.ext import commands
+import os
+import logging
+import random
+import re
+import datetime
+from pathlib import Path
+
+from config import ORGANIZATION_NAME
+from utils.startup import lazy_import
+
+log = logging.getLogger(__name__)
+
+Image = lazy_import("PIL.Image")
+ImageDraw = lazy_import("PIL.ImageDraw")
+ImageFont = lazy_import("PIL.ImageFont")
+requests = lazy_import("requests")
+tempfile = lazy_import("tempfile")
+glob = lazy_import("glob")
+
+# Google Fonts API Integration
+def download_google_font(font_family: str, font_style: str = "regular", font_weight: str = "400") -> str:
+    """Download a font from Google Fonts API and return the local file path"""
+    try:
+        # Google Fonts API URL
+        api_url = f"https://fonts.googleapis.com/css2?family={font_family.replace(' ', '+')}:wght@{font_weight}"
+        
+        # Add style parameter if not regular
+        if font_style != "regular":
+            api_url += f"&style={font_style}"
+        
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        }
+        
+        response = requests.get(api_url, headers=headers, timeout=10)
+        response.raise_for_status()
+        
+        # Parse CSS to get font URL
+        css_content = response.text
+        font_urls = re.findall(r'url\((https://[^)]+\.woff2?)\)', css_content)
+        
+        if not font_urls:
+            log.warning("No font URLs found in CSS for %s", font_family)
+            return None
+        
+        # Download the first font file (usually woff2)
+        font_url = font_urls[0]
+        font_response = requests.get(font_url, timeout=15)
+        font_response.raise_for_status()
+        
+        # Create temporary file
+        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.woff2')
+        temp_file.write(font_response.content)
+        temp_file.close()
+        
+        log.debug("Downloaded Google Font: %s -> %s", font_family, temp_file.name)
+        return temp_file.name
+        
+    except Exception as e:
+        log.error("Error downloading Google Font %s: %s", font_family, e)
+        return None
+
+def get_font_with_fallbacks(font_name: str, size: int, font_style: str = "regular") -> "ImageFont.FreeTypeFont":
+    """Get a font with multiple fallback options including Google Fonts"""
+    font_candidates = []
+    
+    # 1. Try Google Fonts first
+    try:
+        google_font_path = download_google_font(font_name, font_style)
+        if google_font_path:
+            font_candidates.append(google_font_path)
+    except Exception as e:
+        log.warning("Google Fonts failed for %s: %s", font_name, e)
+    
+    # 2. Try local bundled fonts
+    local_fonts = [
+        str(Path("Fonts") / "capture_it" / "Capture it.ttf"),
+        str(Path("Fonts") / "ds_digital" / "DS-DIGIB.TTF"),
+        str(Path("Fonts") / "ds_digital" / "DS-DIGII.TTF"),
+        str(Path("Fonts") / "ds_digital" / "DS-DIGI.TTF"),
+    ]
+    font_candidates.extend(local_fonts)
+    
+    # 3. Try system fonts
+    system_fonts = [
+        "C:/Windows/Fonts/arial.ttf",
+        "C:/Windows/Fonts/arialbd.ttf", 
+        "C:/Windows/Fonts/impact.ttf",
+        "C:/Windows/Fonts/consola.ttf",
+        "C:/Windows/Fonts/trebucbd.ttf",
+    ]
+    font_candidates.extend(system_fonts)
+    
+    # Try each font candidate
+    for font_path in font_candidates:
+        try:
+            if os.path.exists(font_path):
+                font = ImageFont.truetype(font_path, size)
+                log.debug("Successfully loaded font: %s", font_path)
+                return font
+        except Exception as e:
+            log.warning("Failed to load font %s: %s", font_path, e)
+            continue
+    
+    # Final fallback to default font
+    log.warning("All fonts failed, using default font for size %s", size)
+    try:
+        return ImageFont.load_default().font_variant(size=size)
+    except:
+        return ImageFont.load_default()
+
+def sanitize_username_for_poster(username: str) -> str:
+    """Convert Discord display names to poster-friendly ASCII by stripping emojis and fancy Unicode.
+
+    - Normalizes to NFKD and drops non-ASCII codepoints
+    - Collapses repeated whitespace and trims ends
+    - Falls back to 'Player' if empty after sanitization
+    """
+    try:
+        import unicodedata
+        # Normalize and strip accents/fancy letters
+        normalized = unicodedata.normalize('NFKD', str(username))
+        ascii_only = normalized.encode('ascii', 'ignore').decode('ascii')
+        # Remove remaining characters that might be control or non-printable
+        ascii_only = re.sub(r"[^\x20-\x7E]", "", ascii_only)
+        # Collapse whitespace
+        ascii_only = re.sub(r"\s+", " ", ascii_only).strip()
+        return ascii_only if ascii_only else "Player"
+    except Exception:
+        return str(username) if username else "Player"
+
+def get_random_template():
+    """Get a random template image from the Templates folder"""
+    template_path = "Templates"
+    if os.path.exists(template_path):
+        # Get all image files
+        image_extensions = ['*.jpg', '*.jpeg', '*.png', '*.gif']
+        image_files = []
+        for ext in image_extensions:
+            image_files.extend(glob.glob(os.path.join(template_path, ext)))
+            image_files.extend(glob.glob(os.path.join(template_path, ext.upper())))
+        
+        if image_files:
+            return random.choice(image_files)
+    return None
+
+def create_event_poster(template_path: str, round_label: str, team1_captain: str, team2_captain: str, utc_time: str, date_str: str = None, tournament_name: str = "King of the Seas", server_name: str = ORGANIZATION_NAME) -> str:
+    """Create event poster with text overlays using Google Fonts and improved error handling"""
+    log.debug("Creating poster with template: %s", template_path)
+    
+    try:
+        # Validate template path
+        if not os.path.exists(template_path):
+            log.warning("Template file not found: %s", template_path)
+            return None
+            
+        # Open the template image
+        with Image.open(template_path) as img:
+            log.debug("Opened template image: %s, mode: %s", img.size, img.mode)
+            
+            # Convert to RGBA if needed
+            if img.mode != 'RGBA':
+                img = img.convert('RGBA')
+            
+            # Resize image to be smaller (max 800x600 to avoid Discord size limits)
+            max_width, max_height = 800, 600
+            width, height = img.size
+            
+            # Calculate new dimensions while maintaining aspect ratio
+            if width > max_width or height > max_height:
+                ratio = min(max_width / width, max_height / height)
+                new_width = int(width * ratio)
+                new_height = int(height * ratio)
+                img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+                log.debug("Resized image to: %sx%s", new_width, new_height)
+            
+            # Create a copy to work with
+            poster = img.copy()
+            draw = ImageDraw.Draw(poster)
+            
+            # Get final image dimensions
+            width, height = poster.size
+            
+            # Load fonts using the new system with Google Fonts integration
+            log.debug("Loading fonts...")
+            
+            # Define font sizes based on image height (reduced for better fit)
+            title_size = int(height * 0.10)
+            round_size = int(height * 0.14)
+            vs_size = int(height * 0.09)
+            time_size = int(height * 0.07)
+            tiny_size = int(height * 0.05)
+            
+            # Load fonts with Google Fonts fallback
+            try:
+                # Try Google Fonts first, then fallback to local/system fonts
+                font_title = get_font_with_fallbacks("Orbitron", title_size, "bold")  # Modern display font
+                font_round = get_font_with_fallbacks("Orbitron", round_size, "bold")  # Same for round
+                # Use a unique bundled font for player names so styling is consistent regardless of Discord nickname styling
+                font_vs = get_font_with_fallbacks("Capture it", vs_size, "bold")       # Unique display font from Fonts/capture_it
+                font_time = get_font_with_fallbacks("Share Tech Mono", time_size)     # Monospace for time
+                font_tiny = get_font_with_fallbacks("Roboto", tiny_size)              # Small text
+                
+                log.debug("Fonts loaded successfully")
+                
+            except Exception as font_error:
+                log.error("Font loading error: %s", font_error)
+                # Ultimate fallback to default fonts
+                font_title = ImageFont.load_default()
+                font_round = ImageFont.load_default()
+                font_vs = ImageFont.load_default()
+                font_time = ImageFont.load_default()
+                font_tiny = ImageFont.load_default()
+            
+            # Define colors for clean visibility
+            text_color = (255, 255, 255)  # Bright white
+            outline_color = (0, 0, 0)     # Pure black
+            yellow_color = (255, 255, 0)  # Bright yellow for important text
+            
+            # Helper function to draw text with outline
+            def draw_text_with_outline(text, x, y, font, text_color=text_color, use_yellow=False):
+                x, y = int(x), int(y)
+                final_text_color = yellow_color if use_yellow else text_color
+                
+                # Draw thick black outline for visibility
+                outline_width = 4
+                for dx in range(-outline_width, outline_width + 1):
+                    for dy in range(-outline_width, outline_width + 1):
+                        if dx != 0 or dy != 0:
+                            try:
+                                draw.text((x + dx, y + dy), text, font=font, fill=outline_color)
+                            except Exception as e:
+                                log.error("Error drawing outline: %s", e)
+                
+                # Draw main text on top
+                try:
+                    draw.text((x, y), text, font=font, fill=final_text_color)
+                except Exception as e:
+                    log.error("Error drawing main text: %s", e)
+            
+            # Add server name text (top center)
+            try:
+                server_text = server_name
+                server_bbox = draw.textbbox((0, 0), server_text, font=font_title)
+                server_width = server_bbox[2] - server_bbox[0]
+                server_x = (width - server_width) // 2
+                server_y = int(height * 0.08)
+                draw_text_with_outline(server_text, server_x, server_y, font_title)
+                log.debug("Added server name: %s", server_text)
+            except Exception as e:
+                log.error("Error adding server name: %s", e)
+            
+            # Add Round text (center) - use yellow for emphasis
+            try:
+                round_text = f"ROUND {round_label}"
+                round_bbox = draw.textbbox((0, 0), round_text, font=font_round)
+                round_width = round_bbox[2] - round_bbox[0]
+                round_x = (width - round_width) // 2
+                round_y = int(height * 0.35)
+                draw_text_with_outline(round_text, round_x, round_y, font_round, use_yellow=True)
+                log.debug("Added round text: %s", round_text)
+            except Exception as e:
+                log.error("Error adding round text: %s", e)
+            
+            # Add Captain vs Captain text (center)
+            try:
+                left_name_text = sanitize_username_for_poster(team1_captain)
+                vs_core = " VS "
+                right_name_text = sanitize_username_for_poster(team2_captain)
+
+                # Measure text components to center the whole line
+                left_box = draw.textbbox((0, 0), left_name_text, font=font_vs)
+                vs_box = draw.textbbox((0, 0), vs_core, font=font_vs)
+                right_box = draw.textbbox((0, 0), right_name_text, font=font_vs)
+                
+                total_width = (left_box[2] - left_box[0]) + (vs_box[2] - vs_box[0]) + (right_box[2] - right_box[0])
+                current_x = (width - total_width) // 2
+                vs_y = int(height * 0.55)
+
+                # Draw left name
+                draw_text_with_outline(left_name_text, current_x, vs_y, font_vs)
+                current_x += (left_box[2] - left_box[0])
+                
+                # Draw VS
+                draw_text_with_outline(vs_core, current_x, vs_y, font_vs, use_yellow=False)
+                current_x += (vs_box[2] - vs_box[0])
+                
+                # Draw right name
+                draw_text_with_outline(right_name_text, current_x, vs_y, font_vs)
+                
+                log.debug("Added VS text: %s VS %s", left_name_text, right_name_text)
+            except Exception as e:
+                log.error("Error adding VS text: %s", e)
+            
+            # Add date (if provided)
+            if date_str:
+                try:
+                    date_text = f"DATE:  {date_str}"
+                    date_bbox = draw.textbbox((0, 0), date_text, font=font_time)
+                    date_width = date_bbox[2] - date_bbox[0]
+                    date_x = (width - date_width) // 2
+                    date_y = int(height * 0.72)
+                    draw_text_with_outline(date_text, date_x, date_y, font_time)
+                    log.debug("Added date: %s", date_text)
+                except Exception as e:
+                    log.error("Error adding date: %s", e)
+            
+            # Add UTC time
+            try:
+                time_text = f"TIME:  {utc_time}"
+                time_bbox = draw.textbbox((0, 0), time_text, font=font_time)
+                time_width = time_bbox[2] - time_bbox[0]
+                time_x = (width - time_width) // 2
+                time_y = int(height * 0.82) if date_str else int(height * 0.75)
+                draw_text_with_outline(time_text, time_x, time_y, font_time)
+                log.debug("Added time: %s", time_text)
+            except Exception as e:
+                log.error("Error adding time: %s", e)
+            
+            # Save the modified image
+            output_path = f"temp_poster_{int(datetime.datetime.now().timestamp())}.png"
+            poster.save(output_path, "PNG")
+            log.info("Poster saved successfully: %s", output_path)
+            return output_path
+            
+    except Exception as e:
+        log.exception("Critical error creating poster: %s", e)
+        return None
+
+# ===========================================================================================
+# EXTENSION SETUP
+# ===========================================================================================
+
+# No commands: cogs.events calls into whichever version of this module is loaded
+async def setup(bot: commands.Bot):
+    pass
@@ -0,0 +1,631 @@
+"""Event results, staff attendance, ratings leaderboard, seeding and tie breaker commands"""
+import discord
+import logging
+from discord import app_commands
+from discord.ext import commands
+import asyncio
+import datetime
+import math
+from discord.ui import Button, View
+
+from config import CHANNEL_IDS, ORGANIZATION_NAME
+from utils.attendance import format_attendance_line, query_attendance, record_attendance
+from utils.bot import add_extension_commands, remove_extension_commands
+from utils.embed_utils import update_embed_title_with_checkmark
+from utils.event_store import (
+    edit_event_messages,
+    event_autocomplete,
+    MESSAGE_ROLE_RESULT,
+    MESSAGE_ROLE_RESULT_TICKET,
+    register_event_message,
+    reindex_event,
+    save_scheduled_events,
+    SCHEDULE_MESSAGE_ROLES,
+    scheduled_events,
+)
+from utils.permissions import has_event_create_permission, has_event_result_permission
+from utils.ratings import (
+    get_player_rank,
+    get_player_rating,
+    LEADERBOARD_PAGE_SIZE,
+    parse_member_ids,
+    player_ratings,
+    rating_rank_index,
+    record_match_result,
+    result_match_key,
+)
+from utils.reminder_utils import schedule_event_cleanup
+from utils.screenshots import (
+    archive_result_screenshots,
+    CONTACT_SHEET_FILENAME,
+    fan_out_result,
+    FanOutTarget,
+    format_fan_out_report,
+    ingest_screenshots,
+    process_result_screenshots,
+    RESULT_IMAGE_STAGE,
+)
+
+log = logging.getLogger(__name__)
+
+class LeaderboardView(View):
+    """Paginated leaderboard read straight from the rank index"""
+
+    def __init__(self, owner_id: int):
+        super().__init__(timeout=300)
+        self.owner_id = owner_id
+        self.page = 0
+
+    def build_embed(self) -> discord.Embed:
+        page_count = max(1, math.ceil(len(rating_rank_index) / LEADERBOARD_PAGE_SIZE))
+        self.page = min(self.page, page_count - 1)
+        start = self.page * LEADERBOARD_PAGE_SIZE
+
+        lines = []
+        for rank, (_, member_id) in enumerate(rating_rank_index[start:start + LEADERBOARD_PAGE_SIZE], start=start + 1):
+            entry = player_ratings[member_id]
+            lines.append(f"**{rank}.** <@{member_id}> • **{entry['rating']:.0f}** • {entry['wins']}W-{entry['losses']}L")
+
+        embed = discord.Embed(
+            title="🏆 Player Leaderboard",
+            description="\n".join(lines) if lines else "No rated players yet. Ratings update when results are posted.",
+            color=discord.Color.gold(),
+            timestamp=discord.utils.utcnow()
+        )
+        embed.set_footer(text=f"Page {self.page + 1}/{page_count} • {len(rating_rank_index)} rated players • {ORGANIZATION_NAME}")
+
+        self.previous_page.disabled = self.page == 0
+        self.next_page.disabled = self.page >= page_count - 1
+        return embed
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.owner_id:
+            await interaction.response.send_message("❌ Run `/leaderboard` to browse the leaderboard yourself.", ephemeral=True)
+            return False
+        return True
+
+    @discord.ui.button(label="Previous", style=discord.ButtonStyle.secondary, emoji="◀️")
+    async def previous_page(self, interaction: discord.Interaction, button: Button):
+        self.page = max(0, self.page - 1)
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+
+    @discord.ui.button(label="Next", style=discord.ButtonStyle.secondary, emoji="▶️")
+    async def next_page(self, interaction: discord.Interaction, button: Button):
+        self.page += 1
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+
+@app_commands.command(name="leaderboard", description="Show the player rating leaderboard")
+@app_commands.describe(player="Jump to the page containing this player (optional)")
+async def leaderboard(interaction: discord.Interaction, player: discord.Member = None):
+    """Page through player ratings, optionally starting at a player's rank."""
+    view = LeaderboardView(interaction.user.id)
+    if player:
+        rank = get_player_rank(player.id)
+        if rank is None:
+            await interaction.response.send_message(f"❌ {player.mention} has no rating yet.", ephemeral=True)
+            return
+        view.page = (rank - 1) // LEADERBOARD_PAGE_SIZE
+    await interaction.response.send_message(embed=view.build_embed(), view=view, ephemeral=True)
+
+@app_commands.command(name="seeding", description="Seed players by rating and pair them for the first round")
+@app_commands.describe(players="Players to seed, as mentions (e.g. @A @B @C @D)")
+async def seeding(interaction: discord.Interaction, players: str):
+    """Order players by rating and pair top seeds against bottom seeds."""
+    member_ids = list(dict.fromkeys(parse_member_ids(players)))
+    if len(member_ids) < 2:
+        await interaction.response.send_message("❌ Mention at least two players to seed.", ephemeral=True)
+        return
+
+    seeded = sorted(member_ids, key=lambda member_id: (-get_player_rating(member_id), member_id))
+    seed_lines = []
+    for seed, member_id in enumerate(seeded, start=1):
+        note = "" if member_id in player_ratings else " (unrated)"
+        seed_lines.append(f"**{seed}.** <@{member_id}> • {get_player_rating(member_id):.0f}{note}")
+
+    # With an odd field the top seed sits out; the rest pair highest against lowest
+    pair_lines = []
+    first = len(seeded) % 2
+    if first:
+        pair_lines.append(f"Seed 1 <@{seeded[0]}> gets a bye")
+    for i in range(first, first + (len(seeded) - first) // 2):
+        opponent = len(seeded) - 1 - (i - first)
+        pair_lines.append(f"Seed {i + 1} <@{seeded[i]}> vs Seed {opponent + 1} <@{seeded[opponent]}>")
+
+    embed = discord.Embed(title="🎯 Seeding", color=discord.Color.blue(), timestamp=discord.utils.utcnow())
+    embed.add_field(name="Seeds", value="\n".join(seed_lines)[:1024], inline=False)
+    embed.add_field(name="First Round", value="\n".join(pair_lines)[:1024], inline=False)
+    embed.set_footer(text=f"Powered by • {ORGANIZATION_NAME}")
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+@app_commands.command(name="event-result", description="Add event results (Organizer/Judge only)")
+@app_commands.describe(
+    winner="Winner of the event",
+    winner_score="Winner's score",
+    loser="Loser of the event", 
+    loser_score="Loser's score",
+    tournament="Tournament name (e.g., The Zumwalt S2)",
+    round="Round name (e.g., Semi-Final, Final, Quarter-Final)",
+    event="Scheduled event this result belongs to (defaults to the event in this channel)",
+    group="Group assignment (A-J) - optional",
+    remarks="Remarks about the match (e.g., ggwp, close match)",
+    ss_1="Screenshot 1 (upload)",
+    ss_2="Screenshot 2 (upload)",
+    ss_3="Screenshot 3 (upload)",
+    ss_4="Screenshot 4 (upload)",
+    ss_5="Screenshot 5 (upload)",
+    ss_6="Screenshot 6 (upload)",
+    ss_7="Screenshot 7 (upload)",
+    ss_8="Screenshot 8 (upload)",
+    ss_9="Screenshot 9 (upload)",
+    ss_10="Screenshot 10 (upload)",
+    ss_11="Screenshot 11 (upload)"
+)
+@app_commands.choices(
+    group=[
+        app_commands.Choice(name="Group A", value="Group A"),
+        app_commands.Choice(name="Group B", value="Group B"),
+        app_commands.Choice(name="Group C", value="Group C"),
+        app_commands.Choice(name="Group D", value="Group D"),
+        app_commands.Choice(name="Group E", value="Group E"),
+        app_commands.Choice(name="Group F", value="Group F"),
+        app_commands.Choice(name="Group G", value="Group G"),
+        app_commands.Choice(name="Group H", value="Group H"),
+        app_commands.Choice(name="Group I", value="Group I"),
+        app_commands.Choice(name="Group J", value="Group J"),
+        app_commands.Choice(name="Winner", value="Winner"),
+        app_commands.Choice(name="Loser", value="Loser"),
+    ]
+)
+@app_commands.autocomplete(event=event_autocomplete)
+async def event_result(
+    interaction: discord.Interaction,
+    winner: discord.Member,
+    winner_score: int,
+    loser: discord.Member,
+    loser_score: int,
+    tournament: str,
+    round: str,
+    event: str = None,
+    group: app_commands.Choice[str] = None,
+    remarks: str = "ggwp",
+    ss_1: discord.Attachment = None,
+    ss_2: discord.Attachment = None,
+    ss_3: discord.Attachment = None,
+    ss_4: discord.Attachment = None,
+    ss_5: discord.Attachment = None,
+    ss_6: discord.Attachment = None,
+    ss_7: discord.Attachment = None,
+    ss_8: discord.Attachment = None,
+    ss_9: discord.Attachment = None,
+    ss_10: discord.Attachment = None,
+    ss_11: discord.Attachment = None
+):
+    """Adds results for an event"""
+    
+    # Defer the response immediately to avoid timeout issues
+    await interaction.response.defer(ephemeral=True)
+    
+    # Check permissions
+    if not has_event_result_permission(interaction):
+        await interaction.followup.send("❌ You need **Organizer** or **Judge** role to post event results.", ephemeral=True)
+        return
+
+    # Validate scores
+    if winner_score < 0 or loser_score < 0:
+        await interaction.followup.send("❌ Scores cannot be negative", ephemeral=True)
+        return
+    
+    if event and event not in scheduled_events:
+        await interaction.followup.send("❌ Event not found. Pick an event from the autocomplete list.", ephemeral=True)
+        return
+    
+    # Resolve group label from choice
+    group_label = group.value if group and isinstance(group, app_commands.Choice) else None
+            
+    # Create results embed matching the exact template format
+    embed_description = f"🗓️ {winner.display_name} Vs {loser.display_name}\n"
+    embed_description += f"**Tournament:** {tournament}\n"
+    embed_description += f"**Round:** {round}"
+    
+    # Add group if specified
+    if group_label:
+        embed_description += f"\n**Group:** {group_label}"
+    
+    embed = discord.Embed(
+        title="Results",
+        description=embed_description,
+        color=discord.Color.gold(),
+        timestamp=discord.utils.utcnow()
+    )
+    
+    # Captains Section
+    captains_text = f"**Captains**\n"
+    captains_text += f"▪ Team1 Captain: {winner.mention} `@{winner.name}`\n"
+    captains_text += f"▪ Team2 Captain: {loser.mention} `@{loser.name}`"
+    embed.add_field(name="", value=captains_text, inline=False)
+    
+    # Add spacing
+    embed.add_field(name="\u200b", value="\u200b", inline=False)
+    
+    # Results Section
+    results_text = f"**Results**\n"
+    results_text += f"🏆 {winner.display_name} ({winner_score}) Vs ({loser_score}) {loser.display_name} 💀"
+    embed.add_field(name="", value=results_text, inline=False)
+    
+    # Add spacing
+    embed.add_field(name="\u200b", value="\u200b", inline=False)
+    
+    # Staff Section
+    staff_text = f"👨‍⚖️ **Staffs**\n"
+    staff_text += f"▪ Judge: {interaction.user.mention} `@{interaction.user.name}`"
+    embed.add_field(name="", value=staff_text, inline=False)
+    
+    # Add spacing
+    embed.add_field(name="\u200b", value="\u200b", inline=False)
+    
+    # Remarks Section
+    embed.add_field(name="📝 Remarks", value=remarks, inline=False)
+    
+    # Handle screenshots - download them concurrently and send as files (no image embeds)
+    screenshots = [ss_1, ss_2, ss_3, ss_4, ss_5, ss_6, ss_7, ss_8, ss_9, ss_10, ss_11]
+    ingested_screenshots, ingest_errors = await ingest_screenshots(
+        [(i, screenshot) for i, screenshot in enumerate(screenshots, 1) if screenshot]
+    )
+    try:
+        screenshot_names = [f"SS-{shot.slot}" for shot in ingested_screenshots]
+    
+        if ingest_errors:
+            await interaction.followup.send("⚠️ Some screenshots were not included:\n" + "\n".join(ingest_errors), ephemeral=True)
+    
+        # Add screenshot section if any screenshots were provided
+        if screenshot_names:
+            screenshot_text = f"**Screenshots of Result ({len(screenshot_names)} images)**\n"
+            screenshot_text += f"📷 {' • '.join(screenshot_names)}"
+            embed.add_field(name="", value=screenshot_text, inline=False)
+    
+        embed.set_footer(text=f"Powered by • {ORGANIZATION_NAME}")
+    
+        # Build the fan-out targets; every channel shares the same screenshot buffers
+        payloads = [(shot.upload_name, shot.buffer()) for shot in ingested_screenshots]
+        targets = []
+    
+        # Results get recompressed screenshots and a contact sheet; originals stay in the ticket
+        results_payloads = payloads
+        results_embed = embed
+        contact_sheet = None
+        duplicate_warnings = []
+        if ingested_screenshots:
+            # Archive and check for reused screenshots while the image stage runs
+            submission = {
+                'channel_id': interaction.channel.id if interaction.channel else None,
+                'winner_id': winner.id,
+                'loser_id': loser.id,
+                'judge_id': interaction.user.id
+            }
+            archive_job = archive_result_screenshots(ingested_screenshots, submission)
+            if RESULT_IMAGE_STAGE:
+                (results_payloads, contact_sheet), duplicate_warnings = await asyncio.gather(
+                    process_result_screenshots(ingested_screenshots), archive_job
+                )
+            else:
+                duplicate_warnings = await archive_job
+        if duplicate_warnings:
+            await interaction.followup.send("🔍 **Possible reused screenshots:**\n" + "\n".join(duplicate_warnings), ephemeral=True)
+            log.warning("Possible reused screenshots in result %s vs %s: %s", winner.id, loser.id, duplicate_warnings)
+        if contact_sheet:
+            results_payloads = results_payloads + [contact_sheet]
+            results_embed = embed.copy()
+            results_embed.set_image(url=f"attachment://{CONTACT_SHEET_FILENAME}")
+    
+        results_channel = interaction.guild.get_channel(CHANNEL_IDS["results"])
+        if not results_channel and interaction.channel and interaction.channel.id == CHANNEL_IDS["results"]:
+            results_channel = interaction.channel
+        if results_channel:
+            targets.append(FanOutTarget("Results channel", results_channel, MESSAGE_ROLE_RESULT, results_payloads, embed=results_embed))
+        else:
+            await interaction.followup.send("⚠️ Could not find Results channel.", ephemeral=True)
+    
+        # Post in current channel (where command was executed); don't duplicate if already in results channel
+        current_channel = interaction.channel
+        if current_channel and current_channel.id != CHANNEL_IDS["results"]:
+            targets.append(FanOutTarget("Ticket channel", current_channel, MESSAGE_ROLE_RESULT_TICKET, payloads, embed=embed))
+
+        # Winner-only summary removed per request
+    
+        # Post to every channel concurrently
+        fan_out_reports = await fan_out_result(targets)
+    
+        # Messages posted for this result, registered against the matching events below
+        posted_messages = [(report.message, report.target.role) for report in fan_out_reports if report.ok]
+    
+        # Send confirmation to user with per-channel outcome
+        if fan_out_reports and all(report.ok for report in fan_out_reports):
+            summary = "✅ Event results posted!"
+        else:
+            summary = "⚠️ Event results were not posted everywhere."
+        await interaction.followup.send(f"{summary}\n{format_fan_out_report(fan_out_reports)}", ephemeral=True)
+    finally:
+        # Release the spooled screenshot storage, even when posting failed
+        for shot in ingested_screenshots:
+            shot.close()
+
+    # Update matching events with result data and schedule auto-cleanup
+    try:
+        current_channel_id = interaction.channel.id if interaction.channel else None
+        matching_event_ids = []
+        if event:
+            # The event was picked explicitly through autocomplete
+            matching_event_ids.append(event)
+        else:
+            for ev_id, data in scheduled_events.items():
+                if data.get('channel_id') == current_channel_id:
+                    # Match by captains to be safer
+                    try:
+                        t1 = getattr(data.get('team1_captain'), 'id', None) or data.get('team1_captain_id')
+                        t2 = getattr(data.get('team2_captain'), 'id', None) or data.get('team2_captain_id')
+                        if winner.id in (t1, t2) and loser.id in (t1, t2):
+                            matching_event_ids.append(ev_id)
+                    except Exception as e:
+                        log.error("Error matching event %s: %s", ev_id, e)
+                        matching_event_ids.append(ev_id)
+        
+        # Rate the match once; a re-posted result (for its event, or for the same channel, captains and
+        # round when no event matched) does not count twice
+        match_key = result_match_key(
+            matching_event_ids[0] if matching_event_ids else None, current_channel_id,
+            (winner.id, loser.id), tournament, round, group_label
+        )
+        already_rated = any(scheduled_events[ev_id].get('result_added') for ev_id in matching_event_ids)
+        rating_deltas = None
+        if winner.id != loser.id:
+            rating_deltas = None if already_rated else record_match_result(winner, loser, match_key)
+            if rating_deltas is None:
+                log.warning("Skipping rating update for %s vs %s: match %s was already rated", winner.id, loser.id, match_key)
+        if rating_deltas:
+            winner_delta, loser_delta = rating_deltas
+            await interaction.followup.send(
+                f"📈 Ratings updated: {winner.mention} {get_player_rating(winner.id):.0f} ({winner_delta:+.0f}) • "
+                f"{loser.mention} {get_player_rating(loser.id):.0f} ({loser_delta:+.0f})",
+                ephemeral=True
+            )
+        
+        for ev_id in matching_event_ids:
+            # Update the event with result data
+            scheduled_events[ev_id]['result_added'] = True
+            scheduled_events[ev_id]['result_winner'] = winner
+            scheduled_events[ev_id]['result_loser'] = loser
+            scheduled_events[ev_id]['result_winner_score'] = winner_score
+            scheduled_events[ev_id]['result_loser_score'] = loser_score
+            scheduled_events[ev_id]['result_judge'] = interaction.user
+            scheduled_events[ev_id]['result_group'] = group_label
+            scheduled_events[ev_id]['result_remarks'] = remarks
+            reindex_event(ev_id)
+            log.info("Updated event %s with result data", ev_id)
+        
+        # Log the judge's attendance; the staff channel shows it in their live digest
+        record_attendance(
+            interaction.user, winner, loser, winner_score, loser_score, tournament, round,
+            group=group_label,
+            event_id=matching_event_ids[0] if matching_event_ids else None,
+            warnings=duplicate_warnings
+        )
+        
+        # Record every message posted for this result against the matching events
+        for ev_id in matching_event_ids:
+            for message, role in posted_messages:
+                register_event_message(ev_id, message, role)
+        
+        # Save updated events
+        if matching_event_ids:
+            save_scheduled_events()
+
+        # Mark the registered schedule messages (Take-Schedule post and ticket copy) with a checkmark, in parallel
+        if matching_event_ids:
+            updated_counts = await asyncio.gather(*(
+                edit_event_messages(ev_id, SCHEDULE_MESSAGE_ROLES, update_embed_title_with_checkmark)
+                for ev_id in matching_event_ids
+            ))
+            log.info("Updated %s schedule message title(s) with checkmark", sum(updated_counts))
+
+        scheduled_any = False
+        for ev_id in matching_event_ids:
+            await schedule_event_cleanup(ev_id, delay_hours=36)
+            scheduled_any = True
+
+        if scheduled_any:
+            await interaction.followup.send("🧹 Auto-cleanup scheduled: Related event(s) will be removed after 24 hours.", ephemeral=True)
+    except Exception as e:
+        log.exception("Error scheduling auto-cleanup after results: %s", e)
+
+
+@app_commands.command(name="attendance", description="Look up judged matches in the staff attendance records (Organizer/Judge only)")
+@app_commands.describe(
+    judge="Judge to look up (default: all judges)",
+    date="Day as DD/MM (UTC)",
+    tournament="Tournament name"
+)
+async def attendance(interaction: discord.Interaction, judge: discord.Member = None, date: str = None, tournament: str = None):
+    """Query staff attendance by judge, day and tournament."""
+    if not has_event_result_permission(interaction):
+        await interaction.response.send_message("❌ You need **Organizer** or **Judge** role to view staff attendance.", ephemeral=True)
+        return
+    
+    match_day = None
+    if date:
+        today = datetime.datetime.utcnow().date()
+        try:
+            day, month = (int(part) for part in date.split("/")[:2])
+            match_day = datetime.date(today.year, month, day)
+        except ValueError:
+            await interaction.response.send_message("❌ Invalid date. Use DD/MM, e.g. 24/10.", ephemeral=True)
+            return
+        if match_day > today:
+            try:
+                match_day = match_day.replace(year=today.year - 1)
+            except ValueError:
+                # 29/02 is still ahead this year and last year was not a leap year
+                await interaction.response.send_message(f"❌ {date} did not occur last year. Pick another date.", ephemeral=True)
+                return
+    
+    records = query_attendance(judge.id if judge else None, match_day, tournament)
+    filters = [f"**Judge:** {judge.mention}" if judge else None,
+               f"**Date:** {match_day.strftime('%d/%m/%Y')}" if match_day else None,
+               f"**Tournament:** {tournament}" if tournament else None]
+    header = "\n".join(part for part in filters if part) or "**All records**"
+    
+    embed = discord.Embed(
+        title="🏅 Staff Attendance",
+        description=header,
+        color=discord.Color.gold(),
+        timestamp=discord.utils.utcnow()
+    )
+    if not records:
+        embed.add_field(name="Matches", value="No judged matches found.", inline=False)
+    else:
+        # Totals per judge, busiest first
+        totals = {}
+        for record in records:
+            totals[record['judge_id']] = totals.get(record['judge_id'], 0) + 1
+        ranked = sorted(totals.items(), key=lambda item: -item[1])
+        embed.add_field(
+            name=f"👨‍⚖️ Judges ({len(totals)})",
+            value="\n".join(f"<@{judge_id}> • {count} match(es)" for judge_id, count in ranked[:15])[:1024],
+            inline=False
+        )
+        recent = [format_attendance_line(record) for record in records[-10:]]
+        embed.add_field(name=f"🗓️ Latest matches ({len(records)} total)", value="\n".join(recent)[:1024], inline=False)
+    embed.set_footer(text=f"Powered by • {ORGANIZATION_NAME}")
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+
+# Ticket Management Commands - Removed as requested
+
+@app_commands.command(name="general_tie_breaker", description="To break a tie between two teams using the highest total score")
+@app_commands.describe(
+    tm1_name="Name of the first team. By default, it is Alpha",
+    tm1_pl1_score="Score of the first player of the first team",
+    tm1_pl2_score="Score of the second player of the first team", 
+    tm1_pl3_score="Score of the third player of the first team",
+    tm1_pl4_score="Score of the fourth player of the first team",
+    tm1_pl5_score="Score of the fifth player of the first team",
+    tm2_name="Name of the second team. By default, it is Bravo",
+    tm2_pl1_score="Score of the first player of the second team",
+    tm2_pl2_score="Score of the second player of the second team",
+    tm2_pl3_score="Score of the third player of the second team",
+    tm2_pl4_score="Score of the fourth player of the second team",
+    tm2_pl5_score="Score of the fifth player of the second team"
+)
+async def general_tie_breaker(
+    interaction: discord.Interaction,
+    tm1_pl1_score: int,
+    tm1_pl2_score: int,
+    tm1_pl3_score: int,
+    tm1_pl4_score: int,
+    tm1_pl5_score: int,
+    tm2_pl1_score: int,
+    tm2_pl2_score: int,
+    tm2_pl3_score: int,
+    tm2_pl4_score: int,
+    tm2_pl5_score: int,
+    tm1_name: str = "Alpha",
+    tm2_name: str = "Bravo"
+):
+    """Break a tie between two teams using the highest total score"""
+    
+    # Check permissions - only Bot Admin, Organizer or Bot Op can use this command
+    if not has_event_create_permission(interaction):
+        await interaction.response.send_message("❌ You need **Bot Admin**, **Organizer**, or **Bot Op** role to use tie breaker.", ephemeral=True)
+        return
+    
+    # Calculate team totals
+    tm1_total = tm1_pl1_score + tm1_pl2_score + tm1_pl3_score + tm1_pl4_score + tm1_pl5_score
+    tm2_total = tm2_pl1_score + tm2_pl2_score + tm2_pl3_score + tm2_pl4_score + tm2_pl5_score
+    
+    # Determine winner
+    if tm1_total > tm2_total:
+        winner = tm1_name
+        winner_total = tm1_total
+        loser = tm2_name
+        loser_total = tm2_total
+        color = discord.Color.green()
+    elif tm2_total > tm1_total:
+        winner = tm2_name
+        winner_total = tm2_total
+        loser = tm1_name
+        loser_total = tm1_total
+        color = discord.Color.green()
+    else:
+        # Still tied
+        winner = "TIE"
+        winner_total = tm1_total
+        loser = ""
+        loser_total = tm2_total
+        color = discord.Color.orange()
+    
+    # Create result embed
+    embed = discord.Embed(
+        title="🏆 Tie Breaker Results",
+        description="Results based on highest total team score",
+        color=color,
+        timestamp=discord.utils.utcnow()
+    )
+    
+    # Team 1 scores
+    embed.add_field(
+        name=f"🔵 {tm1_name} Team",
+        value=f"Player 1: `{tm1_pl1_score}`\n"
+              f"Player 2: `{tm1_pl2_score}`\n"
+              f"Player 3: `{tm1_pl3_score}`\n"
+              f"Player 4: `{tm1_pl4_score}`\n"
+              f"Player 5: `{tm1_pl5_score}`\n"
+              f"**Total: {tm1_total}**",
+        inline=True
+    )
+    
+    # Team 2 scores
+    embed.add_field(
+        name=f"🔴 {tm2_name} Team",
+        value=f"Player 1: `{tm2_pl1_score}`\n"
+              f"Player 2: `{tm2_pl2_score}`\n"
+              f"Player 3: `{tm2_pl3_score}`\n"
+              f"Player 4: `{tm2_pl4_score}`\n"
+              f"Player 5: `{tm2_pl5_score}`\n"
+              f"**Total: {tm2_total}**",
+        inline=True
+    )
+    
+    # Add spacing
+    embed.add_field(name="\u200b", value="\u200b", inline=False)
+    
+    # Result
+    if winner == "TIE":
+        embed.add_field(
+            name="🤝 Final Result",
+            value=f"**STILL TIED!**\n"
+                  f"Both teams scored {tm1_total} points\n"
+                  f"Additional tie-breaking method needed",
+            inline=False
+        )
+    else:
+        embed.add_field(
+            name="🏆 Winner",
+            value=f"**{winner}** wins the tie breaker!\n"
+                  f"**{winner}**: {winner_total} points\n"
+                  f"**{loser}**: {loser_total} points\n"
+                  f"Difference: {abs(winner_total - loser_total)} points",
+            inline=False
+        )
+    
+    embed.set_footer(text=f"Tie Breaker • Calculated by {interaction.user.display_name}")
+    
+    await interaction.response.send_message(embed=embed)
+
+# ===========================================================================================
+# EXTENSION SETUP
+# ===========================================================================================
+
+async def setup(bot: commands.Bot):
+    add_extension_commands(globals())
+
+async def teardown(bot: commands.Bot):
+    remove_extension_commands(globals())
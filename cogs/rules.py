@@ -0,0 +1,186 @@
+"""Tournament rules commands and UI"""
+import discord
+import logging
+from discord import app_commands
+from discord.ext import commands
+
+from config import ORGANIZATION_NAME, TOURNAMENT_SYSTEM_NAME
+from utils.bot import add_extension_commands, remove_extension_commands
+from utils.permissions import has_organizer_permission
+from utils.rules_store import get_current_rules, set_rules_content, tournament_rules
+
+log = logging.getLogger(__name__)
+
+# ===========================================================================================
+# RULE MANAGEMENT UI COMPONENTS
+# ===========================================================================================
+
+class RuleInputModal(discord.ui.Modal):
+    """Modal for entering/editing rule content"""
+    
+    def __init__(self, title: str, current_content: str = ""):
+        super().__init__(title=title)
+        
+        # Text input field for rule content
+        self.rule_input = discord.ui.TextInput(
+            label="Tournament Rules",
+            placeholder="Enter the tournament rules here...",
+            default=current_content,
+            style=discord.TextStyle.paragraph,
+            max_length=4000,
+            required=False
+        )
+        self.add_item(self.rule_input)
+    
+    async def on_submit(self, interaction: discord.Interaction):
+        try:
+            # Get the content from the input
+            content = self.rule_input.value.strip()
+            
+            # Save the rules
+            success = set_rules_content(content, interaction.user.id, interaction.user.name)
+            
+            if success:
+                # Create confirmation embed
+                embed = discord.Embed(
+                    title="✅ Rules Updated Successfully",
+                    description="Tournament rules have been saved.",
+                    color=discord.Color.green(),
+                    timestamp=discord.utils.utcnow()
+                )
+                
+                if content:
+                    # Show preview of rules (truncated if too long)
+                    preview = content[:500] + "..." if len(content) > 500 else content
+                    embed.add_field(name="Rules Preview", value=f"```\n{preview}\n```", inline=False)
+                else:
+                    embed.add_field(name="Status", value="Rules have been cleared (empty)", inline=False)
+                
+                embed.set_footer(text=f"Updated by {interaction.user.name}")
+                
+                await interaction.response.send_message(embed=embed, ephemeral=True)
+            else:
+                await interaction.response.send_message("❌ Failed to save rules. Please try again.", ephemeral=True)
+                
+        except Exception as e:
+            log.exception("Error in rule modal submission: %s", e)
+            await interaction.response.send_message("❌ An error occurred while saving rules.", ephemeral=True)
+
+class RulesManagementView(discord.ui.View):
+    """Interactive view for organizers with rule management buttons"""
+    
+    def __init__(self):
+        super().__init__(timeout=300)  # 5 minute timeout
+    
+    @discord.ui.button(label="Enter Rules", style=discord.ButtonStyle.green, emoji="📝")
+    async def enter_rules(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """Button to enter new rules"""
+        modal = RuleInputModal("Enter Tournament Rules")
+        await interaction.response.send_modal(modal)
+    
+    @discord.ui.button(label="Reedit Rules", style=discord.ButtonStyle.primary, emoji="✏️")
+    async def reedit_rules(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """Button to edit existing rules"""
+        current_rules = get_current_rules()
+        
+        if not current_rules:
+            await interaction.response.send_message("❌ No rules are currently set. Use 'Enter Rules' to create new rules.", ephemeral=True)
+            return
+        
+        modal = RuleInputModal("Edit Tournament Rules", current_rules)
+        await interaction.response.send_modal(modal)
+    
+    @discord.ui.button(label="Show Rules", style=discord.ButtonStyle.secondary, emoji="👁️")
+    async def show_rules(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """Button to display current rules"""
+        await display_rules(interaction)
+
+async def display_rules(interaction: discord.Interaction):
+    """Display current tournament rules in an embed"""
+    try:
+        current_rules = get_current_rules()
+        
+        if not current_rules:
+            embed = discord.Embed(
+                title="📋 Tournament Rules",
+                description="No tournament rules have been set yet.",
+                color=discord.Color.orange(),
+                timestamp=discord.utils.utcnow()
+            )
+            embed.set_footer(text=TOURNAMENT_SYSTEM_NAME)
+        else:
+            embed = discord.Embed(
+                title="📋 Tournament Rules",
+                description=current_rules,
+                color=discord.Color.blue(),
+                timestamp=discord.utils.utcnow()
+            )
+            
+            # Add metadata if available
+            if 'rules' in tournament_rules and 'last_updated' in tournament_rules['rules']:
+                updated_by = tournament_rules['rules'].get('updated_by', {}).get('username', 'Unknown')
+                embed.set_footer(text=f"{ORGANIZATION_NAME} • Last updated by {updated_by}")
+        
+        await interaction.response.send_message(embed=embed, ephemeral=False)
+        
+    except Exception as e:
+        log.error("Error displaying rules: %s", e)
+        await interaction.response.send_message("❌ An error occurred while displaying rules.", ephemeral=False)
+
+@app_commands.command(name="rules", description="Manage or view tournament rules")
+async def rules_command(interaction: discord.Interaction):
+    """Main rules command with role-based functionality"""
+    try:
+        # Check if user has organizer permissions
+        if has_organizer_permission(interaction):
+            # Organizer gets management interface
+            embed = discord.Embed(
+                title="📋 Tournament Rules Management",
+                description="Choose an action to manage tournament rules:",
+                color=discord.Color.blue(),
+                timestamp=discord.utils.utcnow()
+            )
+            
+            current_rules = get_current_rules()
+            if current_rules:
+                embed.add_field(
+                    name="Current Status", 
+                    value="✅ Rules are set", 
+                    inline=True
+                )
+                # Show preview of current rules
+                preview = current_rules[:200] + "..." if len(current_rules) > 200 else current_rules
+                embed.add_field(
+                    name="Preview", 
+                    value=f"```\n{preview}\n```", 
+                    inline=False
+                )
+            else:
+                embed.add_field(
+                    name="Current Status", 
+                    value="❌ No rules set", 
+                    inline=True
+                )
+            
+            embed.set_footer(text=f"{ORGANIZATION_NAME} • Organizer Panel")
+            
+            # Send with management buttons
+            view = RulesManagementView()
+            await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
+        else:
+            # Non-organizer gets direct rule display
+            await display_rules(interaction)
+            
+    except Exception as e:
+        log.exception("Error in rules command: %s", e)
+        await interaction.response.send_message("❌ An error occurred while processing the rules command.", ephemeral=True)
+
+# ===========================================================================================
+# EXTENSION SETUP
+# ===========================================================================================
+
+async def setup(bot: commands.Bot):
+    add_extension_commands(globals())
+
+async def teardown(bot: commands.Bot):
+    remove_extension_commands(globals())
@@ -0,0 +1,400 @@
+"""Utility commands, ? prefix commands and the bot footprint report"""
+import discord
+from discord import app_commands
+from discord.ext import commands
+import datetime
+import asyncio
+import math
+
+from config import BOT_OWNER_ID, ORGANIZATION_NAME
+from utils.bot import add_extension_commands, bot, build_footprint_report, remove_extension_commands
+from utils.balance import (
+    balance_two_teams,
+    parse_player_groups,
+    parse_team_balance_players,
+    TEAM_BALANCE_DEFAULT_BUDGET_MS,
+    TEAM_BALANCE_MAX_BUDGET_MS,
+    TEAM_BALANCE_MAX_TEAMS,
+    TeamBalancer,
+)
+from utils.outbound import outbound_queue
+from utils.permissions import has_event_result_permission, has_organizer_permission
+from utils.rename_queue import channel_rename_queue, STATUS_PREFIXES
+from utils.responders import custom_responders, normalize_trigger, save_custom_responders
+
+@app_commands.command(name="footprint", description="Show memory and gateway event volume (Bot Owner only)")
+async def footprint(interaction: discord.Interaction):
+    """Report memory use, cache sizes and gateway event counts."""
+    if interaction.user.id != BOT_OWNER_ID:
+        await interaction.response.send_message("❌ Only the bot owner can view the footprint report.", ephemeral=True)
+        return
+    await interaction.response.send_message(embed=build_footprint_report(), ephemeral=True)
+
+@app_commands.command(name="rename_queue", description="Show pending ticket status renames (Organizer/Judge only)")
+async def rename_queue(interaction: discord.Interaction):
+    """Show queue depth and when each pending status rename will be applied."""
+    if not (has_organizer_permission(interaction) or has_event_result_permission(interaction)):
+        await interaction.response.send_message("❌ You need **Organizer** or **Judge** role to view the rename queue.", ephemeral=True)
+        return
+
+    embed = discord.Embed(
+        title="🏷️ Channel Rename Queue",
+        description=f"**Pending channels:** {channel_rename_queue.depth()}",
+        color=discord.Color.blue(),
+        timestamp=discord.utils.utcnow()
+    )
+    lines = []
+    for channel_id, entry in list(channel_rename_queue.pending.items())[:20]:
+        delay = channel_rename_queue.delay_for(channel_id)
+        eta = "now" if delay <= 0 else f"in {math.ceil(delay / 60)} min"
+        lines.append(f"<#{channel_id}> → {entry['prefix']} • {len(entry['messages'])} request(s) • {eta}")
+    if lines:
+        embed.add_field(name="Pending", value="\n".join(lines)[:1024], inline=False)
+    embed.add_field(
+        name="Totals",
+        value=(
+            f"Applied: {channel_rename_queue.applied} • Coalesced: {channel_rename_queue.coalesced} • "
+            f"Already set: {channel_rename_queue.skipped}"
+        ),
+        inline=False
+    )
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+# Built-in handlers, {trigger: async handler(message, command)}
+prefix_commands = {}
+
+async def handle_status_command(message: discord.Message, command: str):
+    """Queue a ticket status prefix change for the channel"""
+    delay = channel_rename_queue.request(message.channel, STATUS_PREFIXES[command], message)
+    # Acknowledge straight away; the message is deleted once the rename is applied
+    try:
+        await message.add_reaction("✅" if delay <= 0 else "⏳")
+    except Exception:
+        pass
+
+async def send_custom_responder(message: discord.Message, responder: dict):
+    """Reply with an organizer-defined text or embed response"""
+    if responder.get('type') == 'embed':
+        embed = discord.Embed(
+            title=responder.get('title') or None,
+            description=responder.get('content', ''),
+            color=responder.get('color', discord.Color.blue().value)
+        )
+        embed.set_footer(text=f"Powered by • {ORGANIZATION_NAME}")
+        await outbound_queue.send(message.channel, embed=embed)
+    else:
+        await outbound_queue.send(message.channel, content=responder.get('content', ''))
+
+    if responder.get('delete_trigger', True):
+        # Not awaited: trigger deletes queued in the same channel are bulk deleted together
+        outbound_queue.delete(message)
+
+for _status_command in STATUS_PREFIXES:
+    prefix_commands[_status_command] = handle_status_command
+
+@app_commands.command(name="responder", description="Manage custom ? command responders (Organizer only)")
+@app_commands.describe(
+    action="What to do",
+    trigger="Command that triggers the response (e.g. ?b or ?rules)",
+    response="Text to reply with (embed description when an embed title is set)",
+    embed_title="Reply with an embed using this title (optional)",
+    embed_color="Embed color as hex, e.g. #3498db (optional)",
+    delete_trigger="Delete the triggering message after replying (default: yes)"
+)
+@app_commands.choices(action=[
+    app_commands.Choice(name="Add / Update", value="set"),
+    app_commands.Choice(name="Remove", value="remove"),
+    app_commands.Choice(name="List", value="list"),
+])
+async def responder(
+    interaction: discord.Interaction,
+    action: app_commands.Choice[str],
+    trigger: str = None,
+    response: str = None,
+    embed_title: str = None,
+    embed_color: str = None,
+    delete_trigger: bool = True
+):
+    """Add, remove or list organizer-defined ? responders without a redeploy."""
+    if not has_organizer_permission(interaction):
+        await interaction.response.send_message("❌ You need **Organizer** role to manage responders.", ephemeral=True)
+        return
+
+    if action.value == "list":
+        lines = []
+        for name in sorted(custom_responders):
+            entry = custom_responders[name]
+            preview = (entry.get('title') or entry.get('content', ''))[:60]
+            lines.append(f"`{name}` • {entry.get('type', 'text')} • {preview}")
+        embed = discord.Embed(
+            title="💬 Custom Responders",
+            description="\n".join(lines)[:4000] if lines else "No custom responders defined.",
+            color=discord.Color.blue()
+        )
+        embed.add_field(name="Built-in", value=" ".join(f"`{name}`" for name in prefix_commands), inline=False)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+        return
+
+    if not trigger:
+        await interaction.response.send_message("❌ Please provide a trigger.", ephemeral=True)
+        return
+    trigger = normalize_trigger(trigger)
+    if len(trigger) < 2 or any(ch.isspace() for ch in trigger):
+        await interaction.response.send_message("❌ Triggers must be a single word such as `?b`.", ephemeral=True)
+        return
+    if trigger in prefix_commands:
+        await interaction.response.send_message(f"❌ `{trigger}` is a built-in command and cannot be overridden.", ephemeral=True)
+        return
+
+    if action.value == "remove":
+        if custom_responders.pop(trigger, None) is None:
+            await interaction.response.send_message(f"❌ No responder named `{trigger}`.", ephemeral=True)
+            return
+        save_custom_responders()
+        await interaction.response.send_message(f"✅ Removed responder `{trigger}`.", ephemeral=True)
+        return
+
+    if not response:
+        await interaction.response.send_message("❌ Please provide the response text.", ephemeral=True)
+        return
+    color = discord.Color.blue().value
+    if embed_color:
+        try:
+            color = int(embed_color.strip().lstrip('#'), 16)
+        except ValueError:
+            await interaction.response.send_message("❌ Invalid color. Use hex such as `#3498db`.", ephemeral=True)
+            return
+
+    custom_responders[trigger] = {
+        'type': 'embed' if embed_title else 'text',
+        'content': response,
+        'title': embed_title,
+        'color': color,
+        'delete_trigger': delete_trigger,
+        'created_by': interaction.user.id,
+        'created_at': datetime.datetime.utcnow().isoformat()
+    }
+    save_custom_responders()
+    await interaction.response.send_message(f"✅ Responder `{trigger}` saved.", ephemeral=True)
+
+async def on_message(message):
+    """Dispatch ? commands through the prefix registry (added as a listener in setup, so Bot.on_message still processes commands)"""
+    # Ignore non-command traffic before doing any other work
+    if not message.content.startswith('?') or message.author == bot.user:
+        return
+    
+    # Commands match the whole message, e.g. "?sh"
+    command = message.content.strip().lower()
+    
+    handler = prefix_commands.get(command)
+    if handler:
+        await handler(message, command)
+    else:
+        custom = custom_responders.get(command)
+        if custom:
+            await send_custom_responder(message, custom)
+
+@app_commands.command(name="team_balance", description="Balance players into 2-8 teams based on player levels")
+@app_commands.describe(
+    levels="Comma-separated levels, name:level entries or @mentions for ratings (e.g. 48,50 or Ann:48)",
+    teams="Number of teams (2-8, default 2)",
+    together="Players to keep on one team, e.g. 1&2, Ann&Bob",
+    apart="Players to keep on different teams, e.g. 3&4",
+    captains="One player per team to pin as captain, e.g. 1&5&9",
+    max_size_diff="Largest allowed difference in team sizes (default 0 for 2 teams, otherwise 1)",
+    time_budget_ms="Search time budget in milliseconds (default 1000)"
+)
+async def team_balance(
+    interaction: discord.Interaction,
+    levels: str,
+    teams: app_commands.Range[int, 2, TEAM_BALANCE_MAX_TEAMS] = 2,
+    together: str = None,
+    apart: str = None,
+    captains: str = None,
+    max_size_diff: app_commands.Range[int, 0, 10] = None,
+    time_budget_ms: app_commands.Range[int, 50, TEAM_BALANCE_MAX_BUDGET_MS] = TEAM_BALANCE_DEFAULT_BUDGET_MS
+):
+    try:
+        names, level_list = parse_team_balance_players(levels)
+        together_groups = parse_player_groups(together, names)
+        apart_groups = parse_player_groups(apart, names)
+        captain_groups = parse_player_groups(captains, names)
+        captain_list = [player for group in captain_groups for player in group]
+        if max_size_diff is None:
+            max_size_diff = 0 if teams == 2 else 1
+        constrained = together_groups or apart_groups or captain_list
+
+        if teams == 2 and not constrained and max_size_diff == 0:
+            # Unconstrained two-team split keeps the exact DP
+            n = len(level_list)
+            if n % 2 != 0:
+                await interaction.response.send_message("❌ Number of players must be even (e.g., 8 or 10).", ephemeral=True)
+                return
+
+            # Run the balancer off the event loop
+            best_team_a, team_b = await asyncio.to_thread(balance_two_teams, level_list)
+            sum_a = sum(best_team_a)
+            sum_b = sum(team_b)
+            diff = abs(sum_a - sum_b)
+            if any(name != f"P{i}" for i, name in enumerate(names, start=1)):
+                # Show named or mentioned players instead of bare levels
+                by_level = {}
+                for name, level in zip(names, level_list):
+                    by_level.setdefault(level, []).append(name)
+                best_team_a = [f"{by_level[level].pop()} ({level})" for level in best_team_a]
+                team_b = [f"{by_level[level].pop()} ({level})" for level in team_b]
+                best_team_a, team_b = ", ".join(best_team_a), ", ".join(team_b)
+            await interaction.response.send_message(
+                f"**Team A:** {best_team_a} | Total Level: {sum_a}\n"
+                f"**Team B:** {team_b} | Total Level: {sum_b}\n"
+                f"**Level Difference:** {diff}",
+                ephemeral=True
+            )
+            return
+
+        balancer = TeamBalancer(
+            level_list, teams,
+            together=together_groups,
+            apart=apart_groups,
+            captains=captain_list,
+            max_size_diff=max_size_diff
+        )
+        await interaction.response.defer(ephemeral=True)
+        result = await asyncio.to_thread(balancer.solve, time_budget_ms / 1000)
+
+        captain_set = set(captain_list)
+        lines = []
+        for number, (members, total) in enumerate(zip(result["teams"], result["sums"])):
+            roster = ", ".join(
+                f"{'👑 ' if p in captain_set else ''}{names[p]} ({level_list[p]})" for p in members
+            )
+            lines.append(f"**Team {chr(ord('A') + number)}** ({len(members)} players, Total Level: {total})\n{roster}")
+
+        if result["gap"] == 0:
+            gap_text = "0 (optimal)"
+        else:
+            gap_text = f"{result['gap']} (lower bound {result['lower_bound']})"
+        summary = (
+            f"**Level Spread:** {result['spread']} | **Optimality Gap:** {gap_text}\n"
+            f"Searched {result['iterations']} steps, {result['restarts']} restarts in {result['elapsed'] * 1000:.0f} ms"
+        )
+        if result["violations"]:
+            summary += f"\n⚠️ {result['violations']} constraint(s) could not be satisfied"
+        await interaction.followup.send("\n\n".join(lines) + "\n\n" + summary, ephemeral=True)
+    except Exception as e:
+        if interaction.response.is_done():
+            await interaction.followup.send(f"❌ Error: {e}", ephemeral=True)
+        else:
+            await interaction.response.send_message(f"❌ Error: {e}", ephemeral=True)
+
+## Removed test-poster command per request
+
+@app_commands.command(name="maps", description="Randomly select 3, 5, or 7 maps for gameplay")
+@app_commands.describe(
+    count="Number of maps to select (3, 5, or 7)"
+)
+async def maps(interaction: discord.Interaction, count: int):
+    """Randomly selects 3, 5, or 7 maps from the available map pool"""
+    
+    import random
+    
+    # Predefined map list
+    maps_list = [
+        "New Storm (2024)",
+        "Arid Frontier", 
+        "Islands of Iceland",
+        "Unexplored Rocks",
+        "Arctic",
+        "Lost City",
+        "Polar Frontier",
+        "Hidden Dragon",
+        "Monstrous Maelstrom",
+        "Two Samurai",
+        "Stone Peaks",
+        "Viking Bay",
+        "Greenlands",
+        "Old Storm"
+    ]
+    
+    # Validate count
+    if count not in [3, 5, 7]:
+        await interaction.response.send_message("❌ Please select 3, 5, or 7 maps only.", ephemeral=True)
+        return
+    
+    # Randomly select the specified number of maps
+    selected_maps = random.sample(maps_list, count)
+    
+    embed = discord.Embed(
+        title=f"🗺️ Random Map Selection {ORGANIZATION_NAME}",
+        description=f"**Randomly selected {count} map(s):**",
+        color=discord.Color.green(),
+        timestamp=discord.utils.utcnow()
+    )
+    
+    # Add selected maps as a field
+    selected_maps_text = "\n".join([f"• {map_name}" for map_name in selected_maps])
+    embed.add_field(
+        name=f"🎯 Selected Maps ({count})",
+        value=selected_maps_text,
+        inline=False
+    )
+    
+    embed.set_footer(text=f"Powered by • {ORGANIZATION_NAME}")
+    await interaction.response.send_message(embed=embed)
+
+
+@app_commands.command(name="choose", description="Randomly choose from a list of options")
+@app_commands.describe(
+    options="List of options separated by commas"
+)
+async def choose(interaction: discord.Interaction, options: str):
+    """Randomly selects one option from a comma-separated list"""
+    
+    import random
+    
+    # Handle comma-separated options (original functionality)
+    option_list = [option.strip() for option in options.split(',') if option.strip()]
+    
+    # Validate input
+    if len(option_list) < 2:
+        await interaction.response.send_message("❌ Please provide at least 2 options separated by commas.", ephemeral=True)
+        return
+    
+    if len(option_list) > 20:
+        await interaction.response.send_message("❌ Too many options! Please provide 20 or fewer options.", ephemeral=True)
+        return
+    
+    # Randomly select one option
+    chosen_option = random.choice(option_list)
+    
+    # Create embed
+    embed = discord.Embed(
+        title="🎲 Random Choice",
+        description=f"**Selected:** {chosen_option}",
+        color=discord.Color.gold(),
+        timestamp=discord.utils.utcnow()
+    )
+    
+    # Add all options as a field
+    options_text = "\n".join([f"• {option}" for option in option_list])
+    embed.add_field(
+        name=f"📋 Available Options ({len(option_list)})",
+        value=options_text,
+        inline=False
+    )
+    
+    embed.set_footer(text=f"Powered by • {ORGANIZATION_NAME}")
+    
+    await interaction.response.send_message(embed=embed)
+
+# ===========================================================================================
+# EXTENSION SETUP
+# ===========================================================================================
+
+async def setup(bot: commands.Bot):
+    add_extension_commands(globals())
+    bot.add_listener(on_message)
+
+async def teardown(bot: commands.Bot):
+    remove_extension_commands(globals())
+    bot.remove_listener(on_message)
@@ -0,0 +1,247 @@
+"""Staff attendance records and the live per-judge digest messages"""
+import discord
+import os
+import logging
+import datetime
+import asyncio
+import json
+from typing import Optional
+
+from config import CHANNEL_IDS, ORGANIZATION_NAME
+from utils.bot import resolve_channel
+from utils.log_utils import set_log_context
+from utils.outbound import outbound_queue, PRIORITY_LOG
+
+log = logging.getLogger(__name__)
+
+# ===========================================================================================
+# STAFF ATTENDANCE (one record per judged match, one live digest per judge per day/tournament)
+# ===========================================================================================
+
+ATTENDANCE_FILE = os.getenv("ATTENDANCE_FILE", "staff_attendance.json")
+# "day": one digest message per judge per UTC day; "tournament": one per judge per tournament
+ATTENDANCE_DIGEST_SCOPE = os.getenv("ATTENDANCE_DIGEST_SCOPE", "day").lower()
+# Seconds to collect results before the touched digests are edited; a busy judge costs one edit per interval
+ATTENDANCE_DIGEST_INTERVAL = float(os.getenv("ATTENDANCE_DIGEST_INTERVAL", "60"))
+ATTENDANCE_DIGEST_MAX_LINES = 40  # Keeps a digest embed well under Discord's description limit
+
+# [{'event_id', 'judge_id', 'judge_name', 'winner_id', 'winner_name', 'winner_score', 'loser_id', 'loser_name',
+#   'loser_score', 'tournament', 'round', 'group', 'date', 'recorded_at', 'warnings'}]
+attendance_records = []
+# {digest_key: {'channel_id': int, 'message_id': int}} for the live digest messages
+attendance_digests = {}
+
+# Indexes into attendance_records
+attendance_by_judge = {}  # {judge_id: [record index]}
+attendance_by_event = {}  # {event_id: record index}, so a re-posted result replaces its record
+
+attendance_dirty = set()  # Digest keys waiting for the next flush; saved with the records so a restart keeps them
+attendance_flush_task = None
+
+def _index_record(index: int):
+    record = attendance_records[index]
+    attendance_by_judge.setdefault(record['judge_id'], []).append(index)
+    if record.get('event_id'):
+        attendance_by_event[record['event_id']] = index
+
+def load_attendance():
+    """Load attendance records, digest message IDs and pending digests, then rebuild the indexes"""
+    attendance_records.clear()
+    attendance_digests.clear()
+    attendance_dirty.clear()
+    try:
+        if os.path.exists(ATTENDANCE_FILE):
+            with open(ATTENDANCE_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            attendance_records.extend(data.get('records', []))
+            attendance_digests.update(data.get('digests', {}))
+            attendance_dirty.update(data.get('pending', []))
+    except Exception as e:
+        log.error("Error loading staff attendance: %s", e)
+        attendance_records.clear()
+        attendance_digests.clear()
+        attendance_dirty.clear()
+    attendance_by_judge.clear()
+    attendance_by_event.clear()
+    for index in range(len(attendance_records)):
+        _index_record(index)
+    log.info("Loaded %s attendance record(s), %s digest(s) pending", len(attendance_records), len(attendance_dirty))
+    if attendance_dirty:
+        # Results recorded just before the last shutdown still reach their digests
+        ensure_attendance_flush()
+
+def save_attendance():
+    """Persist attendance records, digest message IDs and the digests still waiting for a flush"""
+    try:
+        temp_path = f"{ATTENDANCE_FILE}.tmp"
+        data = {'records': attendance_records, 'digests': attendance_digests, 'pending': sorted(attendance_dirty)}
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        os.replace(temp_path, ATTENDANCE_FILE)
+    except Exception as e:
+        log.error("Error saving staff attendance: %s", e)
+
+def digest_key(record: dict) -> str:
+    """The digest a record belongs to: its judge plus the day or tournament"""
+    if ATTENDANCE_DIGEST_SCOPE == "tournament":
+        return f"{record['judge_id']}|{record['tournament'].strip().lower()}"
+    return f"{record['judge_id']}|{record['date']}"
+
+def record_attendance(judge: discord.abc.User, winner: discord.abc.User, loser: discord.abc.User,
+                      winner_score: int, loser_score: int, tournament: str, round: str,
+                      group: Optional[str] = None, event_id: Optional[str] = None,
+                      warnings: Optional[list] = None) -> dict:
+    """Store one judged match and queue its digest for the next coalesced edit"""
+    now = datetime.datetime.utcnow()
+    record = {
+        'event_id': event_id,
+        'judge_id': judge.id,
+        'judge_name': judge.display_name,
+        'winner_id': winner.id,
+        'winner_name': winner.display_name,
+        'winner_score': winner_score,
+        'loser_id': loser.id,
+        'loser_name': loser.display_name,
+        'loser_score': loser_score,
+        'tournament': tournament,
+        'round': round,
+        'group': group,
+        'date': now.date().isoformat(),
+        'recorded_at': now.isoformat(),
+        'warnings': list(warnings or []),
+    }
+
+    index = attendance_by_event.get(event_id) if event_id else None
+    if index is not None:
+        # A corrected result replaces the earlier record; both digests are refreshed if the judge changed
+        previous = attendance_records[index]
+        attendance_dirty.add(digest_key(previous))
+        if previous['judge_id'] != judge.id:
+            attendance_by_judge[previous['judge_id']].remove(index)
+            attendance_by_judge.setdefault(judge.id, []).append(index)
+        record['date'] = previous['date']
+        attendance_records[index] = record
+    else:
+        attendance_records.append(record)
+        _index_record(len(attendance_records) - 1)
+
+    attendance_dirty.add(digest_key(record))
+    save_attendance()
+    ensure_attendance_flush()
+    return record
+
+def query_attendance(judge_id: Optional[int] = None, date: Optional[datetime.date] = None,
+                     tournament: Optional[str] = None) -> list[dict]:
+    """Attendance records matching every given filter, oldest first"""
+    if judge_id is not None:
+        records = [attendance_records[index] for index in attendance_by_judge.get(judge_id, ())]
+    else:
+        records = list(attendance_records)
+    if date is not None:
+        day = date.isoformat()
+        records = [record for record in records if record['date'] == day]
+    if tournament:
+        wanted = tournament.strip().lower()
+        records = [record for record in records if record['tournament'].strip().lower() == wanted]
+    return sorted(records, key=lambda record: record['recorded_at'])
+
+def _digest_records(key: str) -> list[dict]:
+    judge_id = int(key.split('|', 1)[0])
+    return [
+        attendance_records[index] for index in sorted(attendance_by_judge.get(judge_id, ()))
+        if digest_key(attendance_records[index]) == key
+    ]
+
+def format_attendance_line(record: dict) -> str:
+    where = record['round'] + (f" • {record['group']}" if record.get('group') else "")
+    line = (
+        f"• **{where}** — 🏆 {record['winner_name']} ({record['winner_score']}) Vs "
+        f"({record['loser_score']}) {record['loser_name']} 💀"
+    )
+    if record.get('warnings'):
+        line += f" 🔍 {len(record['warnings'])} possible reused screenshot(s)"
+    return line
+
+def build_digest_embed(key: str) -> Optional[discord.Embed]:
+    """The digest embed for one judge and day/tournament, or None once it has no records"""
+    records = _digest_records(key)
+    if not records:
+        return None
+    latest = records[-1]
+    if ATTENDANCE_DIGEST_SCOPE == "tournament":
+        scope = f"**Tournament:** {latest['tournament']}"
+    else:
+        scope = f"**Date:** {datetime.date.fromisoformat(latest['date']).strftime('%d/%m/%Y')}"
+
+    lines = [format_attendance_line(record) for record in records]
+    if len(lines) > ATTENDANCE_DIGEST_MAX_LINES:
+        hidden = len(lines) - ATTENDANCE_DIGEST_MAX_LINES
+        lines = [f"… {hidden} earlier match(es) not shown"] + lines[-ATTENDANCE_DIGEST_MAX_LINES:]
+
+    embed = discord.Embed(
+        title=f"🏅 Staff Attendance — {latest['judge_name']}",
+        description=f"{scope}\n**Judge:** <@{latest['judge_id']}>\n\n" + "\n".join(lines),
+        color=discord.Color.gold(),
+        timestamp=discord.utils.utcnow()
+    )
+    flagged = sum(1 for record in records if record.get('warnings'))
+    footer = f"{len(records)} match(es) judged"
+    if flagged:
+        footer += f" • {flagged} flagged"
+    embed.set_footer(text=f"{footer} • {ORGANIZATION_NAME}")
+    return embed
+
+def ensure_attendance_flush():
+    """Start the coalescing digest flusher if it is not already waiting"""
+    global attendance_flush_task
+    if attendance_flush_task is None or attendance_flush_task.done():
+        attendance_flush_task = asyncio.create_task(_attendance_flush_loop())
+
+async def _attendance_flush_loop():
+    # Results posted during the wait are folded into the same edit
+    set_log_context(command="attendance_digest")
+    while attendance_dirty:
+        await asyncio.sleep(ATTENDANCE_DIGEST_INTERVAL)
+        try:
+            await flush_attendance_digests()
+        except Exception as e:
+            log.exception("Error flushing attendance digests: %s", e)
+
+async def flush_attendance_digests() -> int:
+    """Edit (or post) every digest touched since the last flush; returns how many were flushed"""
+    channel = resolve_channel(CHANNEL_IDS["staff_attendance"])
+    if channel is None:
+        # The keys stay dirty, so the flush loop tries again after the next interval
+        log.warning("⚠️ Could not find Staff Attendance channel.")
+        return 0
+    keys = list(attendance_dirty)
+    attendance_dirty.clear()
+
+    async def flush_one(key: str):
+        embed = build_digest_embed(key)
+        entry = attendance_digests.get(key)
+        if embed is None:
+            # Its only match moved to another judge
+            if entry:
+                attendance_digests.pop(key, None)
+                if entry.get('channel_id') == channel.id:
+                    outbound_queue.delete(channel.get_partial_message(entry['message_id']))
+            return
+        if entry and entry.get('channel_id') == channel.id:
+            # Editing needs only the message ID, so the digest is never fetched
+            try:
+                await outbound_queue.edit(channel.get_partial_message(entry['message_id']), PRIORITY_LOG, embed=embed)
+                return
+            except discord.NotFound:
+                log.warning("Attendance digest %s was deleted, posting a new one", key)
+        message = await outbound_queue.send(channel, PRIORITY_LOG, embed=embed)
+        attendance_digests[key] = {'channel_id': channel.id, 'message_id': message.id}
+
+    results = await asyncio.gather(*(flush_one(key) for key in keys), return_exceptions=True)
+    for key, result in zip(keys, results):
+        if isinstance(result, Exception):
+            # Retried on the next flush
+            attendance_dirty.add(key)
+            log.error("Error updating attendance digest %s: %s", key, result)
+    save_attendance()
+    return len(keys)
@@ -0,0 +1,326 @@
+"""Team balancing solvers"""
+from time import perf_counter
+import random
+from typing import Optional
+import re
+import heapq
+
+from utils.ratings import get_player_rating
+
+# Upper bound on the shifted level total, keeping the DP bitsets to a few MB
+TEAM_BALANCE_MAX_TOTAL = 100_000
+
+def balance_two_teams(levels: list[int]) -> tuple[list[int], list[int]]:
+    """Split an even number of integer levels into two equal-size teams with the smallest level difference.
+
+    Exact cardinality-constrained subset-sum DP: reach[i][k] is a bitset of the sums reachable
+    with k of the first i players, so the cost is O(n² · total / word size) instead of
+    enumerating every combination.
+    """
+    n = len(levels)
+    half = n // 2
+    # Shift levels to be non-negative; both teams have `half` players so the difference is unchanged
+    offset = min(0, min(levels, default=0))
+    values = [level - offset for level in levels]
+    total = sum(values)
+    if total > TEAM_BALANCE_MAX_TOTAL:
+        raise ValueError(f"Total level {total} is too large to balance (max {TEAM_BALANCE_MAX_TOTAL})")
+
+    reach = [[1] + [0] * half]
+    for i, value in enumerate(values):
+        previous = reach[-1]
+        current = previous[:]
+        for k in range(1, min(i + 1, half) + 1):
+            current[k] |= previous[k - 1] << value
+        reach.append(current)
+
+    # The complement of a half-size team is also a half-size team, so the best split
+    # is the largest reachable sum not above total / 2
+    best_sum = (reach[n][half] & ((1 << (total // 2 + 1)) - 1)).bit_length() - 1
+
+    # Walk the table backwards to recover which players make up that sum
+    in_team_a = [False] * n
+    k, remaining = half, best_sum
+    for i in range(n, 0, -1):
+        value = values[i - 1]
+        if k > 0 and remaining >= value and (reach[i - 1][k - 1] >> (remaining - value)) & 1:
+            in_team_a[i - 1] = True
+            k -= 1
+            remaining -= value
+
+    team_a = [level for level, chosen in zip(levels, in_team_a) if chosen]
+    team_b = [level for level, chosen in zip(levels, in_team_a) if not chosen]
+    return team_a, team_b
+
+# ==================== MULTI-TEAM BALANCING ====================
+
+TEAM_BALANCE_MAX_TEAMS = 8
+TEAM_BALANCE_DEFAULT_BUDGET_MS = 1000
+TEAM_BALANCE_MAX_BUDGET_MS = 10_000
+# Cost added per broken constraint, far above any achievable level spread
+TEAM_BALANCE_PENALTY = 1_000_000
+
+def karmarkar_karp_partition(weights: list[int], k: int) -> list[list[int]]:
+    """Split item indices into k groups with the largest differencing method.
+
+    Each item starts as a k-tuple of partial sums; the two tuples with the widest spread
+    are repeatedly merged by pairing the heaviest part of one with the lightest of the other.
+    """
+    heap = []
+    for index, weight in enumerate(weights):
+        parts = [(weight, [index])] + [(0, []) for _ in range(k - 1)]
+        parts.sort(key=lambda part: -part[0])
+        heapq.heappush(heap, (-(parts[0][0] - parts[-1][0]), index, parts))
+    counter = len(weights)
+    while len(heap) > 1:
+        _, _, first = heapq.heappop(heap)
+        _, _, second = heapq.heappop(heap)
+        merged = [
+            (first[i][0] + second[k - 1 - i][0], first[i][1] + second[k - 1 - i][1])
+            for i in range(k)
+        ]
+        merged.sort(key=lambda part: -part[0])
+        heapq.heappush(heap, (-(merged[0][0] - merged[-1][0]), counter, merged))
+        counter += 1
+    if not heap:
+        return [[] for _ in range(k)]
+    return [items for _, items in heap[0][2]]
+
+class TeamBalancer:
+    """Constrained k-team balancer: Karmarkar-Karp seed, then move/swap local search under a time budget.
+
+    Players kept together are merged into blocks that move as one unit; captains pin their
+    block to a team. The objective is the level spread (strongest minus weakest team) plus a
+    penalty for every broken "apart" group and for team sizes differing by more than allowed.
+    """
+
+    def __init__(self, levels, k, together=(), apart=(), captains=(), max_size_diff=1, seed=None):
+        if not 2 <= k <= TEAM_BALANCE_MAX_TEAMS:
+            raise ValueError(f"Team count must be between 2 and {TEAM_BALANCE_MAX_TEAMS}")
+        if len(levels) < k:
+            raise ValueError(f"Need at least {k} players for {k} teams")
+        if len(captains) > k:
+            raise ValueError(f"At most {k} captains can be pinned for {k} teams")
+        self.levels = list(levels)
+        self.k = k
+        self.max_size_diff = max(0, max_size_diff)
+        self.random = random.Random(seed)
+
+        # Union "together" groups into blocks
+        parent = list(range(len(levels)))
+
+        def find(player):
+            while parent[player] != player:
+                parent[player] = parent[parent[player]]
+                player = parent[player]
+            return player
+
+        for group in together:
+            for player in group[1:]:
+                parent[find(player)] = find(group[0])
+        roots = {}
+        self.blocks = []
+        for player in range(len(levels)):
+            root = find(player)
+            if root not in roots:
+                roots[root] = len(self.blocks)
+                self.blocks.append([])
+            self.blocks[roots[root]].append(player)
+        self.block_of = [roots[find(player)] for player in range(len(levels))]
+        self.block_weight = [sum(self.levels[p] for p in block) for block in self.blocks]
+        self.block_size = [len(block) for block in self.blocks]
+
+        self.pinned = {}
+        for team, captain in enumerate(captains):
+            block = self.block_of[captain]
+            if block in self.pinned:
+                raise ValueError("Two captains are required to play together")
+            self.pinned[block] = team
+        self.movable = [b for b in range(len(self.blocks)) if b not in self.pinned]
+
+        # "Apart" groups reference blocks; a group inside one block can never be satisfied
+        self.apart = []
+        for group in apart:
+            blocks = [self.block_of[p] for p in group]
+            if len(set(blocks)) < len(blocks):
+                raise ValueError("A player group is required to be both together and apart")
+            if len(blocks) > k:
+                raise ValueError(f"Cannot keep {len(blocks)} players apart across {k} teams")
+            pinned_teams = [self.pinned[b] for b in blocks if b in self.pinned]
+            if len(set(pinned_teams)) < len(pinned_teams):
+                raise ValueError("Captains on the same team cannot be kept apart")
+            self.apart.append(blocks)
+
+    def lower_bound(self) -> int:
+        """Lower bound on the level spread of any split, used to report the optimality gap."""
+        total = sum(self.levels)
+        bound = 0 if total % self.k == 0 else 1
+        # A team holding the heaviest block outweighs the best case for the lightest team
+        heaviest = max(self.block_weight)
+        bound = max(bound, heaviest - (total - heaviest) // (self.k - 1))
+        pinned_sums = [0] * self.k
+        for block, team in self.pinned.items():
+            pinned_sums[team] += self.block_weight[block]
+        for pinned in pinned_sums:
+            bound = max(bound, pinned - (total - pinned) // (self.k - 1))
+        return bound
+
+    def initial_assignment(self) -> list[int]:
+        """Seed with Karmarkar-Karp over free blocks, giving the heaviest groups to the lightest pinned teams."""
+        assignment = [0] * len(self.blocks)
+        pinned_sums = [0] * self.k
+        for block, team in self.pinned.items():
+            assignment[block] = team
+            pinned_sums[team] += self.block_weight[block]
+        groups = karmarkar_karp_partition([self.block_weight[b] for b in self.movable], self.k)
+        groups.sort(key=lambda items: -sum(self.block_weight[self.movable[i]] for i in items))
+        teams = sorted(range(self.k), key=lambda team: pinned_sums[team])
+        for team, items in zip(teams, groups):
+            for i in items:
+                assignment[self.movable[i]] = team
+        return assignment
+
+    def violations(self, assignment, sizes) -> int:
+        """Number of broken constraints for an assignment."""
+        broken = max(0, max(sizes) - min(sizes) - self.max_size_diff)
+        for blocks in self.apart:
+            broken += len(blocks) - len({assignment[b] for b in blocks})
+        return broken
+
+    def cost(self, assignment, sums, sizes) -> int:
+        return max(sums) - min(sums) + TEAM_BALANCE_PENALTY * self.violations(assignment, sizes)
+
+    def _try_move(self, assignment, sums, sizes, block, team, current):
+        """Move a block to a team if that lowers the cost; returns the new cost or None."""
+        origin = assignment[block]
+        weight, size = self.block_weight[block], self.block_size[block]
+        assignment[block] = team
+        sums[origin] -= weight; sums[team] += weight
+        sizes[origin] -= size; sizes[team] += size
+        cost = self.cost(assignment, sums, sizes)
+        if cost < current:
+            return cost
+        assignment[block] = origin
+        sums[origin] += weight; sums[team] -= weight
+        sizes[origin] += size; sizes[team] -= size
+        return None
+
+    def _improve(self, assignment, sums, sizes, current, deadline):
+        """Apply the first improving move or swap; returns the new cost or None at a local optimum."""
+        order = self.movable[:]
+        self.random.shuffle(order)
+        for block in order:
+            for team in range(self.k):
+                if team != assignment[block]:
+                    cost = self._try_move(assignment, sums, sizes, block, team, current)
+                    if cost is not None:
+                        return cost
+        for i, first in enumerate(order):
+            if perf_counter() > deadline:
+                return None
+            for second in order[i + 1:]:
+                team_a, team_b = assignment[first], assignment[second]
+                if team_a == team_b:
+                    continue
+                # A swap is two moves; only keep it if the pair together improves
+                self._try_move(assignment, sums, sizes, first, team_b, float("inf"))
+                cost = self._try_move(assignment, sums, sizes, second, team_a, current)
+                if cost is not None:
+                    return cost
+                self._try_move(assignment, sums, sizes, first, team_a, float("inf"))
+        return None
+
+    def solve(self, time_budget: float) -> dict:
+        """Search for the best split within time_budget seconds."""
+        started = perf_counter()
+        deadline = started + time_budget
+        bound = self.lower_bound()
+        assignment = self.initial_assignment()
+        sums = [0] * self.k
+        sizes = [0] * self.k
+        for block, team in enumerate(assignment):
+            sums[team] += self.block_weight[block]
+            sizes[team] += self.block_size[block]
+        current = self.cost(assignment, sums, sizes)
+        best, best_cost = assignment[:], current
+        iterations = restarts = 0
+
+        while perf_counter() < deadline and best_cost > bound:
+            cost = self._improve(assignment, sums, sizes, current, deadline)
+            iterations += 1
+            if cost is not None:
+                current = cost
+                if current < best_cost:
+                    best, best_cost = assignment[:], current
+                continue
+            if not self.movable:
+                break
+            # Local optimum: perturb with a few random moves and keep searching
+            restarts += 1
+            for _ in range(max(1, len(self.movable) // 4)):
+                block = self.random.choice(self.movable)
+                self._try_move(assignment, sums, sizes, block, self.random.randrange(self.k), float("inf"))
+            current = self.cost(assignment, sums, sizes)
+
+        teams = [[] for _ in range(self.k)]
+        for block, team in enumerate(best):
+            teams[team].extend(self.blocks[block])
+        for members in teams:
+            members.sort()
+        team_sums = [sum(self.levels[p] for p in members) for members in teams]
+        final_sizes = [len(members) for members in teams]
+        spread = max(team_sums) - min(team_sums)
+        broken = self.violations(best, final_sizes)
+        return {
+            "teams": teams,
+            "sums": team_sums,
+            "spread": spread,
+            "lower_bound": bound,
+            "gap": spread - bound,
+            "violations": broken,
+            "iterations": iterations,
+            "restarts": restarts,
+            "elapsed": perf_counter() - started,
+        }
+
+MENTION_PATTERN = re.compile(r"<@!?(\d+)>")
+
+def parse_team_balance_players(text: str) -> tuple[list[str], list[int]]:
+    """Parse "name:level", bare level or @mention entries; unnamed players are labelled P1, P2, ...
+
+    Mentioned players use their stored rating as their level.
+    """
+    names, levels = [], []
+    for position, entry in enumerate((x.strip() for x in text.split(",") if x.strip()), start=1):
+        mention = MENTION_PATTERN.fullmatch(entry)
+        if mention:
+            member_id = int(mention.group(1))
+            names.append(f"<@{member_id}>")
+            levels.append(round(get_player_rating(member_id)))
+            continue
+        name, sep, level = entry.rpartition(":")
+        if not sep:
+            name, level = f"P{position}", entry
+        names.append(name.strip() or f"P{position}")
+        levels.append(int(level.strip()))
+    return names, levels
+
+def parse_player_groups(text: Optional[str], names: list[str]) -> list[list[int]]:
+    """Parse groups like "1&2, Alice&Bob" into player index lists (1-based numbers or names)."""
+    if not text:
+        return []
+    lookup = {name.casefold(): index for index, name in enumerate(names)}
+    groups = []
+    for chunk in text.split(","):
+        members = []
+        for token in (t.strip() for t in chunk.split("&") if t.strip()):
+            token = MENTION_PATTERN.sub(r"<@\1>", token)
+            if token.isdigit() and 1 <= int(token) <= len(names):
+                members.append(int(token) - 1)
+            elif token.casefold() in lookup:
+                members.append(lookup[token.casefold()])
+            else:
+                raise ValueError(f"Unknown player '{token}'")
+        if members:
+            groups.append(members)
+    return groups
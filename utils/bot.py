@@ -0,0 +1,291 @@
+"""The bot client, its intents and member cache, and the extension command helpers"""
+from time import perf_counter
+import discord
+from discord import app_commands
+from discord.ext import commands
+import os
+import logging
+from typing import Optional
+import sys
+from collections import OrderedDict
+
+from config import env_flag
+from utils.log_utils import bind_interaction_context, format_log_stats
+from utils.startup import format_startup_marks
+from utils.outbound import outbound_queue
+
+log = logging.getLogger(__name__)
+
+# ===========================================================================================
+# MEMBER CACHE AND GATEWAY FOOTPRINT
+# ===========================================================================================
+
+# "all" keeps every member resident (discord.py default), "voice" only members in voice, "none" nothing;
+# members needed for events are then resolved on demand through resolve_member
+MEMBER_CACHE_MODE = os.getenv("MEMBER_CACHE", "all").strip().lower()
+MEMBERS_INTENT = env_flag("MEMBERS_INTENT", True)
+# ? commands need message content; turning it off disables them
+MESSAGE_CONTENT_INTENT = env_flag("MESSAGE_CONTENT_INTENT", True)
+CHUNK_GUILDS_AT_STARTUP = env_flag("CHUNK_GUILDS_AT_STARTUP", MEMBERS_INTENT and MEMBER_CACHE_MODE == "all")
+MESSAGE_CACHE_SIZE = int(os.getenv("MESSAGE_CACHE_SIZE", "1000"))
+GATEWAY_EVENT_STATS = env_flag("GATEWAY_EVENT_STATS", False)
+
+def build_member_cache_flags(mode: str, intents: discord.Intents) -> discord.MemberCacheFlags:
+    """Member cache flags for the configured mode, limited to what the intents allow"""
+    if mode == "none":
+        return discord.MemberCacheFlags.none()
+    if mode == "voice":
+        return discord.MemberCacheFlags(voice=intents.voice_states, joined=False)
+    return discord.MemberCacheFlags.from_intents(intents)
+
+intents = discord.Intents.default()
+intents.message_content = MESSAGE_CONTENT_INTENT
+intents.members = MEMBERS_INTENT
+intents.guilds = True
+intents.guild_messages = True
+
+class ContextCommandTree(app_commands.CommandTree):
+    """Command tree that tags everything logged while a command runs with its context"""
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        # Runs in the same task as the command callback, so the context lasts for the whole command
+        bind_interaction_context(interaction)
+        return True
+
+bot = commands.Bot(
+    command_prefix="!",
+    tree_cls=ContextCommandTree,
+    intents=intents,
+    member_cache_flags=build_member_cache_flags(MEMBER_CACHE_MODE, intents),
+    chunk_guilds_at_startup=CHUNK_GUILDS_AT_STARTUP,
+    max_messages=MESSAGE_CACHE_SIZE or None,
+    enable_debug_events=GATEWAY_EVENT_STATS
+)
+tree = bot.tree
+
+# Gateway events received per type, counted when GATEWAY_EVENT_STATS is on
+gateway_event_counts = {}
+footprint_started_at = perf_counter()
+
+MEMBER_RESOLVE_TTL = float(os.getenv("MEMBER_RESOLVE_TTL", "600"))  # Seconds
+MEMBER_RESOLVE_NEGATIVE_TTL = 60  # Seconds to remember members that left
+MEMBER_RESOLVE_CACHE_SIZE = int(os.getenv("MEMBER_RESOLVE_CACHE_SIZE", "2048"))
+
+# {(guild_id, member_id): (expires_at, member or None)}, oldest first
+member_resolve_cache = {}
+member_resolve_stats = {'cached': 0, 'ttl_hits': 0, 'fetched': 0}
+
+@bot.event
+async def on_socket_event_type(event_type):
+    gateway_event_counts[event_type] = gateway_event_counts.get(event_type, 0) + 1
+
+async def resolve_member(guild: Optional[discord.Guild], member_id: Optional[int]) -> Optional[discord.Member]:
+    """Resolve a member from the gateway cache, then a TTL-bounded cache, then the API"""
+    if not guild or not member_id:
+        return None
+    member = guild.get_member(member_id)
+    if member:
+        member_resolve_stats['cached'] += 1
+        return member
+
+    key = (guild.id, member_id)
+    now = perf_counter()
+    cached = member_resolve_cache.get(key)
+    if cached and cached[0] > now:
+        member_resolve_stats['ttl_hits'] += 1
+        return cached[1]
+
+    try:
+        member = await guild.fetch_member(member_id)
+        ttl = MEMBER_RESOLVE_TTL
+    except discord.NotFound:
+        member = None
+        ttl = MEMBER_RESOLVE_NEGATIVE_TTL
+    except discord.HTTPException as e:
+        log.error("Error resolving member %s: %s", member_id, e)
+        return None
+    member_resolve_stats['fetched'] += 1
+
+    member_resolve_cache.pop(key, None)
+    member_resolve_cache[key] = (now + ttl, member)
+    overflow = len(member_resolve_cache) - MEMBER_RESOLVE_CACHE_SIZE
+    if overflow > 0:
+        for stale in list(member_resolve_cache)[:overflow]:
+            del member_resolve_cache[stale]
+    return member
+
+async def resolve_event_member(guild: Optional[discord.Guild], event_data: dict, field: str) -> Optional[discord.Member]:
+    """Member stored on an event, resolving it from '<field>_id' after a restart"""
+    member = event_data.get(field)
+    if isinstance(member, (discord.Member, discord.User)):
+        return member
+    return await resolve_member(guild, event_data.get(f'{field}_id'))
+
+# ===========================================================================================
+# MESSAGE AND CHANNEL CACHE (kept current by raw gateway events)
+# ===========================================================================================
+
+MESSAGE_LRU_SIZE = int(os.getenv("MESSAGE_LRU_SIZE", "512"))
+
+# Recently posted or fetched messages the bot edits later: {message_id: discord.Message}, oldest first.
+# Raw edit events replace entries and raw deletes drop them, so a hit is as fresh as a fetch
+message_lru = OrderedDict()
+message_cache_stats = {'hits': 0, 'fetched': 0, 'updated': 0, 'evicted': 0}
+
+# {channel_id: guild_id} learned on first lookup, so later lookups go straight to the guild
+channel_guild_index = {}
+
+def resolve_channel(channel_id: Optional[int], guild_id: Optional[int] = None):
+    """Channel or thread from the gateway cache, looked up in its own guild when known"""
+    if not channel_id:
+        return None
+    guild_id = guild_id or channel_guild_index.get(channel_id)
+    if guild_id:
+        guild = bot.get_guild(guild_id)
+        channel = guild.get_channel_or_thread(channel_id) if guild else None
+        if channel:
+            return channel
+    # Unknown guild: Client.get_channel checks every guild once, then the mapping is remembered
+    channel = bot.get_channel(channel_id)
+    if channel is not None and getattr(channel, 'guild', None):
+        channel_guild_index[channel_id] = channel.guild.id
+    return channel
+
+def remember_message(message: Optional[discord.Message]):
+    """Keep a message the bot is likely to edit again, evicting the least recently used"""
+    if message is None:
+        return
+    message_lru[message.id] = message
+    message_lru.move_to_end(message.id)
+    if message.guild:
+        channel_guild_index[message.channel.id] = message.guild.id
+    while len(message_lru) > MESSAGE_LRU_SIZE:
+        message_lru.popitem(last=False)
+        message_cache_stats['evicted'] += 1
+
+async def get_message(channel, message_id: int) -> discord.Message:
+    """A full message from the LRU, fetching (and caching) it only on a miss"""
+    message = message_lru.get(message_id)
+    if message is not None:
+        message_lru.move_to_end(message_id)
+        message_cache_stats['hits'] += 1
+        return message
+    message = await channel.fetch_message(message_id)
+    message_cache_stats['fetched'] += 1
+    remember_message(message)
+    return message
+
+@bot.listen('on_raw_message_edit')
+async def refresh_cached_message(payload: discord.RawMessageUpdateEvent):
+    if payload.message_id not in message_lru:
+        return
+    # discord.py 2.5+ builds the updated message from the event; older versions only invalidate
+    updated = getattr(payload, 'message', None)
+    if updated is not None:
+        message_lru[payload.message_id] = updated
+        message_cache_stats['updated'] += 1
+    else:
+        message_lru.pop(payload.message_id, None)
+
+@bot.listen('on_raw_message_delete')
+async def drop_deleted_message(payload: discord.RawMessageDeleteEvent):
+    message_lru.pop(payload.message_id, None)
+
+@bot.listen('on_raw_bulk_message_delete')
+async def drop_bulk_deleted_messages(payload: discord.RawBulkMessageDeleteEvent):
+    for message_id in payload.message_ids:
+        message_lru.pop(message_id, None)
+
+@bot.listen('on_guild_channel_delete')
+async def drop_deleted_channel(channel):
+    channel_guild_index.pop(channel.id, None)
+
+def process_rss_bytes() -> Optional[int]:
+    """Current resident set size, or peak RSS where /proc is unavailable"""
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except Exception:
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    except Exception:
+        return None
+
+def build_footprint_report() -> discord.Embed:
+    """Memory, cache sizes and gateway event volume under the current cache/intent settings"""
+    uptime = max(perf_counter() - footprint_started_at, 1)
+    rss = process_rss_bytes()
+    embed = discord.Embed(title="📊 Bot Footprint", color=discord.Color.blue(), timestamp=discord.utils.utcnow())
+    embed.add_field(
+        name="Settings",
+        value=(
+            f"Member cache: `{MEMBER_CACHE_MODE}` • Chunk at startup: `{CHUNK_GUILDS_AT_STARTUP}`\n"
+            f"Members intent: `{intents.members}` • Message content intent: `{intents.message_content}`\n"
+            f"Message cache: `{MESSAGE_CACHE_SIZE}`"
+        ),
+        inline=False
+    )
+    embed.add_field(
+        name="Memory",
+        value=(
+            f"RSS: {rss / (1024 * 1024):.1f} MB\n" if rss else "RSS: unavailable\n"
+        ) + (
+            f"Cached members: {sum(len(guild.members) for guild in bot.guilds)} "
+            f"(guild totals: {sum(guild.member_count or 0 for guild in bot.guilds)})\n"
+            f"Cached messages: {len(bot.cached_messages)} • Resolver cache: {len(member_resolve_cache)}"
+        ),
+        inline=False
+    )
+    embed.add_field(
+        name="Member Resolver",
+        value=(
+            f"Gateway cache: {member_resolve_stats['cached']} • TTL hits: {member_resolve_stats['ttl_hits']} • "
+            f"API fetches: {member_resolve_stats['fetched']}"
+        ),
+        inline=False
+    )
+    embed.add_field(
+        name="Message Cache",
+        value=(
+            f"LRU: {len(message_lru)}/{MESSAGE_LRU_SIZE} • Hits: {message_cache_stats['hits']} • "
+            f"Fetches: {message_cache_stats['fetched']} • Gateway updates: {message_cache_stats['updated']} • "
+            f"Evicted: {message_cache_stats['evicted']}\nKnown channels: {len(channel_guild_index)}"
+        ),
+        inline=False
+    )
+    embed.add_field(name="Outbound Queue", value=outbound_queue.latency_report()[:1024], inline=False)
+    embed.add_field(name="Logging", value=format_log_stats(), inline=False)
+    embed.add_field(name="Startup", value=format_startup_marks().replace(" • ", "\n")[:1024], inline=False)
+    if GATEWAY_EVENT_STATS:
+        total = sum(gateway_event_counts.values())
+        top = sorted(gateway_event_counts.items(), key=lambda item: -item[1])[:8]
+        value = f"{total} events • {total / uptime * 60:.1f}/min over {uptime / 3600:.1f} h\n"
+        value += "\n".join(f"`{event_type}`: {count}" for event_type, count in top)
+    else:
+        value = "Disabled (set GATEWAY_EVENT_STATS=on)"
+    embed.add_field(name="Gateway Events", value=value[:1024], inline=False)
+    embed.set_footer(text="Compare reports before and after changing MEMBER_CACHE / intent settings")
+    return embed
+
+# ===========================================================================================
+# EXTENSIONS (feature modules under cogs/, reloadable with /reload)
+# ===========================================================================================
+
+# Load order matters: events looks up the loaded posters extension when it renders a poster
+EXTENSIONS = ('cogs.posters', 'cogs.rules', 'cogs.events', 'cogs.results', 'cogs.utilities')
+
+def extension_commands(namespace: dict) -> list:
+    """Slash commands defined at module level in an extension"""
+    return [item for item in namespace.values() if isinstance(item, app_commands.Command)]
+
+def add_extension_commands(namespace: dict):
+    """Register an extension's slash commands, replacing the copies from a previous load"""
+    for command in extension_commands(namespace):
+        tree.add_command(command, override=True)
+
+def remove_extension_commands(namespace: dict):
+    for command in extension_commands(namespace):
+        tree.remove_command(command.name)
@@ -0,0 +1,100 @@
+"""Embed field helpers"""
+import discord
+import logging
+
+log = logging.getLogger(__name__)
+
+# Embed field utility functions for safe Discord.py embed manipulation
+def find_field_index(embed: discord.Embed, field_name: str) -> int:
+    """Find the index of a field by name. Returns -1 if not found."""
+    try:
+        for i, field in enumerate(embed.fields):
+            if field.name == field_name:
+                return i
+        return -1
+    except Exception as e:
+        log.error("Error finding field index: %s", e)
+        return -1
+
+def remove_field_by_name(embed: discord.Embed, field_name: str) -> bool:
+    """Safely remove a field by name using Discord.py methods. Returns True if removed, False if not found."""
+    try:
+        field_index = find_field_index(embed, field_name)
+        if field_index != -1:
+            embed.remove_field(field_index)
+            return True
+        return False
+    except Exception as e:
+        log.error("Error removing field by name '%s': %s", field_name, e)
+        return False
+
+def update_judge_field(embed: discord.Embed, judge_member: discord.Member) -> bool:
+    """Update or add judge field safely. Returns True if successful."""
+    try:
+        # Remove existing judge field if it exists
+        remove_field_by_name(embed, "👨‍⚖️ Judge")
+        
+        # Add new judge field
+        embed.add_field(
+            name="👨‍⚖️ Judge", 
+            value=f"{judge_member.mention} `@{judge_member.name}`", 
+            inline=True
+        )
+        return True
+    except Exception as e:
+        log.error("Error updating judge field: %s", e)
+        return False
+
+def remove_judge_field(embed: discord.Embed) -> bool:
+    """Remove judge field safely. Returns True if removed, False if not found."""
+    try:
+        return remove_field_by_name(embed, "👨‍⚖️ Judge")
+    except Exception as e:
+        log.error("Error removing judge field: %s", e)
+        return False
+
+def add_green_circle_to_title(title: str) -> str:
+    """Add green circle emoji to the beginning of title if not already present"""
+    green_circle = "🟢"
+    
+    # Check if already has green circle
+    if title and title.startswith(green_circle):
+        return title
+    
+    # Add green circle to beginning
+    return green_circle + (title or "")
+
+def update_embed_title_with_green_circle(embed: discord.Embed) -> bool:
+    """Update embed title with green circle, returns success status"""
+    try:
+        if embed.title:
+            new_title = add_green_circle_to_title(embed.title)
+            embed.title = new_title
+            return True
+        return False
+    except Exception as e:
+        log.error("Error updating embed title with green circle: %s", e)
+        return False
+
+def replace_green_circle_with_checkmark(title: str) -> str:
+    """Replace green circle emoji with checkmark emoji in title"""
+    green_circle = "🟢"
+    checkmark = "✅"
+    
+    if title and title.startswith(green_circle):
+        return checkmark + title[len(green_circle):]
+    
+    # If no green circle, just add checkmark at the beginning
+    return checkmark + (title or "")
+
+def update_embed_title_with_checkmark(embed: discord.Embed) -> bool:
+    """Update embed title with checkmark, returns success status"""
+    try:
+        if embed.title:
+            new_title = replace_green_circle_with_checkmark(embed.title)
+            embed.title = new_title
+            return True
+        return False
+    except Exception as e:
+        log.error("Error updating embed title with checkmark: %s", e)
+        return False
@@ -0,0 +1,726 @@
+"""Scheduled events and every index derived from them"""
+import discord
+from discord import app_commands
+import os
+import logging
+from typing import Optional
+import re
+import datetime
+import asyncio
+import bisect
+import heapq
+import json
+
+from utils.bot import bot, get_message, remember_message, resolve_channel
+from utils.embed_utils import find_field_index
+from utils.outbound import outbound_queue
+
+log = logging.getLogger(__name__)
+
+# Store scheduled events for reminders. Loaders update it in place so every module shares one dict
+scheduled_events = {}
+
+# Load scheduled events from file on startup
+def load_scheduled_events():
+    try:
+        if os.path.exists('scheduled_events.json'):
+            with open('scheduled_events.json', 'r') as f:
+                data = json.load(f)
+                # Convert datetime strings back to datetime objects
+                for event_id, event_data in data.items():
+                    if 'datetime' in event_data:
+                        event_data['datetime'] = datetime.datetime.fromisoformat(event_data['datetime'])
+                scheduled_events.clear()
+                scheduled_events.update(data)
+                log.info("Loaded %s scheduled events from file", len(scheduled_events))
+    except Exception as e:
+        log.error("Error loading scheduled events: %s", e)
+        scheduled_events.clear()
+    rebuild_event_indexes()
+
+# Event fields holding discord.Member objects; only their IDs are persisted (as '<field>_id')
+EVENT_MEMBER_FIELDS = ('judge', 'team1_captain', 'team2_captain', 'result_winner', 'result_loser', 'result_judge')
+
+# Save scheduled events to file
+def save_scheduled_events():
+    try:
+        # Convert datetime objects to strings for JSON serialization
+        data_to_save = {}
+        for event_id, event_data in scheduled_events.items():
+            event_copy = event_data.copy()
+            if 'datetime' in event_copy:
+                event_copy['datetime'] = event_copy['datetime'].isoformat()
+            # Replace non-serializable discord.Member objects with their IDs
+            for field in EVENT_MEMBER_FIELDS:
+                member = event_copy.get(field)
+                if hasattr(member, 'id'):
+                    event_copy[f'{field}_id'] = member.id
+                if field in event_copy:
+                    event_copy[field] = None
+            data_to_save[event_id] = event_copy
+        
+        with open('scheduled_events.json', 'w') as f:
+            json.dump(data_to_save, f, indent=2)
+    except Exception as e:
+        log.error("Error saving scheduled events: %s", e)
+
+# Track per-event reminder tasks (for cancellation/update)
+reminder_tasks = {}
+
+# ===========================================================================================
+# JUDGE ASSIGNMENT INDEX AND ATOMIC CLAIM
+# ===========================================================================================
+
+JUDGE_MAX_ASSIGNMENTS = 7
+# How long a judge is considered busy from a match's start time
+JUDGE_BOOKING_MINUTES = int(os.getenv("JUDGE_BOOKING_MINUTES", "60"))
+
+# Open assignments per judge, derived from the persisted judge_id of every event without a result,
+# so counts survive restarts: {judge_id: {event_ids}}
+judge_assignments = {}
+
+# The judge each event is currently counted against: {event_id: judge_id}
+_event_judges = {}
+
+# Booked windows per judge as sorted (start, end, event_id) tuples. They may overlap each other
+# (loads and /event-edit time changes are not re-checked), but every window has the same length
+judge_bookings = {}
+_event_bookings = {}  # {event_id: booking tuple}, to remove a booking by binary search
+
+def event_booking_window(event_data: dict) -> Optional[tuple]:
+    """(start, end) a judge is busy for an event, in naive UTC"""
+    start = event_data.get('datetime')
+    if not isinstance(start, datetime.datetime):
+        return None
+    return start, start + datetime.timedelta(minutes=JUDGE_BOOKING_MINUTES)
+
+def find_booking_conflict(bookings: list, start: datetime.datetime, end: datetime.datetime) -> Optional[str]:
+    """Event ID of a booked window overlapping [start, end), found in O(log n).
+
+    Every booking comes from event_booking_window, so the last one starting before `end`
+    also ends last among them; if it ends by `start`, none of the earlier ones overlap.
+    """
+    pos = bisect.bisect_left(bookings, (end,))
+    if pos and bookings[pos - 1][1] > start:
+        return bookings[pos - 1][2]
+    return None
+
+def index_judge_assignment(event_id: str):
+    """Count an event against its judge while it has no result"""
+    unindex_judge_assignment(event_id)
+    event_data = scheduled_events.get(event_id)
+    if not event_data or event_data.get('result_added'):
+        return
+    judge_id = get_event_judge_id(event_data)
+    if judge_id:
+        judge_assignments.setdefault(judge_id, set()).add(event_id)
+        _event_judges[event_id] = judge_id
+        window = event_booking_window(event_data)
+        if window:
+            booking = (*window, event_id)
+            bisect.insort(judge_bookings.setdefault(judge_id, []), booking)
+            _event_bookings[event_id] = booking
+
+def unindex_judge_assignment(event_id: str):
+    """Release an event's assignment from its judge's count"""
+    judge_id = _event_judges.pop(event_id, None)
+    events = judge_assignments.get(judge_id)
+    if events is not None:
+        events.discard(event_id)
+        if not events:
+            del judge_assignments[judge_id]
+    booking = _event_bookings.pop(event_id, None)
+    bookings = judge_bookings.get(judge_id)
+    if booking and bookings is not None:
+        remove_sorted(bookings, booking)
+        if not bookings:
+            del judge_bookings[judge_id]
+
+def claim_event_judge(event_id: str, judge: discord.Member, max_assignments: int = JUDGE_MAX_ASSIGNMENTS) -> tuple[bool, str]:
+    """Assign a judge to an event if it has none and the judge is under the cap.
+
+    A compare-and-set on the event's judge_id with the cap checked in the same step. There
+    are no awaits, so contended clicks run one after another on the event loop: the first
+    one wins and the rest see the schedule as taken.
+    """
+    event_data = scheduled_events.get(event_id)
+    if event_data is None:
+        return False, "This event no longer exists."
+    current_judge_id = get_event_judge_id(event_data)
+    if current_judge_id == judge.id:
+        return False, "You have already taken this schedule."
+    if current_judge_id:
+        return False, f"This schedule has already been taken by <@{current_judge_id}>."
+    if event_data.get('result_added'):
+        return False, "This event already has a result."
+    can_take, error_message = can_judge_take_schedule(judge.id, max_assignments)
+    if not can_take:
+        return False, error_message
+    window = event_booking_window(event_data)
+    conflict = window and find_booking_conflict(judge_bookings.get(judge.id, []), *window)
+    if conflict:
+        other = scheduled_events.get(conflict, {})
+        return False, (
+            f"You are already judging {get_event_captain_name(other, 1)} vs {get_event_captain_name(other, 2)} "
+            f"at {other.get('time_str', 'that time')} on {other.get('date_str', 'that day')}."
+        )
+
+    event_data['judge'] = judge
+    event_data['judge_id'] = judge.id
+    reindex_event(event_id)
+    save_scheduled_events()
+    return True, ""
+
+def check_judge_transfer(event_ids: list, judge_id: int, max_assignments: int = JUDGE_MAX_ASSIGNMENTS) -> tuple[bool, str]:
+    """Whether a judge can take over these events without passing the cap or double-booking"""
+    open_ids = [
+        event_id for event_id in event_ids
+        if event_id in scheduled_events and not scheduled_events[event_id].get('result_added')
+        and get_event_judge_id(scheduled_events[event_id]) != judge_id
+    ]
+    current = len(judge_assignments.get(judge_id, ()))
+    if current + len(open_ids) > max_assignments:
+        return False, (
+            f"<@{judge_id}> already has {current} schedule(s) assigned; taking {len(open_ids)} more "
+            f"would pass the maximum of {max_assignments}."
+        )
+    bookings = list(judge_bookings.get(judge_id, []))
+    for event_id in open_ids:
+        event_data = scheduled_events[event_id]
+        window = event_booking_window(event_data)
+        if not window:
+            continue
+        conflict = find_booking_conflict(bookings, *window)
+        if conflict:
+            other = scheduled_events.get(conflict, {})
+            return False, (
+                f"<@{judge_id}> is already judging {get_event_captain_name(other, 1)} vs {get_event_captain_name(other, 2)} "
+                f"at {other.get('time_str', 'that time')} on {other.get('date_str', 'that day')}."
+            )
+        bisect.insort(bookings, (*window, event_id))
+    return True, ""
+
+def release_event_judge(event_id: str, judge_id: int) -> bool:
+    """Undo a claim when the schedule message could not be updated; only the claiming judge is removed"""
+    event_data = scheduled_events.get(event_id)
+    if event_data is None or get_event_judge_id(event_data) != judge_id:
+        return False
+    event_data.pop('judge', None)
+    event_data.pop('judge_id', None)
+    reindex_event(event_id)
+    save_scheduled_events()
+    return True
+
+def can_judge_take_schedule(judge_id: int, max_assignments: int = JUDGE_MAX_ASSIGNMENTS) -> tuple[bool, str]:
+    """Check if a judge can take another schedule"""
+    if judge_id not in judge_assignments:
+        return True, ""
+    
+    current_assignments = len(judge_assignments[judge_id])
+    if current_assignments >= max_assignments:
+        return False, f"You already have {current_assignments} schedule(s) assigned. Maximum allowed is {max_assignments}."
+    
+    return True, ""
+
+# ===========================================================================================
+# MATCH SLOT OCCUPANCY (per-day index used by the /time slot allocator)
+# ===========================================================================================
+
+# Granularity of the slot and availability indexes
+AVAILABILITY_SLOT_MINUTES = 30
+
+# Fixed 30-minute match slots offered by /time, 12:00 to 17:00 UTC
+MATCH_SLOT_TIMES = [(hour, minute) for hour in range(12, 18) for minute in (0, 30) if not (hour == 17 and minute == 30)]
+
+# Events touching each 30-minute slot of a day: {date: {slot_of_day: {event_ids}}}
+slot_occupancy = {}
+
+# Slots each captain plays in on a day: {(member_id, date): {slot_of_day: count}}
+captain_slot_index = {}
+
+# What each event was indexed under, so it can be removed without a scan: {event_id: ([(date, slot)], captain_ids)}
+_event_slots = {}
+
+def window_slot_keys(start: datetime.datetime, end: datetime.datetime) -> list:
+    """(date, slot_of_day) of every 30-minute slot a window touches"""
+    keys = []
+    slot_start = start.replace(minute=start.minute - start.minute % AVAILABILITY_SLOT_MINUTES, second=0, microsecond=0)
+    while slot_start < end:
+        keys.append((slot_start.date(), (slot_start.hour * 60 + slot_start.minute) // AVAILABILITY_SLOT_MINUTES))
+        slot_start += datetime.timedelta(minutes=AVAILABILITY_SLOT_MINUTES)
+    return keys
+
+def index_slot_occupancy(event_id: str):
+    """Record which slots an event and its captains occupy"""
+    unindex_slot_occupancy(event_id)
+    event_data = scheduled_events.get(event_id)
+    window = event_booking_window(event_data) if event_data else None
+    if not window:
+        return
+    keys = window_slot_keys(*window)
+    captain_ids = [cid for cid in (get_event_captain_id(event_data, 1), get_event_captain_id(event_data, 2)) if cid]
+    for day, slot in keys:
+        slot_occupancy.setdefault(day, {}).setdefault(slot, set()).add(event_id)
+        for captain_id in captain_ids:
+            slots = captain_slot_index.setdefault((captain_id, day), {})
+            slots[slot] = slots.get(slot, 0) + 1
+    _event_slots[event_id] = (keys, captain_ids)
+
+def unindex_slot_occupancy(event_id: str):
+    """Release an event's slots"""
+    keys, captain_ids = _event_slots.pop(event_id, ((), ()))
+    for day, slot in keys:
+        day_slots = slot_occupancy.get(day, {})
+        events = day_slots.get(slot)
+        if events is not None:
+            events.discard(event_id)
+            if not events:
+                del day_slots[slot]
+        if not day_slots:
+            slot_occupancy.pop(day, None)
+        for captain_id in captain_ids:
+            slots = captain_slot_index.get((captain_id, day))
+            if slots and slot in slots:
+                slots[slot] -= 1
+                if not slots[slot]:
+                    del slots[slot]
+                if not slots:
+                    del captain_slot_index[(captain_id, day)]
+
+def get_event_judge_id(event_data: dict) -> Optional[int]:
+    """Get the assigned judge's ID whether the judge is held as a Member or only persisted by ID"""
+    judge = event_data.get('judge')
+    if judge is not None:
+        return getattr(judge, 'id', None)
+    return event_data.get('judge_id')
+
+def get_event_captain_id(event_data: dict, team: int) -> Optional[int]:
+    """Get a captain's ID whether the captain is held as a Member or only persisted by ID"""
+    captain = event_data.get(f'team{team}_captain')
+    if captain is not None:
+        return getattr(captain, 'id', None)
+    return event_data.get(f'team{team}_captain_id')
+
+def get_event_captain_name(event_data: dict, team: int) -> str:
+    """Get a captain's display name, falling back to the stored name when the Member isn't loaded"""
+    captain = event_data.get(f'team{team}_captain')
+    if captain is not None:
+        return getattr(captain, 'display_name', 'Unknown')
+    return event_data.get(f'team{team}_name') or 'Unknown'
+
+# ===========================================================================================
+# UNASSIGNED EVENT INDEX
+# ===========================================================================================
+
+# Sorted (datetime, event_id) keys of events that have no judge and no result yet
+unassigned_index = []
+
+# Per-filter sorted keys, e.g. {('tournament', 'king of the seas'): [(datetime, event_id), ...]}
+unassigned_filter_index = {}
+
+# Key and filter keys each indexed event was inserted with, so it can be removed in O(log n)
+_unassigned_entries = {}
+
+UNASSIGNED_FILTER_FIELDS = ('tournament', 'round', 'group')
+
+def remove_sorted(entries: list, key: tuple):
+    """Remove a key from a sorted list using binary search"""
+    pos = bisect.bisect_left(entries, key)
+    if pos < len(entries) and entries[pos] == key:
+        del entries[pos]
+
+def _unassigned_filter_keys(event_data: dict) -> list:
+    """Build the filter index keys an event belongs to"""
+    keys = []
+    for field in UNASSIGNED_FILTER_FIELDS:
+        value = event_data.get(field)
+        if value:
+            keys.append((field, str(value).casefold()))
+    return keys
+
+def unindex_unassigned_event(event_id: str):
+    """Remove an event from the unassigned index"""
+    entry = _unassigned_entries.pop(event_id, None)
+    if not entry:
+        return
+    key, filter_keys = entry
+    remove_sorted(unassigned_index, key)
+    for filter_key in filter_keys:
+        bucket = unassigned_filter_index.get(filter_key)
+        if bucket is not None:
+            remove_sorted(bucket, key)
+            if not bucket:
+                del unassigned_filter_index[filter_key]
+
+def index_unassigned_event(event_id: str):
+    """Insert or refresh an event in the unassigned index based on its current data"""
+    unindex_unassigned_event(event_id)
+    event_data = scheduled_events.get(event_id)
+    if not event_data or get_event_judge_id(event_data) or event_data.get('result_added'):
+        return
+    event_datetime = event_data.get('datetime')
+    if not isinstance(event_datetime, datetime.datetime):
+        return
+    key = (event_datetime, event_id)
+    filter_keys = _unassigned_filter_keys(event_data)
+    bisect.insort(unassigned_index, key)
+    for filter_key in filter_keys:
+        bisect.insort(unassigned_filter_index.setdefault(filter_key, []), key)
+    _unassigned_entries[event_id] = (key, filter_keys)
+
+def query_unassigned_events(after: tuple = None, limit: int = 5, **filters) -> tuple[list, bool]:
+    """Return up to `limit` upcoming unassigned events after the `after` cursor, plus whether more exist.
+
+    Filters (tournament, round, group) are matched case-insensitively. The smallest matching
+    filter index is walked, so a page costs O(log n + page size) for a single filter.
+    """
+    requested = [(field, str(value).casefold()) for field, value in filters.items() if value]
+    source = min((unassigned_filter_index.get(filter_key, []) for filter_key in requested), key=len, default=unassigned_index)
+
+    if after is None:
+        start = bisect.bisect_left(source, (datetime.datetime.utcnow(), ""))
+    else:
+        start = bisect.bisect_right(source, after)
+
+    results = []
+    for pos in range(start, len(source)):
+        key = source[pos]
+        _, filter_keys = _unassigned_entries.get(key[1], (None, []))
+        if all(filter_key in filter_keys for filter_key in requested):
+            if len(results) == limit:
+                return results, True
+            results.append(key)
+    return results, False
+
+def count_upcoming_unassigned() -> int:
+    """Count upcoming unassigned events in O(log n)"""
+    return len(unassigned_index) - bisect.bisect_left(unassigned_index, (datetime.datetime.utcnow(), ""))
+
+# ===========================================================================================
+# EVENT MESSAGE REGISTRY
+# ===========================================================================================
+
+# Roles of the messages the bot posts for an event
+MESSAGE_ROLE_SCHEDULE = "schedule"              # Take-Schedule channel post (with button)
+MESSAGE_ROLE_TICKET_SCHEDULE = "ticket_schedule"  # Schedule copy posted in the ticket channel
+MESSAGE_ROLE_JUDGE_ASSIGNED = "judge_assigned"  # Judge assignment notice in the ticket channel
+MESSAGE_ROLE_REMINDER = "reminder"              # 10-minute reminder
+MESSAGE_ROLE_EDIT_NOTICE = "edit_notice"        # "Event Updated" notice
+MESSAGE_ROLE_RESULT = "result"                  # Results channel post
+MESSAGE_ROLE_RESULT_TICKET = "result_ticket"    # Result copy posted in the ticket channel
+MESSAGE_ROLE_ATTENDANCE = "attendance"          # Staff attendance log
+
+SCHEDULE_MESSAGE_ROLES = (MESSAGE_ROLE_SCHEDULE, MESSAGE_ROLE_TICKET_SCHEDULE)
+
+# Reverse index of every registered message: {message_id: (event_id, role)}
+event_message_index = {}
+
+def register_event_message(event_id: str, message: discord.Message, role: str):
+    """Record a message posted for an event in the event store as (channel_id, guild_id, message_id, role)"""
+    event_data = scheduled_events.get(event_id)
+    if not event_data or message is None:
+        return
+    event_data.setdefault('messages', []).append({
+        'channel_id': message.channel.id,
+        'guild_id': message.guild.id if message.guild else None,
+        'message_id': message.id,
+        'role': role
+    })
+    event_message_index[message.id] = (event_id, role)
+    # Registered messages are the ones edited later; keep them warm
+    remember_message(message)
+
+def unregister_event_message(message_id: int):
+    """Forget a message (e.g. after it was deleted)"""
+    entry = event_message_index.pop(message_id, None)
+    if not entry:
+        return
+    event_data = scheduled_events.get(entry[0])
+    if event_data and event_data.get('messages'):
+        event_data['messages'] = [record for record in event_data['messages'] if record['message_id'] != message_id]
+
+def get_event_messages(event_id: str, *roles: str) -> list:
+    """Get the registered message records of an event, optionally limited to some roles"""
+    records = scheduled_events.get(event_id, {}).get('messages', [])
+    if not roles:
+        return list(records)
+    return [record for record in records if record['role'] in roles]
+
+def find_event_by_message(message_id: int) -> Optional[tuple]:
+    """Look up (event_id, role) for a registered message ID"""
+    return event_message_index.get(message_id)
+
+def index_event_messages(event_id: str):
+    """Index an event's registered messages, migrating legacy schedule_message_id records"""
+    event_data = scheduled_events.get(event_id)
+    if not event_data:
+        return
+    records = event_data.setdefault('messages', [])
+    legacy_id = event_data.get('schedule_message_id')
+    if legacy_id and event_data.get('schedule_channel_id') and not any(r['message_id'] == legacy_id for r in records):
+        records.append({
+            'channel_id': event_data['schedule_channel_id'],
+            'message_id': legacy_id,
+            'role': MESSAGE_ROLE_SCHEDULE
+        })
+    for record in records:
+        event_message_index[record['message_id']] = (event_id, record['role'])
+
+def unindex_event_messages(event_id: str):
+    """Drop an event's messages from the reverse index"""
+    for record in scheduled_events.get(event_id, {}).get('messages', []):
+        event_message_index.pop(record['message_id'], None)
+
+async def _edit_registered_message(event_id: str, record: dict, update_embed, **edit_kwargs) -> bool:
+    """Load one registered message (cached or fetched), apply update_embed to its first embed and save the edit"""
+    channel = resolve_channel(record['channel_id'], record.get('guild_id'))
+    if channel is None:
+        return False
+    try:
+        message = await get_message(channel, record['message_id'])
+        if not message.embeds:
+            return False
+        # Edit a copy so a failed request leaves the cached message untouched
+        embed = message.embeds[0].copy()
+        if not update_embed(embed):
+            return False
+        remember_message(await outbound_queue.edit(message, embed=embed, **edit_kwargs))
+        return True
+    except discord.NotFound:
+        log.warning("Registered %s message for event %s no longer exists", record['role'], event_id)
+        unregister_event_message(record['message_id'])
+    except discord.Forbidden:
+        log.error("Bot doesn't have permission to edit message in channel %s", channel.name)
+    except Exception as e:
+        log.error("Error editing %s message for event %s: %s", record['role'], event_id, e)
+    return False
+
+@bot.listen('on_raw_message_delete')
+async def unregister_deleted_message(payload: discord.RawMessageDeleteEvent):
+    """Drop deleted messages from the registry so later edits don't try them"""
+    if payload.message_id in event_message_index:
+        unregister_event_message(payload.message_id)
+        save_scheduled_events()
+
+@bot.listen('on_raw_bulk_message_delete')
+async def unregister_bulk_deleted_messages(payload: discord.RawBulkMessageDeleteEvent):
+    registered = [message_id for message_id in payload.message_ids if message_id in event_message_index]
+    for message_id in registered:
+        unregister_event_message(message_id)
+    if registered:
+        save_scheduled_events()
+
+async def edit_event_messages(event_id: str, roles: tuple, update_embed, **edit_kwargs) -> int:
+    """Edit the registered messages of an event with the given roles in parallel; returns how many were updated
+
+    Extra keyword arguments (e.g. view) are passed to every message edit.
+    """
+    records = get_event_messages(event_id, *roles)
+    if not records:
+        return 0
+    updated = await asyncio.gather(*(_edit_registered_message(event_id, record, update_embed, **edit_kwargs) for record in records))
+    return sum(updated)
+
+def build_event_details_text(event_data: dict) -> str:
+    """Build the '📋 Event Details' field shown on schedule messages"""
+    # Create Discord timestamp for automatic timezone conversion
+    timestamp = int(event_data['datetime'].timestamp())
+
+    event_details = f"**Tournament:** {event_data.get('tournament')}\n"
+    event_details += f"**UTC Time:** {event_data.get('time_str')}\n"
+    event_details += f"**Local Time:** <t:{timestamp}:F> (<t:{timestamp}:R>)\n"
+    event_details += f"**Round:** {event_data.get('round')}\n"
+
+    # Add group if specified
+    if event_data.get('group'):
+        event_details += f"**Group:** {event_data['group']}\n"
+
+    event_details += f"**Channel:** <#{event_data.get('channel_id')}>"
+    return event_details
+
+def refresh_schedule_embed(embed: discord.Embed, event_data: dict) -> bool:
+    """Rewrite a schedule embed's matchup and details from the stored event data"""
+    try:
+        embed.description = f"🗓️ {get_event_captain_name(event_data, 1)} VS {get_event_captain_name(event_data, 2)}"
+        details_index = find_field_index(embed, "📋 Event Details")
+        if details_index != -1:
+            embed.set_field_at(details_index, name="📋 Event Details", value=build_event_details_text(event_data), inline=False)
+        captains_index = find_field_index(embed, "👑 Team Captains")
+        if captains_index != -1:
+            captains_text = "**Captains**\n"
+            for team in (1, 2):
+                captain = event_data.get(f'team{team}_captain')
+                captain_id = getattr(captain, 'id', None) or event_data.get(f'team{team}_captain_id')
+                captain_name = getattr(captain, 'name', None) or get_event_captain_name(event_data, team)
+                captains_text += f"▪ Team{team} Captain: <@{captain_id}> @{captain_name}\n"
+            embed.set_field_at(captains_index, name="👑 Team Captains", value=captains_text.rstrip("\n"), inline=False)
+        return True
+    except Exception as e:
+        log.error("Error refreshing schedule embed: %s", e)
+        return False
+
+# ===========================================================================================
+# EVENT SEARCH INDEX (autocomplete)
+# ===========================================================================================
+
+EVENT_SEARCH_FIELDS = ('team1_name', 'team2_name', 'round', 'group', 'tournament', 'date_str')
+
+def _search_tokens(text: str) -> list:
+    """Split text into lowercase search tokens"""
+    return re.findall(r"[\w/]+", str(text).casefold())
+
+def _trigrams(text: str) -> set:
+    """Character trigrams of a padded, lowercase string"""
+    padded = f"  {text.casefold()} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class EventSearchIndex:
+    """In-memory prefix and trigram index over event captains, round, group, tournament and date.
+
+    Prefix lookups bisect a sorted token list; fuzzy lookups count shared trigrams from an
+    inverted index, so a query only touches the events that share tokens with it.
+    """
+
+    def __init__(self):
+        self._tokens = []          # Sorted (token, event_id)
+        self._event_tokens = {}    # {event_id: set of tokens}
+        self._trigram_postings = {}  # {trigram: set of event_ids}
+        self._event_trigrams = {}  # {event_id: set of trigrams}
+        self._labels = {}          # {event_id: autocomplete label}
+        self._datetimes = {}       # {event_id: datetime} for ordering
+
+    def clear(self):
+        self.__init__()
+
+    def remove(self, event_id: str):
+        for token in self._event_tokens.pop(event_id, ()):
+            remove_sorted(self._tokens, (token, event_id))
+        for trigram in self._event_trigrams.pop(event_id, ()):
+            postings = self._trigram_postings.get(trigram)
+            if postings is not None:
+                postings.discard(event_id)
+                if not postings:
+                    del self._trigram_postings[trigram]
+        self._labels.pop(event_id, None)
+        self._datetimes.pop(event_id, None)
+
+    def add(self, event_id: str, event_data: dict):
+        self.remove(event_id)
+        values = [str(event_data[field]) for field in EVENT_SEARCH_FIELDS if event_data.get(field)]
+        tokens = set()
+        trigrams = set()
+        for value in values:
+            tokens.update(_search_tokens(value))
+            trigrams |= _trigrams(value)
+        for token in tokens:
+            bisect.insort(self._tokens, (token, event_id))
+        for trigram in trigrams:
+            self._trigram_postings.setdefault(trigram, set()).add(event_id)
+        self._event_tokens[event_id] = tokens
+        self._event_trigrams[event_id] = trigrams
+        self._labels[event_id] = self.build_label(event_data)
+        event_datetime = event_data.get('datetime')
+        self._datetimes[event_id] = event_datetime if isinstance(event_datetime, datetime.datetime) else datetime.datetime.max
+
+    @staticmethod
+    def build_label(event_data: dict) -> str:
+        """Autocomplete label, kept within Discord's 100 character limit"""
+        parts = [f"{get_event_captain_name(event_data, 1)[:25]} vs {get_event_captain_name(event_data, 2)[:25]}"]
+        for field in ('round', 'group', 'tournament'):
+            if event_data.get(field):
+                parts.append(str(event_data[field])[:20])
+        parts.append(event_data.get('time_str') or event_data.get('date_str', ''))
+        label = " • ".join(part for part in parts if part)
+        if event_data.get('result_added'):
+            label = "✅ " + label
+        return label[:100]
+
+    def label(self, event_id: str) -> str:
+        return self._labels.get(event_id, event_id)
+
+    def _prefix_matches(self, prefix: str) -> set:
+        matches = set()
+        pos = bisect.bisect_left(self._tokens, (prefix, ""))
+        while pos < len(self._tokens) and self._tokens[pos][0].startswith(prefix):
+            matches.add(self._tokens[pos][1])
+            pos += 1
+        return matches
+
+    def search(self, query: str, limit: int = 25) -> list:
+        """Return up to `limit` (event_id, label) pairs best matching the query"""
+        terms = _search_tokens(query)
+        if not terms:
+            # No query yet: offer the soonest events first
+            soonest = heapq.nsmallest(limit, self._datetimes, key=self._datetimes.get)
+            return [(event_id, self._labels[event_id]) for event_id in soonest]
+
+        scores = {}
+
+        # Prefix matches: every term must prefix-match some token of the event
+        prefix_hits = None
+        for term in terms:
+            matches = self._prefix_matches(term)
+            prefix_hits = matches if prefix_hits is None else prefix_hits & matches
+            if not prefix_hits:
+                break
+        for event_id in prefix_hits or ():
+            scores[event_id] = 10.0
+
+        # Fuzzy matches: share enough trigrams with the whole query (handles typos)
+        query_trigrams = _trigrams(" ".join(terms))
+        shared = {}
+        for trigram in query_trigrams:
+            for event_id in self._trigram_postings.get(trigram, ()):
+                shared[event_id] = shared.get(event_id, 0) + 1
+        for event_id, count in shared.items():
+            similarity = count / len(query_trigrams)
+            if similarity >= 0.4 or event_id in scores:
+                scores[event_id] = scores.get(event_id, 0.0) + similarity
+
+        best = heapq.nsmallest(limit, scores, key=lambda event_id: (-scores[event_id], self._datetimes[event_id]))
+        return [(event_id, self._labels[event_id]) for event_id in best]
+
+event_search_index = EventSearchIndex()
+
+async def event_autocomplete(interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+    """Autocomplete scheduled events by captain, round, group, tournament or date"""
+    try:
+        return [app_commands.Choice(name=label, value=event_id) for event_id, label in event_search_index.search(current)]
+    except Exception as e:
+        log.error("Error in event autocomplete: %s", e)
+        return []
+
+# Central hooks every event index is maintained through
+def reindex_event(event_id: str):
+    """Refresh all in-memory indexes for an event after it was created or changed"""
+    index_unassigned_event(event_id)
+    index_event_messages(event_id)
+    index_judge_assignment(event_id)
+    index_slot_occupancy(event_id)
+    if event_id in scheduled_events:
+        event_search_index.add(event_id, scheduled_events[event_id])
+
+def unindex_event(event_id: str):
+    """Remove an event from all in-memory indexes before it is deleted"""
+    unindex_unassigned_event(event_id)
+    unindex_event_messages(event_id)
+    unindex_judge_assignment(event_id)
+    unindex_slot_occupancy(event_id)
+    event_search_index.remove(event_id)
+
+def rebuild_event_indexes():
+    """Rebuild all in-memory indexes from scheduled_events (e.g. after loading from file)"""
+    unassigned_index.clear()
+    unassigned_filter_index.clear()
+    _unassigned_entries.clear()
+    event_message_index.clear()
+    judge_assignments.clear()
+    _event_judges.clear()
+    judge_bookings.clear()
+    _event_bookings.clear()
+    slot_occupancy.clear()
+    captain_slot_index.clear()
+    _event_slots.clear()
+    event_search_index.clear()
+    for event_id in scheduled_events:
+        reindex_event(event_id)
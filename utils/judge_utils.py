@@ -0,0 +1,256 @@
+"""Judge availability calendar, match slot allocation and assignment proposals"""
+import os
+import logging
+import random
+from typing import Optional
+import re
+import datetime
+import bisect
+import json
+
+from config import ROLE_IDS
+from utils.event_store import (
+    AVAILABILITY_SLOT_MINUTES,
+    captain_slot_index,
+    event_booking_window,
+    find_booking_conflict,
+    get_event_captain_id,
+    judge_assignments,
+    JUDGE_BOOKING_MINUTES,
+    judge_bookings,
+    JUDGE_MAX_ASSIGNMENTS,
+    MATCH_SLOT_TIMES,
+    query_unassigned_events,
+    scheduled_events,
+    slot_occupancy,
+    unassigned_index,
+    window_slot_keys,
+)
+
+log = logging.getLogger(__name__)
+
+# ===========================================================================================
+# JUDGE AVAILABILITY CALENDAR
+# ===========================================================================================
+
+JUDGE_AVAILABILITY_FILE = 'judge_availability.json'
+SLOTS_PER_DAY = 24 * 60 // AVAILABILITY_SLOT_MINUTES
+SLOTS_PER_WEEK = 7 * SLOTS_PER_DAY
+WEEKDAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+# {judge_id: [{'kind': 'weekly'|'once', 'weekday': int, 'date': 'YYYY-MM-DD', 'start': min, 'end': min}]}
+# Times are UTC minutes of the day; an end at or before the start runs past midnight
+judge_availability = {}
+
+# Judges available in each 30-minute slot, so lookups never scan every judge's windows
+weekly_availability_index = {}  # {slot_of_week: {judge_ids}}
+dated_availability_index = {}   # {(date, slot_of_day): {judge_ids}}
+
+def _availability_slot_keys(window: dict):
+    """Index keys of every slot a window fully covers"""
+    start, end = window['start'], window['end']
+    if end <= start:
+        end += 24 * 60
+    first_slot = -(-start // AVAILABILITY_SLOT_MINUTES)  # Round inwards so partial slots never count
+    last_slot = end // AVAILABILITY_SLOT_MINUTES
+    for slot in range(first_slot, last_slot):
+        if window['kind'] == 'weekly':
+            yield ('weekly', (window['weekday'] * SLOTS_PER_DAY + slot) % SLOTS_PER_WEEK)
+        else:
+            day = datetime.date.fromisoformat(window['date']) + datetime.timedelta(days=slot // SLOTS_PER_DAY)
+            yield ('dated', (day, slot % SLOTS_PER_DAY))
+
+def _availability_bucket(kind: str, key, create: bool = False) -> Optional[set]:
+    index = weekly_availability_index if kind == 'weekly' else dated_availability_index
+    if create:
+        return index.setdefault(key, set())
+    return index.get(key)
+
+def rebuild_availability_index():
+    """Rebuild the slot index from judge_availability"""
+    weekly_availability_index.clear()
+    dated_availability_index.clear()
+    for judge_id, windows in judge_availability.items():
+        for window in windows:
+            for kind, key in _availability_slot_keys(window):
+                _availability_bucket(kind, key, create=True).add(judge_id)
+
+def load_judge_availability():
+    """Load availability windows, dropping one-off windows that have passed"""
+    try:
+        if os.path.exists(JUDGE_AVAILABILITY_FILE):
+            with open(JUDGE_AVAILABILITY_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        else:
+            data = {}
+    except Exception as e:
+        log.error("Error loading judge availability: %s", e)
+        data = {}
+
+    yesterday = (datetime.datetime.utcnow().date() - datetime.timedelta(days=1)).isoformat()
+    judge_availability.clear()
+    for judge_id, windows in data.items():
+        kept = [window for window in windows if window['kind'] == 'weekly' or window['date'] >= yesterday]
+        if kept:
+            judge_availability[int(judge_id)] = kept
+    rebuild_availability_index()
+    log.info("Loaded availability for %s judge(s)", len(judge_availability))
+
+def save_judge_availability():
+    """Persist availability windows"""
+    try:
+        with open(JUDGE_AVAILABILITY_FILE, 'w', encoding='utf-8') as f:
+            json.dump({str(judge_id): windows for judge_id, windows in judge_availability.items()}, f, indent=2)
+        return True
+    except Exception as e:
+        log.error("Error saving judge availability: %s", e)
+        return False
+
+def set_judge_availability(judge_id: int, windows: list):
+    """Replace a judge's windows and refresh only their slot index entries"""
+    for window in judge_availability.get(judge_id, []):
+        for kind, key in _availability_slot_keys(window):
+            bucket = _availability_bucket(kind, key)
+            if bucket is not None:
+                bucket.discard(judge_id)
+    if windows:
+        judge_availability[judge_id] = windows
+        for window in windows:
+            for kind, key in _availability_slot_keys(window):
+                _availability_bucket(kind, key, create=True).add(judge_id)
+    else:
+        judge_availability.pop(judge_id, None)
+    save_judge_availability()
+
+def available_judges(start: datetime.datetime, end: Optional[datetime.datetime] = None) -> set:
+    """Judges whose weekly or one-off availability covers [start, end) in naive UTC.
+
+    Intersects the per-slot judge sets for the slots the window touches, so the cost
+    depends on the match length and the judges in those slots, not on every window.
+    """
+    end = end or start + datetime.timedelta(minutes=JUDGE_BOOKING_MINUTES)
+    slot_start = start.replace(minute=start.minute - start.minute % AVAILABILITY_SLOT_MINUTES, second=0, microsecond=0)
+    judges = None
+    while slot_start < end:
+        slot_of_day = (slot_start.hour * 60 + slot_start.minute) // AVAILABILITY_SLOT_MINUTES
+        weekly = weekly_availability_index.get(slot_start.weekday() * SLOTS_PER_DAY + slot_of_day, set())
+        dated = dated_availability_index.get((slot_start.date(), slot_of_day), set())
+        in_slot = weekly | dated
+        judges = in_slot if judges is None else judges & in_slot
+        if not judges:
+            return set()
+        slot_start += datetime.timedelta(minutes=AVAILABILITY_SLOT_MINUTES)
+    return judges or set()
+
+def parse_clock(text: str) -> int:
+    """Parse HH:MM (UTC) into minutes of the day"""
+    match = re.fullmatch(r"\s*(\d{1,2})(?::(\d{2}))?\s*", text or "")
+    hours, minutes = (int(match.group(1)), int(match.group(2) or 0)) if match else (99, 0)
+    if hours > 24 or minutes > 59 or (hours == 24 and minutes):
+        raise ValueError(f"Invalid time '{text}'. Use HH:MM in UTC, e.g. 14:30")
+    return (hours * 60 + minutes) % (24 * 60)
+
+def build_judge_ping(event_data: dict) -> str:
+    """Mention judges free for an event, falling back to the Judge role when nobody is"""
+    window = event_booking_window(event_data)
+    judges = available_judges(*window) if window else set()
+    captain_ids = {get_event_captain_id(event_data, 1), get_event_captain_id(event_data, 2)}
+    free = sorted(
+        judge_id for judge_id in judges
+        if judge_id not in captain_ids
+        and len(judge_assignments.get(judge_id, ())) < JUDGE_MAX_ASSIGNMENTS
+        and not find_booking_conflict(judge_bookings.get(judge_id, []), *window)
+    )
+    if not free:
+        return f"<@&{ROLE_IDS['judge']}>"
+    return " ".join(f"<@{judge_id}>" for judge_id in free[:20])
+
+def describe_availability_window(window: dict) -> str:
+    start = f"{window['start'] // 60:02d}:{window['start'] % 60:02d}"
+    end = f"{window['end'] // 60:02d}:{window['end'] % 60:02d}"
+    if window['kind'] == 'weekly':
+        return f"Every {WEEKDAY_NAMES[window['weekday']]} {start}-{end} UTC"
+    day = datetime.date.fromisoformat(window['date'])
+    return f"{day.strftime('%a %d/%m')} {start}-{end} UTC"
+
+# ===========================================================================================
+# MATCH SLOT ALLOCATION AND JUDGE AUTO-ASSIGN
+# ===========================================================================================
+
+def free_judges_for_window(start: datetime.datetime, end: datetime.datetime) -> set:
+    """Available judges who are under the cap and not booked during the window"""
+    return {
+        judge_id for judge_id in available_judges(start, end)
+        if len(judge_assignments.get(judge_id, ())) < JUDGE_MAX_ASSIGNMENTS
+        and not find_booking_conflict(judge_bookings.get(judge_id, []), start, end)
+    }
+
+def rank_match_slots(day: datetime.date, captain_ids: tuple = ()) -> list:
+    """Score every match slot on a day for the given captains, best first.
+
+    Slots where a captain already plays, or that have passed, are left out. The rest
+    are ordered by free judges (most first), then by matches already in the slot.
+    Returns dicts with 'start', 'matches' and 'free_judges'.
+    """
+    now = datetime.datetime.utcnow()
+    ranked = []
+    for hour, minute in MATCH_SLOT_TIMES:
+        start = datetime.datetime.combine(day, datetime.time(hour, minute))
+        if start <= now:
+            continue
+        end = start + datetime.timedelta(minutes=JUDGE_BOOKING_MINUTES)
+        keys = window_slot_keys(start, end)
+        if any(
+            slot in captain_slot_index.get((captain_id, key_day), {})
+            for captain_id in captain_ids for key_day, slot in keys
+        ):
+            continue
+        matches = max((len(slot_occupancy.get(key_day, {}).get(slot, ())) for key_day, slot in keys), default=0)
+        ranked.append({'start': start, 'matches': matches, 'free_judges': len(free_judges_for_window(start, end))})
+    # Random tie-break keeps equally good slots from always landing on the earliest one
+    random.shuffle(ranked)
+    ranked.sort(key=lambda slot: (-slot['free_judges'], slot['matches']))
+    return ranked
+
+def propose_judge_assignments(judge_ids: list, until: Optional[datetime.datetime] = None, max_assignments: int = JUDGE_MAX_ASSIGNMENTS, **filters) -> tuple[list, list]:
+    """Plan judges for upcoming unassigned events without changing anything.
+
+    Events are taken earliest first; each goes to the least-loaded judge who is available
+    at the match time, under the cap, not one of its captains and has no overlapping booking.
+    Judges who set availability are only used inside their windows; judges with none on file
+    are treated as unrestricted. Overlap checks run against per-judge copies of the booking
+    lists, so each is O(log n).
+    Returns ([(event_id, judge_id)], [event_ids nobody could take]).
+    """
+    loads = {judge_id: len(judge_assignments.get(judge_id, ())) for judge_id in judge_ids}
+    bookings = {judge_id: list(judge_bookings.get(judge_id, [])) for judge_id in judge_ids}
+    plan, unplanned = [], []
+
+    events, _ = query_unassigned_events(None, len(unassigned_index), **filters)
+    for event_start, event_id in events:
+        if until and event_start > until:
+            break
+        event_data = scheduled_events[event_id]
+        window = event_booking_window(event_data)
+        captain_ids = (get_event_captain_id(event_data, 1), get_event_captain_id(event_data, 2))
+        available = available_judges(*window) if window else None
+        chosen = None
+        for judge_id in sorted(judge_ids, key=lambda j: (loads[j], j)):
+            if loads[judge_id] >= max_assignments:
+                break  # Sorted by load, so every remaining judge is at the cap too
+            if judge_id in captain_ids:
+                continue
+            if available is not None and judge_availability.get(judge_id) and judge_id not in available:
+                continue
+            if window and find_booking_conflict(bookings[judge_id], *window):
+                continue
+            chosen = judge_id
+            break
+        if chosen is None:
+            unplanned.append(event_id)
+            continue
+        plan.append((event_id, chosen))
+        loads[chosen] += 1
+        if window:
+            bisect.insort(bookings[chosen], (*window, event_id))
+    return plan, unplanned
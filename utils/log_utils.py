@@ -0,0 +1,171 @@
+"""Structured JSON-lines logging written by a background thread, tagged with event and command context"""
+import logging
+import logging.handlers
+import os
+import sys
+import json
+import queue
+import atexit
+import datetime
+import contextvars
+from typing import Optional
+
+# ===========================================================================================
+# STRUCTURED LOGGING
+# ===========================================================================================
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FILE = os.getenv("LOG_FILE")  # JSON lines go to stdout unless a file is set
+# DEBUG lines from the same call site are kept 1 in N; poster rendering alone logs ~10 per poster
+LOG_DEBUG_SAMPLE_EVERY = max(1, int(os.getenv("LOG_DEBUG_SAMPLE_EVERY", "10")))
+LOG_QUEUE_SIZE = 10000  # Lines waiting for the writer thread; further lines are dropped, never blocked on
+
+# Record attributes copied into every JSON line when set (from the context below or `extra=`)
+LOG_CONTEXT_FIELDS = ('event_id', 'command', 'user_id', 'channel_id', 'guild_id')
+
+# Context of the running task; each asyncio task works on its own copy
+log_context = contextvars.ContextVar('log_context', default={})
+
+log_stats = {'dropped': 0, 'sampled_out': 0}
+log_queue = None
+log_listener = None
+
+def bind_log_context(**fields):
+    """Tag every line the current task logs from here on (event_id, command, ...)"""
+    log_context.set({**log_context.get(), **{key: value for key, value in fields.items() if value is not None}})
+
+def set_log_context(**fields):
+    """Replace the current task's context; background tasks otherwise inherit the command that started them"""
+    log_context.set({key: value for key, value in fields.items() if value is not None})
+
+def _find_option(options: list, name: str):
+    for option in options or ():
+        if option.get('name') == name and 'value' in option:
+            return option['value']
+        found = _find_option(option.get('options'), name)
+        if found is not None:
+            return found
+    return None
+
+def bind_interaction_context(interaction) -> None:
+    """Tag the lines logged while an interaction is handled with its command, user, channel and event"""
+    command = interaction.command
+    data = interaction.data or {}
+    bind_log_context(
+        command=command.qualified_name if command else data.get('name') or data.get('custom_id'),
+        user_id=interaction.user.id if interaction.user else None,
+        channel_id=interaction.channel_id,
+        guild_id=interaction.guild_id,
+        event_id=_find_option(data.get('options'), 'event'),
+    )
+
+class ContextFilter(logging.Filter):
+    """Copies the task's log context onto records; runs in the logging task, not the writer thread"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        for key, value in log_context.get().items():
+            if not hasattr(record, key):
+                setattr(record, key, value)
+        return True
+
+class DebugSampler(logging.Filter):
+    """Keeps the first DEBUG line of each call site and then one in every `every`.
+
+    Sites are keyed by logger and message template, so sampled calls should pass their
+    values as arguments (log.debug("Added %s", text)) rather than pre-formatting them.
+    """
+
+    MAX_SITES = 4096
+
+    def __init__(self, every: int):
+        super().__init__()
+        self.every = every
+        self.counts = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno != logging.DEBUG or self.every <= 1:
+            return True
+        key = (record.name, record.msg)
+        count = self.counts.get(key, 0)
+        if len(self.counts) >= self.MAX_SITES and count == 0:
+            self.counts.clear()
+        self.counts[key] = count + 1
+        if count % self.every:
+            log_stats['sampled_out'] += 1
+            return False
+        record.sample_rate = self.every
+        return True
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname.lower(),
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        for field in LOG_CONTEXT_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if getattr(record, 'sample_rate', None):
+            entry['sample_rate'] = record.sample_rate
+        if record.exc_info:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exc'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class StructuredQueueHandler(logging.handlers.QueueHandler):
+    """Hands records to the writer thread without blocking the event loop"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Render the message and traceback now, while the arguments still hold their current values;
+        # formatting into JSON and the actual write happen on the writer thread
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            log_stats['dropped'] += 1
+
+def setup_logging(level: Optional[str] = None):
+    """Route the root logger (discord.py included) through the queue to the JSON writer thread"""
+    global log_queue, log_listener
+    if log_listener is not None:
+        return
+    log_queue = queue.Queue(LOG_QUEUE_SIZE)
+    handler = StructuredQueueHandler(log_queue)
+    handler.addFilter(DebugSampler(LOG_DEBUG_SAMPLE_EVERY))
+    handler.addFilter(ContextFilter())
+
+    if LOG_FILE:
+        os.makedirs(os.path.dirname(LOG_FILE) or ".", exist_ok=True)
+        output = logging.FileHandler(LOG_FILE, encoding='utf-8')
+    else:
+        output = logging.StreamHandler(sys.stdout)
+    output.setFormatter(JsonFormatter())
+
+    root = logging.getLogger()
+    root.setLevel(level or LOG_LEVEL)
+    root.addHandler(handler)
+    log_listener = logging.handlers.QueueListener(log_queue, output)
+    log_listener.start()
+    # Flush whatever is still queued on shutdown
+    atexit.register(log_listener.stop)
+
+def format_log_stats() -> str:
+    pending = log_queue.qsize() if log_queue else 0
+    return (
+        f"Level {logging.getLevelName(logging.getLogger().level)} • {pending} queued • "
+        f"{log_stats['dropped']} dropped • {log_stats['sampled_out']} debug line(s) sampled out"
+    )
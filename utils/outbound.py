@@ -0,0 +1,319 @@
+"""Prioritized, rate-limit aware queue for channel sends, edits and deletes"""
+import discord
+import os
+import logging
+import datetime
+import asyncio
+from collections import deque
+from typing import Optional
+
+from utils.log_utils import set_log_context
+
+log = logging.getLogger(__name__)
+
+# ===========================================================================================
+# OUTBOUND MESSAGE QUEUE
+# ===========================================================================================
+
+# Lower runs first: reminders are time-critical, then replies to commands and buttons, then logs
+PRIORITY_REMINDER = 0
+PRIORITY_INTERACTIVE = 1
+PRIORITY_LOG = 2
+PRIORITY_NAMES = {PRIORITY_REMINDER: "reminder", PRIORITY_INTERACTIVE: "interactive", PRIORITY_LOG: "log"}
+
+# Local copy of Discord's message buckets (5 requests per 5 s per channel route, 50/s globally).
+# discord.py still handles real 429s; the local buckets decide which queued work spends them first
+OUTBOUND_ROUTE_LIMIT = 5
+OUTBOUND_ROUTE_WINDOW = 5.0  # Seconds
+OUTBOUND_GLOBAL_LIMIT = 50   # Requests per second across all routes
+OUTBOUND_CONCURRENCY = int(os.getenv("OUTBOUND_CONCURRENCY", "8"))
+OUTBOUND_LATENCY_SAMPLES = 256
+OUTBOUND_HISTORY_ROUTES = 1024  # Route buckets kept before idle ones are pruned
+
+# Bulk delete takes up to 100 messages, none older than 14 days
+BULK_DELETE_MAX = 100
+BULK_DELETE_MAX_AGE = datetime.timedelta(days=14)
+
+def bulk_deletable(message: discord.abc.Snowflake) -> bool:
+    """Whether a message is young enough for the bulk delete endpoint"""
+    return discord.utils.utcnow() - discord.utils.snowflake_time(message.id) < BULK_DELETE_MAX_AGE - datetime.timedelta(minutes=1)
+
+def _consume_exception(future: asyncio.Future):
+    # Fire-and-forget callers never await their future; mark errors as retrieved
+    if not future.cancelled():
+        future.exception()
+
+class OutboundJob:
+    """One queued request; `run` is a zero-argument coroutine factory, `message` is set for deletes"""
+
+    __slots__ = ('priority', 'route', 'run', 'message', 'future', 'queued_at')
+
+    def __init__(self, priority: int, route: tuple, run, message, future: asyncio.Future, queued_at: float):
+        self.priority = priority
+        self.route = route
+        self.run = run
+        self.message = message
+        self.future = future
+        self.queued_at = queued_at
+
+class OutboundQueue:
+    """Single dispatch point for channel sends, edits and deletes.
+
+    Jobs wait in one FIFO per priority. The dispatcher always starts the highest-priority
+    job whose route (kind, channel) still has room in its local bucket, so a channel that
+    is being flooded never holds up work for other channels, and a burst of results or
+    logs cannot push reminders behind the rate limit. Pending deletes for the same channel
+    are coalesced into one bulk delete.
+    """
+
+    def __init__(self):
+        self.pending = {priority: deque() for priority in sorted(PRIORITY_NAMES)}
+        self.history = {}               # {route: deque of loop times of recent requests}
+        self.global_history = deque()   # Loop times of requests in the last second
+        self.waits = {priority: deque(maxlen=OUTBOUND_LATENCY_SAMPLES) for priority in PRIORITY_NAMES}
+        self.completed = {priority: 0 for priority in PRIORITY_NAMES}
+        self.bulk_deletes = 0
+        self.bulk_deleted_messages = 0
+        self.deleted_messages = 0  # Messages deleted through the queue
+        self.delete_calls = 0      # API calls those deletes took
+        self.failed_deletes = 0    # Deletes Discord rejected (missing message excluded)
+        self.wakeup = asyncio.Event()
+        self.slots = asyncio.Semaphore(OUTBOUND_CONCURRENCY)
+        self.dispatcher = None
+        self.running = set()
+
+    # ---- submitting work ----
+
+    def submit(self, route: tuple, priority: int, run=None, message=None) -> asyncio.Future:
+        """Queue a job; the returned future resolves to the request's result"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        future.add_done_callback(_consume_exception)
+        self.pending[priority].append(OutboundJob(priority, route, run, message, future, loop.time()))
+        self.wakeup.set()
+        if self.dispatcher is None or self.dispatcher.done():
+            self.dispatcher = asyncio.create_task(self._dispatch())
+        return future
+
+    def send(self, channel: discord.abc.Messageable, priority: int = PRIORITY_INTERACTIVE, **kwargs) -> asyncio.Future:
+        return self.submit(('send', channel.id), priority, lambda: channel.send(**kwargs))
+
+    def edit(self, message: discord.Message, priority: int = PRIORITY_INTERACTIVE, **kwargs) -> asyncio.Future:
+        return self.submit(('edit', message.channel.id), priority, lambda: message.edit(**kwargs))
+
+    def delete(self, message: discord.Message, priority: int = PRIORITY_LOG) -> asyncio.Future:
+        """Queue a delete; deletes pending for the same channel go out as one bulk delete"""
+        return self.submit(('delete', message.channel.id), priority, message=message)
+
+    def delete_batch(self, channel, messages: list, priority: int = PRIORITY_LOG) -> asyncio.Future:
+        """Queue known deletes for one channel as a single job; resolves to (API calls used, messages deleted)"""
+        return self.submit(('delete', channel.id), priority, lambda: self._delete_messages(channel, messages))
+
+    def depth(self) -> int:
+        return sum(len(jobs) for jobs in self.pending.values())
+
+    # ---- buckets ----
+
+    def delay_for(self, route: tuple, now: float) -> float:
+        """Seconds until a route's local bucket allows another request"""
+        recent = self.history.get(route)
+        if not recent:
+            return 0.0
+        while recent and now - recent[0] >= OUTBOUND_ROUTE_WINDOW:
+            recent.popleft()
+        if len(recent) < OUTBOUND_ROUTE_LIMIT:
+            return 0.0
+        return recent[-OUTBOUND_ROUTE_LIMIT] + OUTBOUND_ROUTE_WINDOW - now
+
+    def _global_delay(self, now: float) -> float:
+        while self.global_history and now - self.global_history[0] >= 1.0:
+            self.global_history.popleft()
+        if len(self.global_history) < OUTBOUND_GLOBAL_LIMIT:
+            return 0.0
+        return self.global_history[-OUTBOUND_GLOBAL_LIMIT] + 1.0 - now
+
+    def _spend(self, route: tuple, now: float):
+        if route not in self.history and len(self.history) >= OUTBOUND_HISTORY_ROUTES:
+            self._prune_history(now)
+        self.history.setdefault(route, deque()).append(now)
+        self.global_history.append(now)
+
+    def _prune_history(self, now: float):
+        """Forget routes with no request inside the bucket window; they would allow a request anyway"""
+        for route in [route for route, recent in self.history.items() if not recent or now - recent[-1] >= OUTBOUND_ROUTE_WINDOW]:
+            del self.history[route]
+
+    # ---- dispatch ----
+
+    def _take_ready(self, now: float) -> tuple[Optional[list], float]:
+        """The highest-priority runnable job (a batch for deletes), or how long to wait for one"""
+        wait = self._global_delay(now)
+        if wait > 0:
+            return None, wait
+        wait = float('inf')
+        blocked = set()
+        for jobs in self.pending.values():
+            for index, job in enumerate(jobs):
+                if job.route in blocked:
+                    continue
+                delay = self.delay_for(job.route, now)
+                if delay > 0:
+                    blocked.add(job.route)
+                    wait = min(wait, delay)
+                    continue
+                del jobs[index]
+                batch = [job]
+                if job.message is not None and bulk_deletable(job.message):
+                    batch.extend(self._take_deletes(job.route, BULK_DELETE_MAX - 1))
+                return batch, 0.0
+        return None, wait
+
+    def _take_deletes(self, route: tuple, limit: int) -> list:
+        """Pull other bulk-deletable deletes for the same channel, from any priority"""
+        taken = []
+        for priority, jobs in self.pending.items():
+            kept = deque()
+            for job in jobs:
+                if len(taken) < limit and job.route == route and job.message is not None and bulk_deletable(job.message):
+                    taken.append(job)
+                else:
+                    kept.append(job)
+            self.pending[priority] = kept
+        return taken
+
+    async def _dispatch(self):
+        set_log_context(command="outbound_queue")
+        loop = asyncio.get_running_loop()
+        while self.depth():
+            await self.slots.acquire()
+            now = loop.time()
+            batch, wait = self._take_ready(now)
+            if batch is None:
+                self.slots.release()
+                self.wakeup.clear()
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            self._spend(batch[0].route, now)
+            for job in batch:
+                self.waits[job.priority].append(now - job.queued_at)
+                self.completed[job.priority] += 1
+            task = asyncio.create_task(self._run(batch))
+            self.running.add(task)
+            task.add_done_callback(self.running.discard)
+        # Idle: drop the buckets of channels that have gone quiet
+        self._prune_history(loop.time())
+
+    async def _run(self, batch: list):
+        try:
+            if batch[0].message is not None:
+                await self._delete(batch)
+                return
+            job = batch[0]
+            try:
+                result = await job.run()
+            except Exception as e:
+                if not job.future.done():
+                    job.future.set_exception(e)
+            else:
+                if not job.future.done():
+                    job.future.set_result(result)
+        finally:
+            self.slots.release()
+
+    async def _bulk_delete(self, channel, messages: list) -> bool:
+        """One bulk delete call for 2-100 young messages; False if the caller should delete one by one"""
+        if len(messages) < 2 or not hasattr(channel, 'delete_messages'):
+            return False
+        try:
+            await channel.delete_messages(messages)
+        except discord.HTTPException as e:
+            # Bulk delete needs Manage Messages; fall back to deleting one by one
+            log.warning("Bulk delete of %s message(s) in channel %s failed, deleting individually: %s", len(messages), channel.id, e)
+            return False
+        self.bulk_deletes += 1
+        self.bulk_deleted_messages += len(messages)
+        self.deleted_messages += len(messages)
+        self.delete_calls += 1
+        return True
+
+    async def _single_delete(self, route: tuple, message, spend: bool):
+        if spend:
+            self._spend(route, asyncio.get_running_loop().time())
+        await message.delete()
+        # Counted once Discord accepted it, so the metrics and sweep stats only show real deletes
+        self.deleted_messages += 1
+        self.delete_calls += 1
+
+    async def _delete(self, batch: list):
+        channel = batch[0].message.channel
+        if await self._bulk_delete(channel, [job.message for job in batch]):
+            for job in batch:
+                if not job.future.done():
+                    job.future.set_result(None)
+            return
+        for index, job in enumerate(batch):
+            try:
+                await self._single_delete(job.route, job.message, spend=index > 0)
+            except Exception as e:
+                if isinstance(e, discord.HTTPException) and not isinstance(e, discord.NotFound):
+                    self.failed_deletes += 1
+                if not job.future.done():
+                    job.future.set_exception(e)
+            else:
+                if not job.future.done():
+                    job.future.set_result(None)
+
+    async def _delete_messages(self, channel, messages: list) -> tuple[int, int]:
+        """Delete messages from one channel, 100 per bulk call where allowed; returns (API calls made, messages deleted)"""
+        calls_before = self.delete_calls
+        deleted_before = self.deleted_messages
+        route = ('delete', channel.id)
+        singles = [message for message in messages if not bulk_deletable(message)]
+        young = [message for message in messages if bulk_deletable(message)]
+        # The job itself paid for the first request; every later one spends from the bucket
+        attempted = False
+        for start in range(0, len(young), BULK_DELETE_MAX):
+            chunk = young[start:start + BULK_DELETE_MAX]
+            if attempted and len(chunk) > 1:
+                self._spend(route, asyncio.get_running_loop().time())
+            if len(chunk) > 1:
+                attempted = True
+            if not await self._bulk_delete(channel, chunk):
+                singles.extend(chunk)
+        for message in singles:
+            try:
+                await self._single_delete(route, message, spend=attempted)
+            except discord.NotFound:
+                pass
+            except discord.HTTPException as e:
+                # One rejected message must not abandon the rest of the channel
+                self.failed_deletes += 1
+                log.warning("Could not delete message %s in channel %s: %s", message.id, channel.id, e)
+            attempted = True
+        return self.delete_calls - calls_before, self.deleted_messages - deleted_before
+
+    # ---- metrics ----
+
+    def latency_report(self) -> str:
+        """Queue wait per priority over recent jobs"""
+        lines = []
+        for priority, name in PRIORITY_NAMES.items():
+            waits = sorted(self.waits[priority])
+            if waits:
+                p50 = waits[len(waits) // 2]
+                p95 = waits[min(len(waits) - 1, int(len(waits) * 0.95))]
+                timing = f"wait p50 {p50 * 1000:.0f} ms • p95 {p95 * 1000:.0f} ms • max {waits[-1] * 1000:.0f} ms"
+            else:
+                timing = "no samples"
+            lines.append(f"`{name}`: {self.completed[priority]} done • {len(self.pending[priority])} queued • {timing}")
+        lines.append(
+            f"Deletes: {self.deleted_messages} message(s) in {self.delete_calls} call(s), "
+            f"{self.deleted_messages - self.delete_calls} saved by {self.bulk_deletes} bulk delete(s), "
+            f"{self.failed_deletes} failed"
+        )
+        return "\n".join(lines)
+
+outbound_queue = OutboundQueue()
@@ -0,0 +1,58 @@
+"""Permission checks for commands"""
+import discord
+
+from config import BOT_OWNER_ID, ROLE_IDS
+
+def has_organizer_permission(interaction):
+    """Check if user has organizer permissions for rule management (Bot Owner or Organizer)"""
+    # Bot Owner bypass
+    if interaction.user.id == BOT_OWNER_ID:
+        return True
+    
+    organizer_role = discord.utils.get(interaction.user.roles, id=ROLE_IDS["organizer"])
+    return organizer_role is not None
+
+def check_bot_permissions(channel: discord.TextChannel) -> dict:
+    """Check if bot has necessary permissions in a channel"""
+    if not channel:
+        return {"can_edit": False, "reason": "Channel not found"}
+    
+    bot_member = channel.guild.me
+    if not bot_member:
+        return {"can_edit": False, "reason": "Bot not found in guild"}
+    
+    permissions = channel.permissions_for(bot_member)
+    
+    required_perms = {
+        "read_messages": permissions.read_messages,
+        "send_messages": permissions.send_messages,
+        "embed_links": permissions.embed_links,
+        "read_message_history": permissions.read_message_history
+    }
+    
+    missing_perms = [perm for perm, has_perm in required_perms.items() if not has_perm]
+    
+    if missing_perms:
+        return {"can_edit": False, "reason": f"Missing permissions: {', '.join(missing_perms)}"}
+    
+    return {"can_edit": True, "reason": "All permissions available"}
+
+def has_event_create_permission(interaction):
+    """Check if user has permission to create events (Bot Owner, Organizer or Bot Op)"""
+    # Bot Owner bypass
+    if interaction.user.id == BOT_OWNER_ID:
+        return True
+    
+    organizer_role = discord.utils.get(interaction.user.roles, id=ROLE_IDS["organizer"])
+    bot_op_role = discord.utils.get(interaction.user.roles, id=ROLE_IDS["bot_op"])
+    return organizer_role is not None or bot_op_role is not None
+
+def has_event_result_permission(interaction):
+    """Check if user has permission to post event results (Bot Owner, Organizer or Judge)"""
+    # Bot Owner bypass
+    if interaction.user.id == BOT_OWNER_ID:
+        return True
+    
+    organizer_role = discord.utils.get(interaction.user.roles, id=ROLE_IDS["organizer"])
+    judge_role = discord.utils.get(interaction.user.roles, id=ROLE_IDS["judge"])
+    return organizer_role is not None or judge_role is not None
@@ -0,0 +1,131 @@
+"""Player ratings storage and Elo updates"""
+import discord
+import os
+import logging
+from typing import Optional
+import re
+import datetime
+import bisect
+import json
+
+from utils.event_store import remove_sorted
+
+log = logging.getLogger(__name__)
+
+# ===========================================================================================
+# PLAYER RATINGS (Elo, updated incrementally from event results)
+# ===========================================================================================
+
+PLAYER_RATINGS_FILE = os.getenv("PLAYER_RATINGS_FILE", "player_ratings.json")
+RATING_DEFAULT = 1500
+RATING_K_FACTOR = float(os.getenv("RATING_K_FACTOR", "32"))
+# New players move faster until their rating settles
+RATING_PROVISIONAL_GAMES = 10
+RATING_PROVISIONAL_K_FACTOR = RATING_K_FACTOR * 1.5
+LEADERBOARD_PAGE_SIZE = 10
+
+# {member_id: {'rating': float, 'games': int, 'wins': int, 'losses': int, 'name': str, 'updated_at': float}}
+player_ratings = {}
+
+# Sorted (-rating, member_id) keys, so rank lookups and leaderboard pages never re-sort
+rating_rank_index = []
+
+# Identities of the matches already rated (see result_match_key), so a re-posted result counts once
+rated_matches = set()
+
+def _rating_key(member_id: int) -> tuple:
+    return (-player_ratings[member_id]['rating'], member_id)
+
+def load_player_ratings():
+    """Load player ratings and rated matches, then rebuild the rank index"""
+    player_ratings.clear()
+    rated_matches.clear()
+    try:
+        if os.path.exists(PLAYER_RATINGS_FILE):
+            with open(PLAYER_RATINGS_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if 'players' not in data:
+                data = {'players': data}  # Files written before rated matches were tracked
+            player_ratings.update({int(member_id): entry for member_id, entry in data['players'].items()})
+            rated_matches.update(data.get('rated_matches', []))
+    except Exception as e:
+        log.error("Error loading player ratings: %s", e)
+        player_ratings.clear()
+        rated_matches.clear()
+    rating_rank_index[:] = sorted(_rating_key(member_id) for member_id in player_ratings)
+    log.info("Loaded %s player rating(s)", len(player_ratings))
+
+def save_player_ratings():
+    """Persist player ratings and rated matches"""
+    try:
+        temp_path = f"{PLAYER_RATINGS_FILE}.tmp"
+        data = {
+            'players': {str(member_id): entry for member_id, entry in player_ratings.items()},
+            'rated_matches': sorted(rated_matches),
+        }
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        os.replace(temp_path, PLAYER_RATINGS_FILE)
+    except Exception as e:
+        log.error("Error saving player ratings: %s", e)
+
+def get_player_rating(member_id: int) -> float:
+    entry = player_ratings.get(member_id)
+    return entry['rating'] if entry else RATING_DEFAULT
+
+def get_player_rank(member_id: int) -> Optional[int]:
+    """1-based leaderboard position, or None for unrated players"""
+    if member_id not in player_ratings:
+        return None
+    return bisect.bisect_left(rating_rank_index, _rating_key(member_id)) + 1
+
+def _set_player_rating(member: discord.abc.User, rating: float, won: bool):
+    """Update one player's entry and move their key in the rank index"""
+    entry = player_ratings.get(member.id)
+    if entry is None:
+        entry = player_ratings[member.id] = {'rating': RATING_DEFAULT, 'games': 0, 'wins': 0, 'losses': 0}
+    else:
+        remove_sorted(rating_rank_index, _rating_key(member.id))
+    entry['rating'] = round(rating, 2)
+    entry['games'] += 1
+    entry['wins' if won else 'losses'] += 1
+    entry['name'] = member.display_name
+    entry['updated_at'] = datetime.datetime.utcnow().timestamp()
+    bisect.insort(rating_rank_index, _rating_key(member.id))
+
+def result_match_key(event_id: Optional[str], channel_id: Optional[int], captain_ids: tuple,
+                     tournament: str, round: str, group: Optional[str] = None) -> str:
+    """Stable identity of a match: its event, or its channel, captains, tournament, round and group"""
+    if event_id:
+        return f"event:{event_id}"
+    low, high = sorted(captain_ids)
+    return f"channel:{channel_id}|{low}|{high}|{tournament.strip().lower()}|{round}|{group or ''}"
+
+def record_match_result(winner: discord.abc.User, loser: discord.abc.User,
+                        match_key: Optional[str] = None) -> Optional[tuple[float, float]]:
+    """Apply one Elo update for a result; returns the (winner, loser) rating changes.
+
+    Returns None without changing anything when `match_key` was already rated.
+    """
+    if match_key is not None:
+        if match_key in rated_matches:
+            return None
+        rated_matches.add(match_key)
+    winner_rating = get_player_rating(winner.id)
+    loser_rating = get_player_rating(loser.id)
+    expected = 1 / (1 + 10 ** ((loser_rating - winner_rating) / 400))
+
+    def k_factor(member_id):
+        games = player_ratings.get(member_id, {}).get('games', 0)
+        return RATING_PROVISIONAL_K_FACTOR if games < RATING_PROVISIONAL_GAMES else RATING_K_FACTOR
+
+    winner_delta = k_factor(winner.id) * (1 - expected)
+    loser_delta = -k_factor(loser.id) * (1 - expected)
+    _set_player_rating(winner, winner_rating + winner_delta, won=True)
+    _set_player_rating(loser, loser_rating + loser_delta, won=False)
+    save_player_ratings()
+    return winner_delta, loser_delta
+
+def parse_member_ids(text: str) -> list[int]:
+    """Pull member IDs out of mentions or raw IDs, keeping their order"""
+    return [int(mention_id or raw_id) for mention_id, raw_id in re.findall(r"<@!?(\d+)>|\b(\d{15,20})\b", text)]
@@ -0,0 +1,234 @@
+"""Event reminders and post-result cleanup"""
+import discord
+import os
+import logging
+from typing import Optional
+import datetime
+import asyncio
+
+from utils.startup import lazy_import
+from utils.bot import resolve_channel
+from utils.event_store import (
+    MESSAGE_ROLE_REMINDER,
+    register_event_message,
+    reminder_tasks,
+    save_scheduled_events,
+    scheduled_events,
+    unindex_event,
+)
+
+from utils.log_utils import set_log_context
+from utils.outbound import outbound_queue, PRIORITY_REMINDER
+
+log = logging.getLogger(__name__)
+
+pytz = lazy_import("pytz")
+
+# ===========================================================================================
+# NOTIFICATION AND REMINDER SYSTEM (Ten-minute reminder for captains and judge)
+# ===========================================================================================
+
+async def send_ten_minute_reminder(event_id: str, team1_captain: discord.Member, team2_captain: discord.Member, judge: Optional[discord.Member], event_channel: discord.TextChannel, match_time: datetime.datetime):
+    """Send 10-minute reminder notification to judge and captains"""
+    try:
+        if not event_channel:
+            log.warning("No event channel provided for event %s", event_id)
+            return
+
+        # Get the latest judge from scheduled_events if available
+        resolved_judge = judge
+        if event_id in scheduled_events:
+            stored_judge = scheduled_events[event_id].get('judge')
+            if stored_judge:
+                resolved_judge = stored_judge
+
+        # Create reminder embed
+        embed = discord.Embed(
+            title="⏰ 10-MINUTE MATCH REMINDER",
+            description=f"**Your tournament match is starting in 10 minutes!**",
+            color=discord.Color.orange(),
+            timestamp=discord.utils.utcnow()
+        )
+        embed.add_field(name="🕒 Match Time", value=f"<t:{int(match_time.timestamp())}:F>", inline=False)
+        embed.add_field(name="👥 Team Captains", value=f"{team1_captain.mention} vs {team2_captain.mention}", inline=False)
+        if resolved_judge:
+            embed.add_field(name="👨‍⚖️ Judge", value=f"{resolved_judge.mention}", inline=False)
+        embed.add_field(name="� ActAion Required", value="Please prepare for the match and join the designated channel.", inline=False)
+        embed.set_footer(text="Tournament Management System")
+
+        # Send notification with pings
+        pings = f"{team1_captain.mention} {team2_captain.mention}"
+        if resolved_judge:
+            pings = f"{resolved_judge.mention} " + pings
+        notification_text = f"🔔 **MATCH REMINDER**\n\n{pings}\n\nYour match starts in **10 minutes**!"
+
+        reminder_message = await outbound_queue.send(event_channel, PRIORITY_REMINDER, content=notification_text, embed=embed)
+        register_event_message(event_id, reminder_message, MESSAGE_ROLE_REMINDER)
+        save_scheduled_events()
+        log.info("10-minute reminder sent for event %s", event_id)
+    except Exception as e:
+        log.error("Error sending 10-minute reminder for event %s: %s", event_id, e)
+
+
+async def schedule_ten_minute_reminder(event_id: str, team1_captain: discord.Member, team2_captain: discord.Member, judge: Optional[discord.Member], event_channel: discord.TextChannel, match_time: datetime.datetime):
+    """Schedule a 10-minute reminder for the match"""
+    try:
+        # Calculate when to send the 10-minute reminder
+        reminder_time = match_time - datetime.timedelta(minutes=10)
+        now = datetime.datetime.now(pytz.UTC)
+
+        # Ensure match_time and reminder_time are timezone-aware UTC
+        if match_time.tzinfo is None:
+            match_time = match_time.replace(tzinfo=pytz.UTC)
+            reminder_time = match_time - datetime.timedelta(minutes=10)
+
+        # Check if reminder time is in the future
+        if reminder_time <= now:
+            log.warning("Reminder time for event %s is in the past, skipping", event_id)
+            return
+
+        # Calculate delay in seconds
+        delay_seconds = (reminder_time - now).total_seconds()
+
+        async def reminder_task():
+            set_log_context(command="reminder", event_id=event_id)
+            try:
+                await asyncio.sleep(delay_seconds)
+                await send_ten_minute_reminder(event_id, team1_captain, team2_captain, judge, event_channel, match_time)
+            except asyncio.CancelledError:
+                log.info("Reminder task for event %s was cancelled", event_id)
+            except Exception as e:
+                log.exception("Error in reminder task for event %s: %s", event_id, e)
+
+        # Cancel existing reminder if any
+        if event_id in reminder_tasks:
+            reminder_tasks[event_id].cancel()
+
+        # Schedule new reminder
+        reminder_tasks[event_id] = asyncio.create_task(reminder_task())
+        log.info("10-minute reminder scheduled for event %s at %s", event_id, reminder_time)
+    except Exception as e:
+        log.error("Error scheduling 10-minute reminder for event %s: %s", event_id, e)
+
+
+async def schedule_event_reminder_v2(event_id: str, team1_captain: discord.Member, team2_captain: discord.Member, judge: Optional[discord.Member], event_channel: discord.TextChannel):
+    """Schedule event reminder with 10-minute notification using stored event datetime"""
+    try:
+        if event_id not in scheduled_events:
+            log.warning("Event %s not found in scheduled_events", event_id)
+            return
+        event_data = scheduled_events[event_id]
+        match_time = event_data.get('datetime')
+        if not match_time:
+            log.warning("No datetime found for event %s", event_id)
+            return
+        # Ensure timezone-aware UTC
+        if match_time.tzinfo is None:
+            match_time = match_time.replace(tzinfo=pytz.UTC)
+        await schedule_ten_minute_reminder(event_id, team1_captain, team2_captain, judge, event_channel, match_time)
+    except Exception as e:
+        log.error("Error in schedule_event_reminder_v2 for event %s: %s", event_id, e)
+
+# ===========================================================================================
+# CLEANUP SWEEP (removes finished events in batches)
+# ===========================================================================================
+
+CLEANUP_SWEEP_INTERVAL = int(os.getenv("CLEANUP_SWEEP_INTERVAL", "300"))  # Seconds between sweeps
+
+cleanup_sweep_stats = {'sweeps': 0, 'events': 0, 'messages': 0, 'api_calls': 0}
+cleanup_sweep_task = None
+
+async def schedule_event_cleanup(event_id: str, delay_hours: int = 24):
+    """Mark an event for removal after delay_hours (default 24h); the cleanup sweep removes it."""
+    try:
+        if event_id not in scheduled_events:
+            return
+        cleanup_at = datetime.datetime.utcnow() + datetime.timedelta(hours=delay_hours)
+        # Persisted with the event, so pending cleanups survive a restart
+        scheduled_events[event_id]['cleanup_at'] = cleanup_at.isoformat()
+        save_scheduled_events()
+        ensure_cleanup_sweep()
+        log.info("Cleanup scheduled for event %s in %s hours", event_id, delay_hours)
+    except Exception as e:
+        log.error("Error scheduling cleanup for event %s: %s", event_id, e)
+
+def ensure_cleanup_sweep():
+    """Start the periodic cleanup sweep if it is not already running"""
+    global cleanup_sweep_task
+    if cleanup_sweep_task is None or cleanup_sweep_task.done():
+        cleanup_sweep_task = asyncio.create_task(_cleanup_sweep_loop())
+
+async def _cleanup_sweep_loop():
+    # Runs while any event is waiting for cleanup; schedule_event_cleanup restarts it
+    set_log_context(command="cleanup_sweep")
+    while any('cleanup_at' in data for data in scheduled_events.values()):
+        await asyncio.sleep(CLEANUP_SWEEP_INTERVAL)
+        try:
+            await run_cleanup_sweep()
+        except Exception as e:
+            log.exception("Error in cleanup sweep: %s", e)
+
+async def run_cleanup_sweep(now: Optional[datetime.datetime] = None) -> Optional[dict]:
+    """Remove every event whose cleanup is due, deleting their schedule messages per channel in bulk"""
+    now = now or datetime.datetime.utcnow()
+    due = [
+        event_id for event_id, data in scheduled_events.items()
+        if data.get('cleanup_at') and datetime.datetime.fromisoformat(data['cleanup_at']) <= now
+    ]
+    if not due:
+        return None
+
+    # Gather the schedule messages of all due events per channel; deleting needs only the IDs
+    by_channel = {}
+    for event_id in due:
+        data = scheduled_events[event_id]
+        channel = resolve_channel(data.get('schedule_channel_id'))
+        message_id = data.get('schedule_message_id')
+        if channel and message_id:
+            by_channel.setdefault(channel.id, (channel, []))[1].append(channel.get_partial_message(message_id))
+
+    results = await asyncio.gather(
+        *(outbound_queue.delete_batch(channel, messages) for channel, messages in by_channel.values()),
+        return_exceptions=True
+    )
+    # Only messages Discord actually deleted count, so failed deletes don't inflate the savings
+    api_calls = 0
+    message_count = 0
+    for (channel, messages), result in zip(by_channel.values(), results):
+        if isinstance(result, Exception):
+            log.error("Error deleting %s schedule message(s) in channel %s: %s", len(messages), channel.id, result)
+        else:
+            calls, deleted = result
+            api_calls += calls
+            message_count += deleted
+
+    removed = 0
+    for event_id in due:
+        data = scheduled_events.get(event_id)
+        if not data:
+            continue  # Deleted while the messages were going out
+
+        # Clean up poster file if any
+        try:
+            poster_path = data.get('poster_path')
+            if poster_path and os.path.exists(poster_path):
+                os.remove(poster_path)
+        except Exception as e:
+            log.error("Poster cleanup error for %s: %s", event_id, e)
+
+        # Remove any reminder task
+        task = reminder_tasks.pop(event_id, None)
+        if task:
+            task.cancel()
+
+        unindex_event(event_id)
+        del scheduled_events[event_id]
+        removed += 1
+    save_scheduled_events()
+
+    cleanup_sweep_stats['sweeps'] += 1
+    cleanup_sweep_stats['events'] += removed
+    cleanup_sweep_stats['messages'] += message_count
+    cleanup_sweep_stats['api_calls'] += api_calls
+    log.info("🧹 Cleanup sweep: removed %s event(s), deleted %s schedule message(s) in %s API call(s) (%s saved)", removed, message_count, api_calls, message_count - api_calls)
+    return {'events': removed, 'messages': message_count, 'api_calls': api_calls}
@@ -0,0 +1,112 @@
+"""Rate-limit aware channel rename queue"""
+import discord
+import asyncio
+
+from utils.outbound import outbound_queue
+
+# ===========================================================================================
+# CHANNEL RENAME QUEUE (coalesces ?sh/?dq/?dd/?ho status renames under Discord's rate limit)
+# ===========================================================================================
+
+# Discord allows two channel-name edits per channel every ten minutes
+CHANNEL_RENAME_LIMIT = 2
+CHANNEL_RENAME_WINDOW = 600
+
+# Ticket status commands and the channel name prefix each one applies
+STATUS_PREFIXES = {'?sh': "🟢", '?dq': "🔴", '?dd': "✅", '?ho': "🟡"}
+
+def apply_status_prefix(name: str, prefix: str) -> str:
+    """Replace any existing status prefix on a channel name"""
+    clean_name = name
+    for existing in STATUS_PREFIXES.values():
+        if clean_name.startswith(existing):
+            clean_name = clean_name[len(existing):].lstrip("-").lstrip()
+            break
+    return f"{prefix}-{clean_name}"
+
+class ChannelRenameQueue:
+    """Per-channel status rename queue that keeps only the latest requested status.
+
+    Each channel has at most one pending status and one worker task. The worker waits
+    until the channel's local rename bucket has room, then applies whatever status is
+    pending at that moment, so bursts of commands collapse into a single edit.
+    """
+
+    def __init__(self):
+        self.pending = {}  # {channel_id: {'channel', 'prefix', 'messages', 'requested_at'}}
+        self.history = {}  # {channel_id: [loop time of each recent rename]}
+        self.workers = {}  # {channel_id: asyncio.Task}
+        self.applied = 0
+        self.coalesced = 0
+        self.skipped = 0
+
+    def note_rename(self, channel_id: int):
+        """Record a rename done outside the queue so it counts against the bucket"""
+        self.history.setdefault(channel_id, []).append(asyncio.get_running_loop().time())
+
+    def delay_for(self, channel_id: int) -> float:
+        """Seconds until the channel's bucket allows another rename"""
+        now = asyncio.get_running_loop().time()
+        recent = [t for t in self.history.get(channel_id, []) if now - t < CHANNEL_RENAME_WINDOW]
+        self.history[channel_id] = recent
+        if len(recent) < CHANNEL_RENAME_LIMIT:
+            return 0.0
+        return recent[-CHANNEL_RENAME_LIMIT] + CHANNEL_RENAME_WINDOW - now
+
+    def request(self, channel, prefix: str, message: discord.Message) -> float:
+        """Queue a status for a channel; returns the estimated delay before it is applied"""
+        entry = self.pending.get(channel.id)
+        if entry:
+            entry['prefix'] = prefix
+            entry['messages'].append(message)
+            self.coalesced += 1
+        else:
+            self.pending[channel.id] = {
+                'channel': channel,
+                'prefix': prefix,
+                'messages': [message],
+                'requested_at': discord.utils.utcnow()
+            }
+        if channel.id not in self.workers:
+            self.workers[channel.id] = asyncio.create_task(self._worker(channel.id))
+        return self.delay_for(channel.id)
+
+    def depth(self) -> int:
+        return len(self.pending)
+
+    async def _worker(self, channel_id: int):
+        try:
+            while channel_id in self.pending:
+                delay = self.delay_for(channel_id)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                entry = self.pending.pop(channel_id, None)
+                if entry:
+                    await self._apply(entry)
+        finally:
+            self.workers.pop(channel_id, None)
+
+    async def _apply(self, entry: dict):
+        """Rename the channel to the latest status and clean up the command messages"""
+        channel = entry['channel']
+        new_name = apply_status_prefix(channel.name, entry['prefix'])
+        try:
+            if new_name == channel.name:
+                self.skipped += 1
+            else:
+                await channel.edit(name=new_name)
+                self.note_rename(channel.id)
+                self.applied += 1
+        except discord.Forbidden:
+            await outbound_queue.send(channel, content="❌ I don't have permission to edit this channel's name.")
+        except discord.HTTPException as e:
+            await outbound_queue.send(channel, content=f"❌ Error updating channel name: {e}")
+        except Exception as e:
+            await outbound_queue.send(channel, content=f"❌ Unexpected error: {e}")
+
+        # Delete the command messages once their status has been applied; the outbound
+        # queue bulk deletes them when a burst was coalesced
+        for message in entry['messages']:
+            outbound_queue.delete(message)
+
+channel_rename_queue = ChannelRenameQueue()
@@ -0,0 +1,51 @@
+"""Organizer-defined ? responders storage"""
+import os
+import logging
+import json
+
+log = logging.getLogger(__name__)
+
+# ===========================================================================================
+# PREFIX COMMAND REGISTRY (? commands and organizer-defined responders)
+# ===========================================================================================
+
+CUSTOM_RESPONDERS_FILE = 'custom_responders.json'
+
+# Responders seeded on first run; organizers can edit or remove them with /responder
+DEFAULT_RESPONDERS = {
+    '?b': {'type': 'text', 'content': "https://challonge.com/nwaanniversary", 'delete_trigger': True}
+}
+
+# {trigger: {'type': 'text'|'embed', 'content', 'title', 'color', 'delete_trigger', 'created_by', 'created_at'}}
+custom_responders = {}
+
+def load_custom_responders():
+    """Load organizer-defined responders, seeding the defaults on first run"""
+    custom_responders.clear()
+    try:
+        if os.path.exists(CUSTOM_RESPONDERS_FILE):
+            with open(CUSTOM_RESPONDERS_FILE, 'r', encoding='utf-8') as f:
+                custom_responders.update(json.load(f))
+        else:
+            custom_responders.update({trigger: dict(entry) for trigger, entry in DEFAULT_RESPONDERS.items()})
+            save_custom_responders()
+        log.info("Loaded %s custom responder(s)", len(custom_responders))
+    except Exception as e:
+        log.error("Error loading custom responders: %s", e)
+        custom_responders.clear()
+        custom_responders.update({trigger: dict(entry) for trigger, entry in DEFAULT_RESPONDERS.items()})
+
+def save_custom_responders():
+    """Persist organizer-defined responders"""
+    try:
+        with open(CUSTOM_RESPONDERS_FILE, 'w', encoding='utf-8') as f:
+            json.dump(custom_responders, f, indent=2, ensure_ascii=False)
+        return True
+    except Exception as e:
+        log.error("Error saving custom responders: %s", e)
+        return False
+
+def normalize_trigger(trigger: str) -> str:
+    """Triggers are matched against the whole lowercased message, always with a leading ?"""
+    trigger = trigger.strip().lower()
+    return trigger if trigger.startswith('?') else f"?{trigger}"
@@ -0,0 +1,61 @@
+"""Tournament rules storage"""
+import os
+import logging
+import datetime
+import json
+
+log = logging.getLogger(__name__)
+
+# ===========================================================================================
+# RULE MANAGEMENT SYSTEM
+# ===========================================================================================
+
+# Store tournament rules in memory
+tournament_rules = {}
+
+def load_rules():
+    """Load rules from persistent storage"""
+    tournament_rules.clear()
+    try:
+        if os.path.exists('tournament_rules.json'):
+            with open('tournament_rules.json', 'r', encoding='utf-8') as f:
+                tournament_rules.update(json.load(f))
+                log.info("Loaded tournament rules from file")
+        else:
+            log.warning("No existing rules file found, starting with empty rules")
+    except Exception as e:
+        log.error("Error loading tournament rules: %s", e)
+        tournament_rules.clear()
+
+def save_rules():
+    """Save rules to persistent storage"""
+    try:
+        with open('tournament_rules.json', 'w', encoding='utf-8') as f:
+            json.dump(tournament_rules, f, indent=2, ensure_ascii=False)
+        return True
+    except Exception as e:
+        log.error("Error saving tournament rules: %s", e)
+        return False
+
+def get_current_rules():
+    """Get current rules content"""
+    return tournament_rules.get('rules', {}).get('content', '')
+
+def set_rules_content(content, user_id, username):
+    """Set new rules content with metadata"""
+    # Sanitize content (basic cleanup)
+    if content:
+        content = content.strip()
+    
+    # Update rules with metadata
+    tournament_rules['rules'] = {
+        'content': content,
+        'last_updated': datetime.datetime.utcnow().isoformat(),
+        'updated_by': {
+            'user_id': user_id,
+            'username': username
+        },
+        'version': tournament_rules.get('rules', {}).get('version', 0) + 1
+    }
+    
+    return save_rules()
@@ -0,0 +1,477 @@
+"""Result screenshot ingestion, fan-out, image stage and archive"""
+from time import perf_counter
+import discord
+import os
+import logging
+from typing import Optional
+import datetime
+import aiohttp
+import asyncio
+import concurrent.futures
+import mmap
+import hashlib
+import math
+import io
+import json
+import tempfile
+from pathlib import Path
+
+# Imported eagerly: the image stage first touches these from several image_executor threads
+# at once, and a lazily loaded module is not safe to resolve concurrently
+from PIL import Image, ImageDraw, ImageFont
+
+from utils.outbound import outbound_queue, PRIORITY_INTERACTIVE
+
+log = logging.getLogger(__name__)
+
+# ===========================================================================================
+# RESULT SCREENSHOT INGESTION
+# ===========================================================================================
+
+SCREENSHOT_DOWNLOAD_CONCURRENCY = int(os.getenv("SCREENSHOT_DOWNLOAD_CONCURRENCY", "4"))
+SCREENSHOT_DOWNLOAD_TIMEOUT = float(os.getenv("SCREENSHOT_DOWNLOAD_TIMEOUT", "30"))  # Seconds per attachment
+SCREENSHOT_TOTAL_SIZE_LIMIT = int(os.getenv("SCREENSHOT_TOTAL_SIZE_MB", "100")) * 1024 * 1024
+SCREENSHOT_SPOOL_THRESHOLD = 2 * 1024 * 1024  # Screenshots larger than this spill from memory to disk
+SCREENSHOT_CHUNK_SIZE = 64 * 1024
+
+class IngestedScreenshot:
+    """A downloaded result screenshot held in spooled temporary storage"""
+
+    def __init__(self, slot: int, filename: str, spool: tempfile.SpooledTemporaryFile, size: int):
+        self.slot = slot          # Screenshot option number (ss_1 -> 1)
+        self.filename = filename
+        self.spool = spool
+        self.size = size
+        self._view = None
+        self._mmap = None
+
+    @property
+    def upload_name(self) -> str:
+        return f"SS-{self.slot}_{self.filename}"
+
+    def buffer(self) -> memoryview:
+        """Read-only view over the downloaded bytes, shared by every upload without copying"""
+        if self._view is None:
+            if getattr(self.spool, '_rolled', True):
+                # Spilled to disk: map the temp file instead of reading it back into memory
+                self._mmap = mmap.mmap(self.spool.fileno(), 0, access=mmap.ACCESS_READ)
+                self._view = memoryview(self._mmap)
+            else:
+                self._view = self.spool._file.getbuffer().toreadonly()
+        return self._view
+
+    def close(self):
+        try:
+            if self._view is not None:
+                self._view.release()
+            if self._mmap is not None:
+                self._mmap.close()
+            self.spool.close()
+        except Exception as e:
+            log.error("Error releasing screenshot %s: %s", self.slot, e)
+
+async def _download_screenshot(session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, slot: int, attachment: discord.Attachment) -> IngestedScreenshot:
+    """Stream one attachment into a spooled temp file, bounded by the shared semaphore"""
+    async with semaphore:
+        spool = tempfile.SpooledTemporaryFile(max_size=SCREENSHOT_SPOOL_THRESHOLD)
+        size = 0
+        try:
+            async with asyncio.timeout(SCREENSHOT_DOWNLOAD_TIMEOUT):
+                async with session.get(attachment.url) as response:
+                    response.raise_for_status()
+                    async for chunk in response.content.iter_chunked(SCREENSHOT_CHUNK_SIZE):
+                        size += len(chunk)
+                        if size > attachment.size:
+                            raise ValueError("download is larger than the reported attachment size")
+                        spool.write(chunk)
+            spool.seek(0)
+            return IngestedScreenshot(slot, attachment.filename, spool, size)
+        except BaseException:
+            spool.close()
+            raise
+
+async def ingest_screenshots(attachments: list) -> tuple[list, list]:
+    """Download (slot, attachment) pairs concurrently with per-attachment timeouts and a total size cap.
+
+    Returns the ingested screenshots in slot order and a list of human-readable errors
+    for the attachments that were skipped.
+    """
+    errors = []
+    accepted = []
+    total_size = 0
+    for slot, attachment in attachments:
+        if total_size + attachment.size > SCREENSHOT_TOTAL_SIZE_LIMIT:
+            errors.append(f"SS-{slot}: skipped, screenshots exceed the {SCREENSHOT_TOTAL_SIZE_LIMIT // (1024 * 1024)} MB total limit")
+            continue
+        total_size += attachment.size
+        accepted.append((slot, attachment))
+
+    if not accepted:
+        return [], errors
+
+    semaphore = asyncio.Semaphore(SCREENSHOT_DOWNLOAD_CONCURRENCY)
+    async with aiohttp.ClientSession() as session:
+        results = await asyncio.gather(
+            *(_download_screenshot(session, semaphore, slot, attachment) for slot, attachment in accepted),
+            return_exceptions=True
+        )
+
+    ingested = []
+    for (slot, attachment), result in zip(accepted, results):
+        if isinstance(result, IngestedScreenshot):
+            ingested.append(result)
+        elif isinstance(result, TimeoutError):
+            errors.append(f"SS-{slot}: download timed out after {SCREENSHOT_DOWNLOAD_TIMEOUT:.0f}s")
+            log.warning("Timed out downloading screenshot %s (%s)", slot, attachment.filename)
+        else:
+            errors.append(f"SS-{slot}: download failed")
+            log.error("Error processing screenshot %s: %s", slot, result)
+    return ingested, errors
+
+# ===========================================================================================
+# RESULT FAN-OUT
+# ===========================================================================================
+
+class SharedBufferReader(io.RawIOBase):
+    """Seekable read-only file over a shared memoryview.
+
+    Each upload gets its own reader (and file position) over the same buffer, so
+    posting a screenshot to several channels never duplicates its bytes.
+    """
+
+    def __init__(self, view: memoryview):
+        super().__init__()
+        self._view = view
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._pos = max(0, min(offset, len(self._view)))
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        end = len(self._view) if size is None or size < 0 else min(self._pos + size, len(self._view))
+        chunk = self._view[self._pos:end].tobytes()
+        self._pos = end
+        return chunk
+
+    def readinto(self, buffer) -> int:
+        count = min(len(buffer), len(self._view) - self._pos)
+        buffer[:count] = self._view[self._pos:self._pos + count]
+        self._pos += count
+        return count
+
+class FanOutTarget:
+    """One channel a result is posted to"""
+
+    def __init__(self, label: str, channel: discord.abc.Messageable, role: str, payloads: list = None, priority: int = PRIORITY_INTERACTIVE, **send_kwargs):
+        self.label = label
+        self.channel = channel
+        self.role = role              # Message registry role for the posted message
+        self.payloads = payloads or []  # (filename, memoryview) pairs to attach
+        self.priority = priority      # Outbound queue priority
+        self.send_kwargs = send_kwargs
+
+class FanOutReport:
+    """Outcome of posting to one fan-out target"""
+
+    def __init__(self, target: FanOutTarget, message: Optional[discord.Message], error: Optional[Exception], elapsed: float):
+        self.target = target
+        self.message = message
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+async def _send_fan_out_target(target: FanOutTarget) -> FanOutReport:
+    started = perf_counter()
+
+    async def post():
+        # Files are built when the queue runs the job, so each post reads its buffers from the start
+        files = [discord.File(SharedBufferReader(view), filename=filename) for filename, view in target.payloads]
+        if files:
+            return await target.channel.send(files=files, **target.send_kwargs)
+        return await target.channel.send(**target.send_kwargs)
+
+    try:
+        message = await outbound_queue.submit(('send', target.channel.id), target.priority, post)
+        return FanOutReport(target, message, None, perf_counter() - started)
+    except Exception as e:
+        log.error("Could not post result in %s: %s", target.label, e)
+        return FanOutReport(target, None, e, perf_counter() - started)
+
+async def fan_out_result(targets: list) -> list:
+    """Post to all targets concurrently; returns one FanOutReport per target, in order"""
+    return list(await asyncio.gather(*(_send_fan_out_target(target) for target in targets)))
+
+def format_fan_out_report(reports: list) -> str:
+    """Summarize which channels received the result and how long each post took"""
+    lines = []
+    for report in reports:
+        if report.ok:
+            lines.append(f"✅ {report.target.label}: posted in {report.elapsed * 1000:.0f} ms")
+        else:
+            lines.append(f"❌ {report.target.label}: failed after {report.elapsed * 1000:.0f} ms ({report.error})")
+    return "\n".join(lines)
+
+# ===========================================================================================
+# RESULT IMAGE STAGE (recompression and contact sheet)
+# ===========================================================================================
+
+# Set RESULT_IMAGE_STAGE=off to post the original screenshots everywhere
+RESULT_IMAGE_STAGE = os.getenv("RESULT_IMAGE_STAGE", "on").lower() not in ("0", "off", "false", "no")
+RESULT_IMAGE_MAX_SIZE = int(os.getenv("RESULT_IMAGE_MAX_SIZE", "1600"))  # Longest side in pixels
+RESULT_IMAGE_QUALITY = int(os.getenv("RESULT_IMAGE_QUALITY", "80"))     # JPEG quality
+CONTACT_SHEET_TILE_WIDTH = 480
+CONTACT_SHEET_TILE_HEIGHT = 270
+CONTACT_SHEET_FILENAME = "contact_sheet.jpg"
+
+# Worker pool for image work; Pillow releases the GIL while decoding, resizing and encoding,
+# so threads keep the event loop free without copying screenshots into other processes
+image_executor = concurrent.futures.ThreadPoolExecutor(max_workers=int(os.getenv("IMAGE_WORKERS", "2")), thread_name_prefix="image")
+
+def recompress_screenshot(view: memoryview, max_size: int, quality: int) -> Optional[bytes]:
+    """Downsize and re-encode a screenshot as JPEG; returns None if that wouldn't make it smaller"""
+    with Image.open(SharedBufferReader(view)) as img:
+        img.draft("RGB", (max_size, max_size))  # Let the JPEG decoder downscale early when possible
+        img = img.convert("RGB")
+        img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+        output = io.BytesIO()
+        img.save(output, "JPEG", quality=quality, optimize=True, progressive=True)
+    data = output.getvalue()
+    return data if len(data) < len(view) else None
+
+def build_contact_sheet(images: list, quality: int) -> bytes:
+    """Tile (label, buffer) screenshots into one labelled JPEG grid"""
+    columns = math.ceil(math.sqrt(len(images)))
+    rows = math.ceil(len(images) / columns)
+    sheet = Image.new("RGB", (columns * CONTACT_SHEET_TILE_WIDTH, rows * CONTACT_SHEET_TILE_HEIGHT), (24, 24, 24))
+    draw = ImageDraw.Draw(sheet)
+    font = ImageFont.load_default()
+
+    for position, (label, view) in enumerate(images):
+        left = (position % columns) * CONTACT_SHEET_TILE_WIDTH
+        top = (position // columns) * CONTACT_SHEET_TILE_HEIGHT
+        try:
+            with Image.open(SharedBufferReader(view)) as img:
+                img.draft("RGB", (CONTACT_SHEET_TILE_WIDTH, CONTACT_SHEET_TILE_HEIGHT))
+                tile = img.convert("RGB")
+                tile.thumbnail((CONTACT_SHEET_TILE_WIDTH - 4, CONTACT_SHEET_TILE_HEIGHT - 4), Image.Resampling.LANCZOS)
+                sheet.paste(tile, (left + (CONTACT_SHEET_TILE_WIDTH - tile.width) // 2, top + (CONTACT_SHEET_TILE_HEIGHT - tile.height) // 2))
+        except Exception as e:
+            log.warning("Could not add %s to contact sheet: %s", label, e)
+        draw.rectangle((left + 4, top + 4, left + 60, top + 22), fill=(0, 0, 0))
+        draw.text((left + 8, top + 7), label, font=font, fill=(255, 255, 0))
+
+    output = io.BytesIO()
+    sheet.save(output, "JPEG", quality=quality, optimize=True)
+    return output.getvalue()
+
+async def process_result_screenshots(shots: list) -> tuple[list, Optional[tuple]]:
+    """Run recompression and the contact sheet in the image worker pool.
+
+    Returns (filename, buffer) payloads for the recompressed screenshots (originals where
+    recompression doesn't help) and the contact sheet payload, or None if it failed.
+    """
+    loop = asyncio.get_running_loop()
+    compress_jobs = [
+        loop.run_in_executor(image_executor, recompress_screenshot, shot.buffer(), RESULT_IMAGE_MAX_SIZE, RESULT_IMAGE_QUALITY)
+        for shot in shots
+    ]
+    sheet_job = loop.run_in_executor(
+        image_executor, build_contact_sheet, [(f"SS-{shot.slot}", shot.buffer()) for shot in shots], RESULT_IMAGE_QUALITY
+    )
+    results = await asyncio.gather(*compress_jobs, sheet_job, return_exceptions=True)
+
+    compressed = []
+    for shot, result in zip(shots, results[:-1]):
+        if isinstance(result, bytes):
+            compressed.append((f"{os.path.splitext(shot.upload_name)[0]}.jpg", memoryview(result)))
+        else:
+            if isinstance(result, Exception):
+                log.warning("Could not recompress screenshot %s: %s", shot.slot, result)
+            compressed.append((shot.upload_name, shot.buffer()))
+
+    sheet = results[-1]
+    if isinstance(sheet, Exception):
+        log.warning("Could not build contact sheet: %s", sheet)
+        return compressed, None
+    return compressed, (CONTACT_SHEET_FILENAME, memoryview(sheet))
+
+# ===========================================================================================
+# SCREENSHOT ARCHIVE (content-addressed, with perceptual-hash duplicate detection)
+# ===========================================================================================
+
+SCREENSHOT_ARCHIVE_DIR = Path(os.getenv("SCREENSHOT_ARCHIVE_DIR", "screenshot_archive"))
+SCREENSHOT_ARCHIVE_INDEX = SCREENSHOT_ARCHIVE_DIR / "index.json"
+# Maximum Hamming distance between 64-bit perceptual hashes to count as a near-duplicate
+PHASH_DUPLICATE_DISTANCE = int(os.getenv("PHASH_DUPLICATE_DISTANCE", "6"))
+
+# {sha256: {'phash': hex, 'path': str, 'size': int, 'submissions': [...]}}
+screenshot_archive = {}
+
+class BKTree:
+    """Burkhard-Keller tree over perceptual hashes using Hamming distance.
+
+    Nodes are [hash, items, {distance: child}]; a radius search only descends into
+    children whose edge distance can still be within range, so lookups stay close to
+    O(log n) for small radii.
+    """
+
+    def __init__(self):
+        self.root = None
+        self.size = 0
+
+    def clear(self):
+        self.root = None
+        self.size = 0
+
+    @staticmethod
+    def distance(a: int, b: int) -> int:
+        return (a ^ b).bit_count()
+
+    def add(self, phash: int, item):
+        self.size += 1
+        if self.root is None:
+            self.root = [phash, [item], {}]
+            return
+        node = self.root
+        while True:
+            distance = self.distance(phash, node[0])
+            if distance == 0:
+                node[1].append(item)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [phash, [item], {}]
+                return
+            node = child
+
+    def search(self, phash: int, max_distance: int) -> list:
+        """Return (distance, item) pairs within max_distance of phash"""
+        matches = []
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            distance = self.distance(phash, node[0])
+            if distance <= max_distance:
+                matches.extend((distance, item) for item in node[1])
+            for edge, child in node[2].items():
+                if distance - max_distance <= edge <= distance + max_distance:
+                    stack.append(child)
+        return matches
+
+screenshot_phash_tree = BKTree()
+
+def load_screenshot_archive():
+    """Load the archive index and rebuild the perceptual-hash tree"""
+    screenshot_archive.clear()
+    try:
+        if SCREENSHOT_ARCHIVE_INDEX.exists():
+            with open(SCREENSHOT_ARCHIVE_INDEX, 'r', encoding='utf-8') as f:
+                screenshot_archive.update(json.load(f))
+    except Exception as e:
+        log.error("Error loading screenshot archive index: %s", e)
+        screenshot_archive.clear()
+
+    screenshot_phash_tree.clear()
+    for sha, entry in screenshot_archive.items():
+        screenshot_phash_tree.add(int(entry['phash'], 16), sha)
+    log.info("Loaded %s archived screenshot(s)", len(screenshot_archive))
+
+def save_screenshot_archive():
+    """Persist the archive index"""
+    try:
+        SCREENSHOT_ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
+        temp_path = SCREENSHOT_ARCHIVE_INDEX.with_suffix(".tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(screenshot_archive, f, indent=2)
+        os.replace(temp_path, SCREENSHOT_ARCHIVE_INDEX)
+    except Exception as e:
+        log.error("Error saving screenshot archive index: %s", e)
+
+def perceptual_hash(view: memoryview) -> int:
+    """64-bit difference hash: compares neighbouring pixels of a 9x8 grayscale thumbnail"""
+    with Image.open(SharedBufferReader(view)) as img:
+        img.draft("L", (64, 64))
+        pixels = img.convert("L").resize((9, 8), Image.Resampling.LANCZOS).tobytes()
+    bits = 0
+    for row in range(8):
+        for col in range(8):
+            bits = (bits << 1) | (pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+    return bits
+
+def store_screenshot(view: memoryview, filename: str) -> tuple[str, int, str]:
+    """Write a screenshot to the archive under its SHA-256 (once) and return (sha, phash, path)"""
+    sha = hashlib.sha256(view).hexdigest()
+    existing = screenshot_archive.get(sha)
+    if existing:
+        return sha, int(existing['phash'], 16), existing['path']
+
+    phash = perceptual_hash(view)
+    extension = os.path.splitext(filename)[1].lower() or ".bin"
+    path = SCREENSHOT_ARCHIVE_DIR / sha[:2] / f"{sha}{extension}"
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as f:
+            f.write(view)
+        os.replace(f.name, path)
+    return sha, phash, str(path)
+
+async def archive_result_screenshots(shots: list, submission: dict) -> list:
+    """Archive screenshots and flag ones that duplicate earlier submissions of other matches.
+
+    `submission` describes this result (channel_id, winner_id, loser_id, judge_id). Returns
+    human-readable warnings for exact or near-duplicate screenshots.
+    """
+    loop = asyncio.get_running_loop()
+    stored = await asyncio.gather(
+        *(loop.run_in_executor(image_executor, store_screenshot, shot.buffer(), shot.filename) for shot in shots),
+        return_exceptions=True
+    )
+
+    match_key = (submission.get('channel_id'), frozenset((submission.get('winner_id'), submission.get('loser_id'))))
+    warnings = []
+    for shot, result in zip(shots, stored):
+        if isinstance(result, Exception):
+            log.warning("Could not archive screenshot %s: %s", shot.slot, result)
+            continue
+        sha, phash, path = result
+
+        # Look for earlier submissions from other matches with the same or a similar image
+        reused_from = None
+        for distance, other_sha in sorted(screenshot_phash_tree.search(phash, PHASH_DUPLICATE_DISTANCE)):
+            for earlier in screenshot_archive.get(other_sha, {}).get('submissions', []):
+                earlier_key = (earlier.get('channel_id'), frozenset((earlier.get('winner_id'), earlier.get('loser_id'))))
+                if earlier_key != match_key:
+                    reused_from = (distance, earlier)
+                    break
+            if reused_from:
+                break
+        if reused_from:
+            distance, earlier = reused_from
+            kind = "visually identical to" if distance == 0 else f"similar (distance {distance}) to"
+            warnings.append(f"SS-{shot.slot} is {kind} a screenshot submitted <t:{int(earlier['submitted_at'])}:R> in <#{earlier.get('channel_id')}>")
+
+        entry = screenshot_archive.get(sha)
+        if entry is None:
+            entry = screenshot_archive[sha] = {'phash': f"{phash:016x}", 'path': path, 'size': shot.size, 'submissions': []}
+            screenshot_phash_tree.add(phash, sha)
+        entry['submissions'].append({**submission, 'slot': shot.slot, 'submitted_at': datetime.datetime.utcnow().timestamp()})
+
+    save_screenshot_archive()
+    return warnings
@@ -0,0 +1,58 @@
+"""Startup timing and lazy imports; imported first so its clock starts with the process"""
+from time import perf_counter
+_module_started = perf_counter()
+
+import os
+import importlib.util
+import sys
+
+def lazy_import(name: str):
+    """Return a module whose code only runs on first attribute access.
+
+    Keeps the poster, font and HTTP stacks off the cold-start path. Modules that are
+    already loaded (e.g. pulled in by discord.py) are returned as-is. LazyLoader is not
+    thread-safe, so only use this for modules first touched from the event loop.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+# ===========================================================================================
+# STARTUP TIMING
+# ===========================================================================================
+
+def _process_age() -> float:
+    """Seconds since the OS started this process (0 where /proc is unavailable)"""
+    try:
+        with open('/proc/self/stat', 'r') as f:
+            started_ticks = int(f.read().rsplit(')', 1)[1].split()[19])
+        with open('/proc/uptime', 'r') as f:
+            uptime = float(f.read().split()[0])
+        return max(uptime - started_ticks / os.sysconf('SC_CLK_TCK'), 0.0)
+    except Exception:
+        return 0.0
+
+# perf_counter() value at process start, so every mark is measured from the same origin
+_process_started = perf_counter() - _process_age()
+
+# [(label, seconds since process start)] recorded once on the way to the first READY
+startup_marks = [("interpreter ready", _module_started - _process_started)]
+
+def record_startup_mark(label: str):
+    if not any(existing == label for existing, _ in startup_marks):
+        startup_marks.append((label, perf_counter() - _process_started))
+
+def format_startup_marks() -> str:
+    """Each startup phase with its own duration and the running total"""
+    parts = []
+    previous = 0.0
+    for label, elapsed in startup_marks:
+        parts.append(f"{label} +{elapsed - previous:.2f}s ({elapsed:.2f}s)")
+        previous = elapsed
+    return " • ".join(parts)
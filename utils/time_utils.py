@@ -0,0 +1,60 @@
+"""Time handling utilities"""
+import datetime
+
+from utils.startup import lazy_import
+
+pytz = lazy_import("pytz")
+
+def calculate_time_difference(event_datetime: datetime.datetime, user_timezone: str = None) -> dict:
+    """Calculate time difference and format for different timezones"""
+    current_time = datetime.datetime.now()
+    time_diff = event_datetime - current_time
+    minutes_remaining = int(time_diff.total_seconds() / 60)
+    
+    # Format UTC time exactly as requested
+    utc_time_str = event_datetime.strftime("%H:%M utc, %d/%m")
+    
+    # Try to detect user's local timezone
+    local_timezone = None
+    if user_timezone:
+        try:
+            local_timezone = pytz.timezone(user_timezone)
+        except:
+            pass
+    
+    # If no user timezone provided, try to detect from system
+    if not local_timezone:
+        try:
+            # Try to get system timezone
+            import time
+            local_timezone = pytz.timezone(time.tzname[time.daylight])
+        except:
+            # Fallback to IST if detection fails
+            local_timezone = pytz.timezone('Asia/Kolkata')
+    
+    # Calculate user's local time
+    local_time = event_datetime.replace(tzinfo=pytz.UTC).astimezone(local_timezone)
+    local_time_formatted = local_time.strftime("%A, %d %B, %Y %H:%M")
+    
+    # Calculate other common timezones
+    ist_tz = pytz.timezone('Asia/Kolkata')
+    ist_time = event_datetime.replace(tzinfo=pytz.UTC).astimezone(ist_tz)
+    ist_formatted = ist_time.strftime("%A, %d %B, %Y %H:%M")
+    
+    est_tz = pytz.timezone('America/New_York')
+    est_time = event_datetime.replace(tzinfo=pytz.UTC).astimezone(est_tz)
+    est_formatted = est_time.strftime("%A, %d %B, %Y %H:%M")
+    
+    gmt_tz = pytz.timezone('Europe/London')
+    gmt_time = event_datetime.replace(tzinfo=pytz.UTC).astimezone(gmt_tz)
+    gmt_formatted = gmt_time.strftime("%A, %d %B, %Y %H:%M")
+    
+    return {
+        'minutes_remaining': minutes_remaining,
+        'utc_time': utc_time_str,
+        'utc_time_simple': event_datetime.strftime("%H:%M UTC"),
+        'local_time': local_time_formatted,
+        'ist_time': ist_formatted,
+        'est_time': est_formatted,
+        'gmt_time': gmt_formatted
+    }